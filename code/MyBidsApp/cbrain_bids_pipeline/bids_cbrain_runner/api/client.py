@@ -19,15 +19,61 @@ cbrain_put
     Perform a token-authenticated ``PUT`` request for resource updates.
 cbrain_delete
     Perform a token-authenticated ``DELETE`` request.
+close_session
+    Release the pooled connections shared by the helpers above.
+
+All helpers share one :class:`requests.Session`, so consecutive calls to the
+same portal (e.g. paginated listings) reuse an open TCP/TLS connection.
 """
 
 import os
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Dict, Optional, Union
 
 import requests
 
 DEFAULT_TIMEOUT = 60.0
 
+# Connection-pool sizing for the shared session: a handful of hosts at most
+# (usually one portal), with room for the concurrent callers in the package.
+_POOL_CONNECTIONS = 8
+_POOL_MAXSIZE = 16
+
+_SESSION: Optional["requests.Session"] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> "requests.Session":
+    """Return the shared HTTP session, creating it on first use."""
+    global _SESSION
+    session = _SESSION
+    if session is None:
+        with _SESSION_LOCK:
+            session = _SESSION
+            if session is None:
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _SESSION = session
+    return session
+
+
+def close_session() -> None:
+    """Close the shared HTTP session and drop its pooled connections.
+
+    A new session is created transparently by the next request.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        session, _SESSION = _SESSION, None
+    if session is not None:
+        session.close()
+
 
 def _default_timeout() -> Optional[float]:
     """Return timeout configured via ``CBRAIN_TIMEOUT``.
@@ -78,7 +124,7 @@ def cbrain_get(
     if timeout is None:
         timeout = _default_timeout()
 
-    return requests.get(url, headers=headers, params=params, timeout=timeout)
+    return _get_session().get(url, headers=headers, params=params, timeout=timeout)
 
 
 def cbrain_post(
@@ -119,7 +165,7 @@ def cbrain_post(
     if timeout is None:
         timeout = _default_timeout()
 
-    return requests.post(
+    return _get_session().post(
         url,
         headers=headers,
         params=params,
@@ -159,7 +205,7 @@ def cbrain_put(
     if timeout is None:
         timeout = _default_timeout()
 
-    return requests.put(
+    return _get_session().put(
         url,
         headers=headers,
         params=params,
@@ -174,7 +220,7 @@ def cbrain_delete(
     endpoint: str,
     token: str,
     *,
-    data: Optional[Dict[str, Any]] = None,
+    data: Optional[Union[Dict[str, Any], bytes]] = None,
     json: Optional[Dict[str, Any]] = None,
     timeout: Optional[float] = None,
     allow_redirects: bool = True,
@@ -185,7 +231,9 @@ def cbrain_delete(
         base_url: Root URL of the CBRAIN portal.
         endpoint: Endpoint relative to ``base_url``.
         token: ``cbrain_api_token`` string.
-        data: Optional form-encoded payload.
+        data: Optional form-encoded payload, or an already-encoded JSON
+            document as ``bytes`` (sent with ``Content-Type:
+            application/json``).
         json: Optional JSON payload.
         timeout: Request timeout in seconds.
         allow_redirects: Whether ``requests`` should automatically follow
@@ -197,11 +245,13 @@ def cbrain_delete(
     params = {"cbrain_api_token": token}
     headers = {"Accept": "application/json"}
     url = f"{base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+    if isinstance(data, bytes):
+        headers["Content-Type"] = "application/json"
 
     if timeout is None:
         timeout = _default_timeout()
 
-    return requests.delete(
+    return _get_session().delete(
         url,
         headers=headers,
         params=params,
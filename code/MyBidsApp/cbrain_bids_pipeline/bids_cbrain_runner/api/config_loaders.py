@@ -9,8 +9,11 @@ control CBRAIN-BIDS pipelines.  Three independent domains are covered:
 3. **Pipeline defaults and override files** – ``load_pipeline_config``
 
 Each loader returns plain ``dict`` objects so that calling code can remain
-framework-agnostic.  All YAML parsing uses :pymod:`yaml.safe_load` to
-eliminate the risk of executing arbitrary objects.
+framework-agnostic.  All YAML parsing goes through PyYAML's *safe* loader
+(the LibYAML-backed ``CSafeLoader`` when available) to eliminate the risk of
+executing arbitrary objects.  The optional pipeline-config snapshot is a
+pickle, so it is only ever read from the per-user cache directory this
+package wrote it to, never from the installed package.
 
 Functions follow a *fail-soft* philosophy: configuration files that are
 missing or malformed lead to **empty** dictionaries with informative log
@@ -24,14 +27,36 @@ Note:
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
-from typing import Any, Dict
+import pickle
+from typing import Any, Dict, Tuple
 
 import yaml
 
+try:  # LibYAML bindings are several times faster than the pure-Python ones
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without LibYAML
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
+
 logger = logging.getLogger(__name__)
 
+# Parsed config documents keyed by ``(path, st_mtime_ns, st_size)``.  Editing
+# a file changes its stat signature, so stale entries are never returned.
+_PARSED_CONFIG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+# Bundled configuration folder and the package defaults inside it; both are
+# fixed for the lifetime of the process.
+_PKG_CONFIG_DIR = os.path.join(os.path.dirname(__file__), "config")
+_DEFAULTS_PATH = os.path.join(_PKG_CONFIG_DIR, "defaults.yaml")
+
+# Errors that mean "no usable snapshot": missing, truncated or foreign file.
+_SNAPSHOT_ERRORS = (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError)
+
 # ────────────────────────────────────────────────────────────────────────────
 # 1) CBRAIN-specific configuration helpers
 # ────────────────────────────────────────────────────────────────────────────
@@ -55,7 +80,7 @@ def load_cbrain_config(config_dir: str | None = None) -> Dict[str, Any]:
     from .session import create_session  # local import avoids circular deps
 
     if config_dir is None:
-        config_dir = os.path.join(os.path.dirname(__file__), "config")
+        config_dir = _PKG_CONFIG_DIR
     cfg_path = os.path.join(config_dir, "cbrain.yaml")
 
     # --------------------------------------------------------------------- #
@@ -63,7 +88,7 @@ def load_cbrain_config(config_dir: str | None = None) -> Dict[str, Any]:
     # --------------------------------------------------------------------- #
     if os.path.exists(cfg_path):
         with open(cfg_path, "r", encoding="utf-8") as fh:
-            cfg: Dict[str, Any] = yaml.safe_load(fh) or {}
+            cfg: Dict[str, Any] = yaml.load(fh, Loader=_SafeLoader) or {}
     else:
         cfg = {}
 
@@ -104,7 +129,7 @@ def load_cbrain_config(config_dir: str | None = None) -> Dict[str, Any]:
             if os.getenv("CBRAIN_PERSIST"):
                 os.makedirs(config_dir, exist_ok=True)
                 with open(cfg_path, "w", encoding="utf-8") as stream:
-                    yaml.safe_dump(cfg, stream)
+                    yaml.dump(cfg, stream, Dumper=_SafeDumper)
         except Exception as exc:  # noqa: BLE001 – logging handled below
             logger.warning("CBRAIN auto-login failed: %s", exc)
 
@@ -124,7 +149,7 @@ def load_servers_config(config_dir: str | None = None) -> Dict[str, Any]:
         or unreadable.
     """
     if config_dir is None:
-        config_dir = os.path.join(os.path.dirname(__file__), "config")
+        config_dir = _PKG_CONFIG_DIR
 
     servers_path = os.path.join(config_dir, "servers.yaml")
     if not os.path.exists(servers_path):
@@ -132,7 +157,7 @@ def load_servers_config(config_dir: str | None = None) -> Dict[str, Any]:
         return {}
 
     with open(servers_path, "r", encoding="utf-8") as fh:
-        return yaml.safe_load(fh) or {}
+        return yaml.load(fh, Loader=_SafeLoader) or {}
 
 
 def get_sftp_provider_config(provider_name: str = "sftp_1") -> Dict[str, Any]:
@@ -195,7 +220,7 @@ def load_tools_config(config_dir: str | None = None) -> Dict[str, Any]:
         when the file is missing or malformed.
     """
     if config_dir is None:
-        config_dir = os.path.join(os.path.dirname(__file__), "config")
+        config_dir = _PKG_CONFIG_DIR
 
     tools_path = os.path.join(config_dir, "tools.yaml")
     if not os.path.exists(tools_path):
@@ -203,20 +228,33 @@ def load_tools_config(config_dir: str | None = None) -> Dict[str, Any]:
         return {}
 
     with open(tools_path, "r", encoding="utf-8") as fh:
-        full_yaml = yaml.safe_load(fh) or {}
+        full_yaml = yaml.load(fh, Loader=_SafeLoader) or {}
     return full_yaml.get("tools", {})
 
 # ────────────────────────────────────────────────────────────────────────────
 # 2) Pipeline-level configuration (defaults + user override)
 # ────────────────────────────────────────────────────────────────────────────
-def load_pipeline_config() -> Dict[str, Any]:
+def load_pipeline_config(*, use_cache: bool = False) -> Dict[str, Any]:
     """Return the deep-merged pipeline configuration.
 
     Merge strategy:
         * **Package defaults** – ``defaults.yaml`` bundled with the package
         * **User override**  – ``<BIDS_ROOT>/code/config/config.yaml``
         The override is *deep-merged* onto the defaults so that only modified
-        keys need to appear in the external file.
+        keys need to appear in the external file.  For either file a sibling
+        ``.json`` document (``defaults.json`` / ``config.json``) takes
+        precedence when present; it is parsed with the much faster stdlib
+        :mod:`json` module.
+
+    Args:
+        use_cache: When *True*, reuse a pickled snapshot of the merged result
+            from the per-user cache directory (see
+            :func:`_config_snapshot_path`).  The snapshot is only honoured
+            while the defaults and override files keep the same path,
+            modification time and size; otherwise the configuration is
+            rebuilt and the snapshot refreshed.  The snapshot is written by
+            this process with mode ``0600``, never read from the package
+            directory, and failures to read or write it are not fatal.
 
     Returns:
         Combined configuration dictionary.  When no BIDS root is detected or
@@ -224,16 +262,50 @@ def load_pipeline_config() -> Dict[str, Any]:
         resulting mapping always exposes ``roots["derivatives_root"]`` as well
         as a top-level ``derivatives_root`` entry for backward compatibility.
     """
+    default_path = _prefer_json_sibling(_DEFAULTS_PATH)
+
+    from bids_cbrain_runner.commands.bids_validator import find_bids_root_upwards
+
+    dataset_root = find_bids_root_upwards(os.getcwd())
+    override_path = (
+        _prefer_json_sibling(os.path.join(dataset_root, "code", "config", "config.yaml"))
+        if dataset_root
+        else None
+    )
+
+    if not use_cache:
+        return _build_pipeline_config(default_path, override_path)
+
+    stamp = (_file_signature(default_path), _file_signature(override_path))
+    snapshot_path = _config_snapshot_path(default_path, override_path)
+    snapshot = _read_config_snapshot(snapshot_path, stamp)
+    if snapshot is not None:
+        logger.debug("Loaded pipeline config snapshot from %s", snapshot_path)
+        return snapshot
+
+    merged = _build_pipeline_config(default_path, override_path)
+    _write_config_snapshot(snapshot_path, stamp, merged)
+    return merged
+
+
+def _build_pipeline_config(default_path: str, override_path: str | None) -> Dict[str, Any]:
+    """Merge *default_path* and *override_path* into one configuration dict.
+
+    Args:
+        default_path: Location of the package defaults.
+        override_path: Location of the project override, or *None* when no
+            BIDS root could be found.
+
+    Returns:
+        Merged configuration as described in :func:`load_pipeline_config`.
+    """
     merged: Dict[str, Any] = {}
 
     # ------------------------------------------------------------------ #
     # 1. load defaults from the installed package                        #
     # ------------------------------------------------------------------ #
-    here = os.path.dirname(__file__)  # points to …/api
-    default_path = os.path.join(here, "config", "defaults.yaml")
     try:
-        with open(default_path, "r", encoding="utf-8") as fh:
-            defaults: Dict[str, Any] = yaml.safe_load(fh) or {}
+        defaults: Dict[str, Any] = _load_config_cached(default_path)
         merged.update(defaults)
         logger.info("Loaded defaults from %s", default_path)
     except FileNotFoundError:
@@ -242,22 +314,16 @@ def load_pipeline_config() -> Dict[str, Any]:
         logger.error("Failed to parse defaults.yaml: %s", exc)
 
     # ------------------------------------------------------------------ #
-    # 2. discover BIDS root to locate external override                  #
+    # 2. apply the external override found under the BIDS root          #
     # ------------------------------------------------------------------ #
-    from bids_cbrain_runner.commands.bids_validator import find_bids_root_upwards
-
-    dataset_root = find_bids_root_upwards(os.getcwd())
-    if not dataset_root:
+    if override_path is None:
         logger.error("Could not locate BIDS root (dataset_description.json).")
         return merged
 
-    # External config path under project tree
-    override_path = os.path.join(dataset_root, "code", "config", "config.yaml")
     if os.path.exists(override_path):
         logger.info("Applying external override from %s", override_path)
         try:
-            with open(override_path, "r", encoding="utf-8") as fh:
-                user_cfg: Dict[str, Any] = yaml.safe_load(fh) or {}
+            user_cfg: Dict[str, Any] = _load_config_cached(override_path)
             _deep_update(merged, user_cfg)
         except Exception as exc:  # noqa: BLE001
             logger.error("Failed to merge override %s: %s", override_path, exc)
@@ -281,6 +347,110 @@ def load_pipeline_config() -> Dict[str, Any]:
 # ────────────────────────────────────────────────────────────────────────────
 # 3) Private helpers
 # ────────────────────────────────────────────────────────────────────────────
+def _prefer_json_sibling(path: str) -> str:
+    """Return the ``.json`` sibling of *path* when it exists, else *path*."""
+    json_path = os.path.splitext(path)[0] + ".json"
+    return json_path if os.path.exists(json_path) else path
+
+
+def _load_config_cached(path: str) -> Dict[str, Any]:
+    """Return the parsed contents of the configuration file at *path*.
+
+    Files ending in ``.json`` are parsed with :mod:`json`; everything else is
+    treated as YAML.  Parsed documents are memoised per process and keyed on
+    the file's path, modification time and size, so repeated loads of an
+    unchanged file skip parsing entirely.  Callers receive a private copy and
+    may mutate it freely.
+
+    Args:
+        path: Location of the configuration file.
+
+    Returns:
+        Parsed mapping, or an empty dict for an empty document.
+
+    Raises:
+        FileNotFoundError: When *path* does not exist.
+        ValueError: When a JSON file cannot be parsed.
+        yaml.YAMLError: When a YAML file cannot be parsed.
+    """
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    cached = _PARSED_CONFIG_CACHE.get(key)
+    if cached is None:
+        with open(path, "r", encoding="utf-8") as fh:
+            if path.endswith(".json"):
+                cached = json.load(fh) or {}
+            else:
+                cached = yaml.load(fh, Loader=_SafeLoader) or {}
+        _PARSED_CONFIG_CACHE[key] = cached
+    return _copy_tree(cached)
+
+
+def _copy_tree(obj: Any) -> Any:
+    """Copy the dicts and lists of a parsed config document.
+
+    Parsed YAML/JSON only nests dicts and lists around scalars, so this
+    gives callers the same independence as :func:`copy.deepcopy` without
+    its memo bookkeeping and per-object reduce protocol.
+    """
+    if isinstance(obj, dict):
+        return {k: _copy_tree(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_copy_tree(v) for v in obj]
+    return obj
+
+
+def _file_signature(path: str | None) -> Tuple[str | None, int | None, int | None]:
+    """Return ``(path, st_mtime_ns, st_size)`` or *None* fields when missing."""
+    if path is None:
+        return (None, None, None)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return (path, None, None)
+    return (path, st.st_mtime_ns, st.st_size)
+
+
+def _config_snapshot_path(default_path: str, override_path: str | None) -> str:
+    """Return the snapshot file for this defaults/override pair.
+
+    Snapshots live under ``$XDG_CACHE_HOME/bids_cbrain_runner`` (default
+    ``~/.cache``); each dataset override gets its own file.
+    """
+    cache_root = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    key = hashlib.sha1(f"{default_path}\0{override_path}".encode("utf-8")).hexdigest()
+    return os.path.join(cache_root, "bids_cbrain_runner", f"pipeline-{key}.pkl")
+
+
+def _read_config_snapshot(path: str, stamp: Tuple[Any, ...]) -> Dict[str, Any] | None:
+    """Return the pickled config at *path* when its stored stamp equals *stamp*."""
+    try:
+        with open(path, "rb") as fh:
+            stored_stamp, cfg = pickle.load(fh)
+    except _SNAPSHOT_ERRORS:
+        return None
+    return cfg if stored_stamp == stamp else None
+
+
+def _write_config_snapshot(path: str, stamp: Tuple[Any, ...], cfg: Dict[str, Any]) -> None:
+    """Atomically store *cfg* together with *stamp* at *path*."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump((stamp, cfg), fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        logger.debug("Could not write config snapshot %s: %s", path, exc)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
 def _deep_update(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
     """Recursively merge *override* into *base*.
 
@@ -24,7 +24,7 @@ import argparse
 import logging
 import os
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 import requests
 import yaml
@@ -63,7 +63,7 @@ from .commands.groups import (
     list_groups,
     resolve_group_id,
 )
-from .commands.sftp import sftp_cd_steps, sftp_cd_steps_with_group
+from .commands.sftp import sftp_cd_steps, sftp_cd_steps_with_group, sftp_session
 from .commands.tool_launcher import (
     launch_tool,
     launch_tool_batch_for_group,
@@ -106,7 +106,7 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------
 # Public functions
 # ---------------------------------------------------------------------
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
     """Entry point for the ``cbrain-cli`` command.
 
     Also exposed as ``bids-cbrain-cli``.
@@ -127,7 +127,8 @@ def main() -> None:
     4. **Download / upload helpers** – Synchronise derivative outputs.
 
     Args:
-        None – arguments are read from :pydata:`sys.argv`.
+        argv: Optional argument list excluding the program name.  When
+            ``None`` the arguments are read from :pydata:`sys.argv`.
 
     Returns:
         None.  The function exits the process with ``sys.exit`` on fatal
@@ -451,7 +452,11 @@ def main() -> None:
     upload_grp.add_argument(
         "--upload-bids-and-sftp-files",
         nargs="*",
-        help="Validate BIDS, compare local vs. remote, " "upload missing files to SFTP.",
+        action="append",
+        help=(
+            "Validate BIDS, compare local vs. remote, upload missing files to SFTP. "
+            "Repeat to upload several sub-trees over a single SFTP connection."
+        ),
     )
     upload_grp.add_argument(
         "--upload-register",
@@ -817,7 +822,7 @@ def main() -> None:
     dl.set_defaults(func=download_tool_outputs)
 
     # Parse command-line arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     alias_specs = [parse_alias_tokens(t) for t in (args.alias or [])]
 
     # Backwards compatibility for deprecated --delete-group-filetype
@@ -1178,8 +1183,10 @@ def main() -> None:
         )
 
     # Upload helper
-    if args.upload_bids_and_sftp_files:
-        upload_steps = [s.strip() for s in args.upload_bids_and_sftp_files]
+    upload_batches = [
+        [s.strip() for s in steps] for steps in args.upload_bids_and_sftp_files or [] if steps
+    ]
+    if upload_batches:
         gid = resolve_group_id(
             base_url,
             token,
@@ -1190,11 +1197,7 @@ def main() -> None:
         if gid is None and args.upload_group_id is not None:
             print(f"Group '{args.upload_group_id}' not found")
             sys.exit(1)
-        upload_bids_and_sftp_files(
-            cfg,
-            base_url,
-            token,
-            upload_steps,
+        upload_kwargs: Dict[str, Any] = dict(
             do_register=args.upload_register,
             dp_id=args.upload_dp_id,
             filetypes=args.upload_filetypes,
@@ -1206,6 +1209,15 @@ def main() -> None:
             path_map=dict(args.upload_path_map) if args.upload_path_map else None,
             rewrite_absolute_paths=args.upload_normalize_paths,
         )
+        if len(upload_batches) == 1:
+            upload_bids_and_sftp_files(cfg, base_url, token, upload_batches[0], **upload_kwargs)
+        else:
+            # Several sub-trees: share one SSH handshake across all of them.
+            with sftp_session(cfg) as session:
+                for upload_steps in upload_batches:
+                    upload_bids_and_sftp_files(
+                        cfg, base_url, token, upload_steps, session=session, **upload_kwargs
+                    )
 
     # Tool metadata operations
     if args.list_tool_configs:
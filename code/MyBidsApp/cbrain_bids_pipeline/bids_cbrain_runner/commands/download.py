@@ -207,7 +207,7 @@ def download_tool_outputs(
     if not bids_root:
         raise FileNotFoundError("Could not locate dataset_description.json.")
 
-    pipeline_cfg = load_pipeline_config()
+    pipeline_cfg = load_pipeline_config(use_cache=True)
     local_name = output_dir_name or output_type or tool_name
     outdir = resolve_output_dir(
         bids_root=bids_root,
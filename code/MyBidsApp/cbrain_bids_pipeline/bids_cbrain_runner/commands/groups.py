@@ -158,27 +158,26 @@ def create_group(
 
     client = CbrainClient(base_url, token)
 
-    # Check every page of /groups to ensure no project with the same name
-    page = 1
-    while True:
-        try:
-            existing = client.list_groups(
-                page=page, per_page=per_page, timeout=timeout
-            )
-        except ApiException as exc:
-            logger.error("Could not fetch groups: %s", exc)
-            return None
-        for grp in existing:
-            if getattr(grp, "name", None) == name:
-                logger.error(
-                    "Group '%s' already exists with ID %s",
-                    name,
-                    getattr(grp, "id", "?"),
-                )
-                return None
-        if len(existing) < per_page:
-            break
-        page += 1
+    # Walk /groups lazily; stop requesting pages at the first name clash
+    try:
+        existing = next(
+            (
+                grp
+                for grp in client.list_groups_iter(per_page=per_page, timeout=timeout)
+                if getattr(grp, "name", None) == name
+            ),
+            None,
+        )
+    except ApiException as exc:
+        logger.error("Could not fetch groups: %s", exc)
+        return None
+    if existing is not None:
+        logger.error(
+            "Group '%s' already exists with ID %s",
+            name,
+            getattr(existing, "id", "?"),
+        )
+        return None
 
     try:
         created = client.create_group(name, description=description, timeout=timeout)
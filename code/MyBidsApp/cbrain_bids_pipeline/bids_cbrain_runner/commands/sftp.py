@@ -21,21 +21,100 @@ from __future__ import annotations
 import fnmatch
 import logging
 import os
+import stat
+from contextlib import contextmanager
+from queue import SimpleQueue
 from typing import Dict, List, Sequence, Tuple
 
 import paramiko
 
 from ..utils.bids_style import to_bids_style
 from ..utils.output import print_jsonlike_dict
+from ..utils.paths import join_remote
 from .userfiles import list_userfiles_by_group
 from ..api.client_openapi import CbrainClient
 
 logger = logging.getLogger(__name__)
 
 # -----------------------------------------------------------------------------
-# Core connection helpers
+# SFTP session helpers
 # -----------------------------------------------------------------------------
 
+# SSH channel window for SFTP sessions.  Paramiko already pipelines GET
+# (prefetch) and PUT requests, but throughput is capped at one window per
+# round trip; 16 MiB keeps a high-latency link busy where the 2 MiB default
+# would stall.
+_SFTP_WINDOW_SIZE = 16 * 1024 * 1024
+
+
+def open_sftp_session(transport) -> paramiko.SFTPClient:
+    """Open an SFTP session on *transport* with an enlarged channel window."""
+    return paramiko.SFTPClient.from_transport(
+        transport, window_size=_SFTP_WINDOW_SIZE
+    )
+
+
+def _open_extra_sftp_clients(sftp, count: int) -> list:
+    """Open up to *count* additional SFTP sessions on *sftp*'s transport.
+
+    Each session runs on its own SSH channel, so concurrent transfers never
+    share a Paramiko client.  Objects without an accessible transport, or
+    channel refusals from the server, simply yield fewer sessions.
+    """
+    extras: list = []
+    if count <= 0:
+        return extras
+    try:
+        transport = sftp.get_channel().get_transport()
+    except Exception:  # noqa: BLE001 – not a Paramiko client
+        return extras
+    for _ in range(count):
+        try:
+            extras.append(open_sftp_session(transport))
+        except Exception as exc:  # noqa: BLE001 – server channel limits
+            logger.debug("Could not open extra SFTP channel: %s", exc)
+            break
+    return extras
+
+
+class SFTPClientPool:
+    """Bounded pool of SFTP sessions checked out by transfer workers.
+
+    The pool holds up to *size* sessions: *sftp* plus extras opened on its
+    transport (see :func:`_open_extra_sftp_clients`), so the pool never starts
+    another SSH handshake.  Paramiko clients are not thread-safe, so each
+    session sits in exactly one slot; when the server refuses extra channels
+    the pool simply has fewer slots (see :attr:`sessions`) and
+    :meth:`acquire` blocks until one is free.
+    """
+
+    def __init__(self, sftp, size: int) -> None:
+        self._extras = _open_extra_sftp_clients(sftp, size - 1)
+        self._clients: SimpleQueue = SimpleQueue()
+        self._clients.put(sftp)
+        for client in self._extras:
+            self._clients.put(client)
+
+    @contextmanager
+    def acquire(self):
+        """Check out a client for the duration of the ``with`` block."""
+        client = self._clients.get()
+        try:
+            yield client
+        finally:
+            self._clients.put(client)
+
+    @property
+    def sessions(self) -> int:
+        """Number of slots, i.e. distinct SFTP sessions, in the pool."""
+        return len(self._extras) + 1
+
+    def close(self) -> None:
+        """Close the extra sessions; the caller's client is left open."""
+        for client in self._extras:
+            client.close()
+
+
 # -----------------------------------------------------------------------------
 # Core connection helpers
 # -----------------------------------------------------------------------------
@@ -115,24 +194,51 @@ def sftp_connect_from_config(cfg: Dict[str, str]):
         )
         return None, None
 
-    sftp_client = ssh_client.open_sftp()
+    sftp_client = open_sftp_session(ssh_client.get_transport())
     logger.debug("[SFTP] Connection established, SFTP client opened.")
     return ssh_client, sftp_client
 
 
+@contextmanager
+def sftp_session(cfg: Dict[str, str]):
+    """Context manager around :pyfunc:`sftp_connect_from_config`.
+
+    Yields the ``(ssh_client, sftp_client)`` pair and closes both on exit, so
+    a batch of operations (e.g. several calls to
+    :pyfunc:`bids_cbrain_runner.commands.upload.upload_bids_and_sftp_files`
+    passed ``session=...``) shares one SSH handshake.  As with the underlying
+    helper, both elements are ``None`` when the connection failed.
+    """
+    ssh_client, sftp_client = sftp_connect_from_config(cfg)
+    try:
+        yield ssh_client, sftp_client
+    finally:
+        if sftp_client is not None:
+            sftp_client.close()
+        if ssh_client is not None:
+            ssh_client.close()
+
 
 # -----------------------------------------------------------------------------
 # Directory listing utilities
 # -----------------------------------------------------------------------------
 
+# Number of pipelined READDIR requests issued by ``listdir_iter``.
+_READDIR_AHEAD = 50
+
+
 def list_subdirs_and_files(
     sftp_client: paramiko.SFTPClient,
     directory: str,
 ) -> Tuple[List[str], List[str]]:
     """Return immediate sub‑directories and files under *directory*.
 
-    The function performs a single `listdir` followed by `stat` on each entry to
-    discriminate between files and directories.
+    Entries are read together with their attributes and classified locally;
+    only symbolic links (whose target type is unknown) cost an extra ``stat``
+    round trip.  When the client offers ``listdir_iter`` (Paramiko ≥ 1.15)
+    up to :data:`_READDIR_AHEAD` ``READDIR`` requests are kept in flight, so
+    large directories do not pay one round trip per batch of entries;
+    otherwise a plain ``listdir_attr`` is used.
 
     Args:
         sftp_client: Active Paramiko SFTP client.
@@ -142,8 +248,12 @@ def list_subdirs_and_files(
         tuple[list[str], list[str]]: Sorted lists ``(subdirs, files)``.
         Empty lists are returned when the path is missing or unreadable.
     """
+    listdir_iter = getattr(sftp_client, "listdir_iter", None)
     try:
-        contents = sftp_client.listdir(directory)
+        if listdir_iter is not None:
+            entries = list(listdir_iter(directory, read_aheads=_READDIR_AHEAD))
+        else:
+            entries = sftp_client.listdir_attr(directory)
     except FileNotFoundError:
         logger.error("[SFTP] Directory not found: %s", directory)
         return [], []
@@ -154,18 +264,20 @@ def list_subdirs_and_files(
     subdirs: List[str] = []
     files: List[str] = []
 
-    for entry in contents:
-        full = os.path.join(directory, entry)
-        try:
-            st = sftp_client.stat(full)
-            # ``S_ISDIR`` equivalent without importing stat module.
-            if st.st_mode & 0o040000:
-                subdirs.append(entry)
-            else:
-                files.append(entry)
-        except Exception:
-            # Fall back to treating unknown entries as files.
-            files.append(entry)
+    for entry in entries:
+        name = entry.filename
+        mode = entry.st_mode
+        if mode is None or stat.S_ISLNK(mode):
+            # Follow links (and attribute-less entries) like ``stat`` would
+            try:
+                mode = sftp_client.stat(join_remote(directory, name)).st_mode
+            except Exception:
+                mode = None
+        if mode is not None and stat.S_ISDIR(mode):
+            subdirs.append(name)
+        else:
+            # Unknown entries are treated as files.
+            files.append(name)
 
     return sorted(subdirs), sorted(files)
 
@@ -189,7 +301,7 @@ def _recurse_for_all_files(
     final_map["/".join(partial_path)] = files
 
     for sd in subdirs:
-        new_dir = os.path.join(current_dir, sd)
+        new_dir = join_remote(current_dir, sd)
         _recurse_for_all_files(sftp_client, new_dir, partial_path + [sd], final_map)
 
 
@@ -230,8 +342,8 @@ def navigate_and_list_files(
         # Consume each wildcard pattern sequentially.
         for step in steps:
             subdirs, files = list_subdirs_and_files(sftp_client, current_dir)
-            matched_subdirs = [sd for sd in subdirs if fnmatch.fnmatch(sd, step)]
-            matched_files = [f for f in files if fnmatch.fnmatch(f, step)]
+            matched_subdirs = fnmatch.filter(subdirs, step)
+            matched_files = fnmatch.filter(files, step)
 
             if not matched_subdirs and not matched_files:
                 logger.info("[SFTP] No directory/file matches '%s' under %s", step, current_dir)
@@ -245,7 +357,7 @@ def navigate_and_list_files(
 
             # Otherwise select the first matching directory and continue.
             chosen = matched_subdirs[0]
-            next_dir = os.path.join(current_dir, chosen)
+            next_dir = join_remote(current_dir, chosen)
             try:
                 sftp_client.chdir(next_dir)
             except Exception as exc:
@@ -287,7 +399,7 @@ def build_sftp_path_tree(
     :pyfunc:`bids_cbrain_runner.utils.bids_style.to_bids_style`.
     """
     tree: Dict[str, Dict] = {}
-    _walk_sftp_tree(sftp_client, start_dir, steps, 0, [], tree)
+    _walk_sftp_tree(sftp_client, start_dir, steps, 0, tree)
     return tree
 
 
@@ -296,20 +408,23 @@ def _walk_sftp_tree(
     current_dir: str,
     steps: Sequence[str],
     step_index: int,
-    partial_path: List[str],
-    tree: Dict[str, Dict],
+    node: Dict[str, Dict],
 ):
-    """Recursive helper used by :pyfunc:`build_sftp_path_tree`."""
+    """Recursive helper used by :pyfunc:`build_sftp_path_tree`.
+
+    *node* is the dictionary for *current_dir* itself, so each level inserts
+    into its own node instead of re-walking the tree from the root.
+    """
     # Base‑case: every pattern has been matched – recurse into *all* children.
     if step_index >= len(steps):
-        _walk_all_remaining_sftp(sftp_client, current_dir, partial_path, tree)
+        _walk_all_remaining_sftp(sftp_client, current_dir, node)
         return
 
     pattern = steps[step_index]
     subdirs, files = list_subdirs_and_files(sftp_client, current_dir)
 
-    matched_subdirs = [sd for sd in subdirs if fnmatch.fnmatch(sd, pattern)]
-    matched_files = [f for f in files if fnmatch.fnmatch(f, pattern)]
+    matched_subdirs = fnmatch.filter(subdirs, pattern)
+    matched_files = fnmatch.filter(files, pattern)
 
     if not matched_subdirs and not matched_files:
         logger.debug("No matches for pattern '%s' in %s", pattern, current_dir)
@@ -317,60 +432,37 @@ def _walk_sftp_tree(
 
     # Register matching files as leaf nodes.
     for mf in matched_files:
-        path_dict = {"_files": [mf], "_subdirs": []}
-        _insert_subdict(tree, partial_path + [mf], path_dict)
+        node[mf] = {"_files": [mf], "_subdirs": []}
 
-    # Recurse into each matching directory.
+    # Recurse into each matching directory; branches without any match below
+    # them are left out of the tree.
     for match in matched_subdirs:
-        next_dir = os.path.join(current_dir, match)
+        child: Dict[str, Dict] = {}
         _walk_sftp_tree(
             sftp_client,
-            next_dir,
+            join_remote(current_dir, match),
             steps,
             step_index + 1,
-            partial_path + [match],
-            tree,
+            child,
         )
+        if child:
+            node[match] = child
 
 
 def _walk_all_remaining_sftp(
     sftp_client: paramiko.SFTPClient,
     dir_path: str,
-    path_parts: List[str],
-    tree: Dict[str, Dict],
+    node: Dict[str, Dict],
 ):
     """After all patterns matched, record every file and directory below."""
     subdirs, files = list_subdirs_and_files(sftp_client, dir_path)
-    _insert_path(tree, path_parts, subdirs, files)
+    node["_files"] = list(files)
+    node["_subdirs"] = list(subdirs)
 
     for sd in subdirs:
-        new_dir = os.path.join(dir_path, sd)
-        _walk_all_remaining_sftp(sftp_client, new_dir, path_parts + [sd], tree)
-
-
-def _insert_subdict(tree: Dict[str, Dict], path_parts: Sequence[str], subdict: Dict):
-    """Insert ``subdict`` at ``path_parts`` inside ``tree``.
-
-    Creates parent dictionaries as needed.
-    """
-    current = tree
-    for part in path_parts[:-1]:
-        current = current.setdefault(part, {})
-    current[path_parts[-1]] = subdict
-
-
-def _insert_path(
-    tree: Dict[str, Dict],
-    path_parts: Sequence[str],
-    subdirs: Sequence[str],
-    files: Sequence[str],
-):
-    """Ensure node exists then set its ``_subdirs`` and ``_files`` keys."""
-    current = tree
-    for part in path_parts:
-        current = current.setdefault(part, {})
-    current["_files"] = list(files)
-    current["_subdirs"] = list(subdirs)
+        _walk_all_remaining_sftp(
+            sftp_client, join_remote(dir_path, sd), node.setdefault(sd, {})
+        )
 
 
 # -----------------------------------------------------------------------------
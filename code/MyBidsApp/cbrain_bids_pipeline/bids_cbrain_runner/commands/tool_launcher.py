@@ -191,15 +191,16 @@ def launch_tool(
     # ---------------------------------------------------------------------#
     # 5. Construct default parameters from descriptor                       #
     # ---------------------------------------------------------------------#
+    # One pass over the descriptor: defaults, an id → input index (also used
+    # to partition invoke vs. CBRAIN-level params) and the required ids.
     defaults: Dict[str, Any] = {}
-    input_ids = set()
     input_index: Dict[str, Dict[str, Any]] = {}
+    required_ids: List[str] = []
     for inp in inputs:
         inp_id = inp.get("id")
         if not inp_id:
             # Skip anonymous inputs (should not happen in valid descriptors).
             continue
-        input_ids.add(inp_id)
         input_index[inp_id] = inp
 
         # Flags → default to string '0' (Boutiques convention for false).
@@ -213,6 +214,8 @@ def launch_tool(
             if inp.get("list") and not isinstance(dv, list):
                 dv = [dv]
             defaults[inp_id] = dv
+        elif not inp.get("optional", False):
+            required_ids.append(inp_id)
 
     # Overlay command-line overrides *after* descriptor defaults.
     combined_params = {**defaults, **(extra_params or {})}
@@ -245,19 +248,17 @@ def launch_tool(
     if interface_ids is not None:
         interface_ids = [str(i) for i in interface_ids]
 
-    invoke_params = {k: v for k, v in combined_params.items() if k in input_ids}
-    cbrain_params = {k: v for k, v in combined_params.items() if k not in input_ids}
+    invoke_params: Dict[str, Any] = {}
+    cbrain_params: Dict[str, Any] = {}
+    for key, value in combined_params.items():
+        if key in input_index:
+            invoke_params[key] = value
+        else:
+            cbrain_params[key] = value
 
     # ---------------------------------------------------------------------#
     # 7. Validate required (non-optional) inputs                            #
     # ---------------------------------------------------------------------#
-    required_ids = [
-        inp["id"]
-        for inp in inputs
-        if not inp.get("optional", False)
-        and "default-value" not in inp
-        and "defaultValue" not in inp
-    ]
     missing = [r for r in required_ids if r not in invoke_params]
     if missing:
         raise CbrainTaskError(
@@ -311,12 +312,15 @@ def launch_tool(
             lines = desc.splitlines()
             task["description"] = lines[-1] if lines else ""
 
-    logger.info(
-        "Task created for '%s' on cluster '%s':\n%s",
-        tool_name,
-        cluster_name,
-        json.dumps(tasks[0] if len(tasks) == 1 else tasks, indent=2),
-    )
+    # The pretty-printed response is only for the log; skip serialising it
+    # when INFO records would be discarded anyway.
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Task created for '%s' on cluster '%s':\n%s",
+            tool_name,
+            cluster_name,
+            json.dumps(tasks[0] if len(tasks) == 1 else tasks, indent=2),
+        )
 
 
 # -----------------------------------------------------------------------------#
@@ -383,6 +387,13 @@ def launch_tool_batch_for_group(
         "Submitting task",
         show=show_spinner,
     )
+    renderer = None
+    if custom_output_templates:
+        # The group listing already names every userfile a template can
+        # reference, so no per-subject lookups are needed.
+        renderer = CustomOutputRenderer(client_obj)
+        renderer.prime(userfiles)
+
     if batch_type:
         userfiles = [uf for uf in userfiles if uf.get("type") == batch_type]
     if userfile_ids is not None:
@@ -395,8 +406,6 @@ def launch_tool_batch_for_group(
             f"No user-files of {filt} found in group={group_id}."
         )
 
-    renderer = CustomOutputRenderer(client_obj) if custom_output_templates else None
-
     # ------------------------------------------------------------------#
     # 2. Launch (or simulate) one task per user-file                    #
     # ------------------------------------------------------------------#
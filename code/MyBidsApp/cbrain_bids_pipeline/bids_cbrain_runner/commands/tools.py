@@ -10,9 +10,11 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
 
 from ..api.client_openapi import ApiException, CbrainClient, CbrainTaskError
+from ..utils.pagination import fetch_all_pages
 
 logger = logging.getLogger(__name__)
 
@@ -285,6 +287,9 @@ def fetch_all_tasks(
 ) -> List[Dict[str, object]]:
     """Return **all** tasks visible to the session.
 
+    Pages after the first are requested concurrently; see
+    :func:`~bids_cbrain_runner.utils.pagination.fetch_all_pages`.
+
     Args:
         client: Authenticated :class:`CbrainClient`.
         per_page: Pagination size used for ``/tasks``.
@@ -293,32 +298,16 @@ def fetch_all_tasks(
     Returns:
         List of raw task dictionaries.
     """
-    all_tasks: List[Dict[str, object]] = []
-    page_num: int = 1
-
-    while True:
+    def fetch_page(page_num: int) -> List[Dict[str, object]]:
         logger.debug("Fetching tasks page %d…", page_num)
-        try:
-            page_data = client.list_tasks(
-                page=page_num,
-                per_page=per_page,
-                timeout=timeout,
-            )
-            page_tasks = [
-                t.to_dict() if hasattr(t, "to_dict") else t for t in page_data
-            ]
-        except ApiException as exc:  # noqa: BLE001 -- propagate network errors
-            logger.error("Could not fetch tasks (page %d): %s", page_num, exc)
-            break
-
-        all_tasks.extend(page_tasks)
-
-        if len(page_tasks) < per_page:
-            break
-
-        page_num += 1
+        page_data = client.list_tasks(
+            page=page_num,
+            per_page=per_page,
+            timeout=timeout,
+        )
+        return [t.to_dict() if hasattr(t, "to_dict") else t for t in page_data]
 
-    return all_tasks
+    return fetch_all_pages(fetch_page, per_page, errors=(ApiException,), label="tasks")
 
 
 def list_tasks_by_group(
@@ -344,19 +333,22 @@ def list_tasks_by_group(
     """
     tasks = fetch_all_tasks(client, per_page=per_page, timeout=timeout)
 
-    filtered = [t for t in tasks if t.get("group_id") == group_id]
+    if not task_type:
+        return [t for t in tasks if t.get("group_id") == group_id]
 
-    if task_type:
-        wanted = str(task_type).lower()
-        filtered = [
-            t
-            for t in filtered
-            if (
-                str(t.get("type", "")).lower().startswith(wanted)
-                or str(t.get("type", "")).lower().split("::")[-1].startswith(wanted)
-                or str(t.get("tool_config_id", "")).lower() == wanted
-            )
-        ]
+    # One pass over the listing; each task's type is lowered only once.
+    wanted = str(task_type).lower()
+    filtered: List[Dict[str, object]] = []
+    for t in tasks:
+        if t.get("group_id") != group_id:
+            continue
+        ttype = str(t.get("type", "")).lower()
+        if (
+            ttype.startswith(wanted)
+            or ttype.rpartition("::")[2].startswith(wanted)
+            or str(t.get("tool_config_id", "")).lower() == wanted
+        ):
+            filtered.append(t)
 
     return filtered
 
@@ -399,9 +391,12 @@ def show_group_tasks_status(
         logger.info("Task %s is at status: %s", task.get("id"), task.get("status"))
 
 
+@lru_cache(maxsize=64)
 def _is_failed(status: str) -> bool:
     """Determine whether a task status indicates failure.
 
+    Cached for the same reason as :func:`_is_recoverable`.
+
     Args:
         status: CBRAIN task status string.
 
@@ -411,9 +406,13 @@ def _is_failed(status: str) -> bool:
     return "fail" in status.lower()
 
 
+@lru_cache(maxsize=64)
 def _is_recoverable(status: str) -> bool:
     """Determine whether a status is recoverable.
 
+    CBRAIN uses a small, fixed vocabulary of statuses, so results are cached
+    and a large task listing only lower-cases each distinct status once.
+
     Args:
         status: CBRAIN task status string.
 
@@ -431,6 +430,7 @@ def retry_task(
     *,
     timeout: float | None = None,
     current_status: str | None = None,
+    client: CbrainClient | None = None,
 ) -> None:
     """Request a retry of ``task_id`` if it is in a failed state.
 
@@ -444,11 +444,13 @@ def retry_task(
         task_id: Identifier of the task to retry.
         timeout: Optional HTTP timeout forwarded to the API.
         current_status: Known task status to skip an additional API query.
+        client: Existing :class:`CbrainClient` to reuse; one is created from
+            *base_url* and *token* when omitted.
 
     Returns:
         None.
     """
-    client = CbrainClient(base_url, token)
+    client = client or CbrainClient(base_url, token)
     if current_status is None:
         try:
             current_status = client.get_task_status(task_id)
@@ -531,6 +533,7 @@ def retry_failed_tasks(
             int(tid),
             timeout=timeout,
             current_status=str(task.get("status", "")),
+            client=client,
         )
 
 
@@ -579,6 +582,42 @@ def error_recover_task(
     logger.info("Error recovery requested for task %d", task_id)
 
 
+def error_recover_tasks(
+    base_url: str,
+    token: str,
+    task_ids: Sequence[int],
+    *,
+    timeout: float | None = None,
+    client: CbrainClient | None = None,
+) -> None:
+    """Trigger error recovery for several tasks with a single API request.
+
+    Unlike :func:`error_recover_task`, no status check is performed; callers
+    are expected to pass only tasks already known to be recoverable.
+
+    Args:
+        base_url: CBRAIN portal root.
+        token: ``cbrain_api_token``.
+        task_ids: Identifiers of the tasks to recover.
+        timeout: Optional HTTP timeout forwarded to the API.
+        client: Existing :class:`CbrainClient` to reuse (optional).
+
+    Returns:
+        None.
+    """
+    ids = [int(t) for t in task_ids]
+    if not ids:
+        return
+    client = client or CbrainClient(base_url, token)
+    try:
+        client.operate_tasks("recover", ids, timeout=timeout)
+    except CbrainTaskError as exc:  # pragma: no cover - network failure
+        logger.error("Could not recover tasks %s: %s", ids, exc)
+        return
+
+    logger.info("Error recovery requested for %d task(s): %s", len(ids), ids)
+
+
 def error_recover_failed_tasks(
     base_url: str,
     token: str,
@@ -611,17 +650,20 @@ def error_recover_failed_tasks(
         timeout=timeout,
     )
 
-    recoverable = [t for t in tasks if _is_recoverable(str(t.get("status", "")))]
+    # One pass over the listing: read each task's id/status once and keep
+    # only those worth a recovery request.
+    recoverable = [
+        (int(tid), status)
+        for tid, status in ((t.get("id"), str(t.get("status", ""))) for t in tasks)
+        if tid is not None and _is_recoverable(status)
+    ]
     logger.info("Found %d recoverable task(s)", len(recoverable))
 
-    for task in recoverable:
-        tid = task.get("id")
-        if tid is None:
-            continue
-        error_recover_task(
+    if recoverable:
+        error_recover_tasks(
             base_url,
             token,
-            int(tid),
+            [tid for tid, _ in recoverable],
             timeout=timeout,
-            current_status=str(task.get("status", "")),
+            client=client,
         )
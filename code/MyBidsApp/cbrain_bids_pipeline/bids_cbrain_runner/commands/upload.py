@@ -18,16 +18,19 @@ High-level algorithm
 
 from __future__ import annotations
 
+import errno
 import logging
 import os
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Mapping, Sequence, Tuple
+from typing import Dict, List, Mapping, Sequence, Set, Tuple
 
+from ..api.client_openapi import CbrainClient
 from ..api.config_loaders import load_pipeline_config
 from ..utils.compare import compare_local_remote_files
-from ..utils.filetypes import guess_filetype
+from ..utils.filetypes import guess_filetypes
 from ..utils.local_files import (
     local_build_path_tree,
     local_gather_all_matched_files,
@@ -41,11 +44,14 @@ from ..utils.paths import (
 from ..utils.path_normalization import normalize_file_for_upload
 from .bids_validator import bids_validator_cli, find_bids_root_upwards
 from .data_providers import register_files_on_provider
-from .sftp import list_subdirs_and_files, sftp_connect_from_config
-from .userfiles import find_userfile_id_by_name_and_provider, update_userfile_group_and_move
+from .sftp import SFTPClientPool, list_subdirs_and_files, sftp_connect_from_config
+from .userfiles import update_userfile_group_and_move, userfile_ids_by_name
 
 logger = logging.getLogger(__name__)
 
+# Default number of concurrent SFTP PUT requests (see ``parallel_uploads``).
+_UPLOAD_WORKERS = 4
+
 
 # -----------------------------------------------------------------------------#
 # Public helpers                                                                #
@@ -66,6 +72,8 @@ def upload_bids_and_sftp_files(
     remote_root: str | None = None,
     path_map: Mapping[str, str] | None = None,
     rewrite_absolute_paths: bool = False,
+    session: Tuple[object, object] | None = None,
+    parallel_uploads: int = _UPLOAD_WORKERS,
 ) -> None:
     """Synchronise part of a local BIDS tree with an SFTP provider.
 
@@ -97,6 +105,12 @@ def upload_bids_and_sftp_files(
             The original dataset on disk is left untouched; normalized copies
             are written into a temporary staging directory.
         dry_run: When **True**, skip actual uploads and registration.
+        session: Open ``(ssh_client, sftp_client)`` pair to reuse, e.g. from
+            :func:`bids_cbrain_runner.commands.sftp.sftp_session`.  The caller
+            keeps ownership and the connection is left open.  When omitted, a
+            connection is opened from *cfg* and closed on return.
+        parallel_uploads: Maximum number of files transferred concurrently,
+            each on its own SFTP session over the same SSH connection.
 
     Returns:
         None.  Progress and diagnostics are emitted via :pymod:`logging`.
@@ -125,7 +139,7 @@ def upload_bids_and_sftp_files(
         logger.error("[UPLOAD] Could not locate dataset_description.json.")
         return
 
-    pipeline_cfg = load_pipeline_config()
+    pipeline_cfg = load_pipeline_config(use_cache=True)
     derivatives_root = infer_derivatives_root_from_steps(steps, pipeline_cfg)
     # Avoid treating the target filename as part of the derivatives root
     if os.path.isfile(os.path.join(dataset_root, *steps)):
@@ -198,7 +212,10 @@ def upload_bids_and_sftp_files(
     # ------------------------------------------------------------------#
     # 3. Establish SFTP connection                                       #
     # ------------------------------------------------------------------#
-    ssh_client, sftp_client = sftp_connect_from_config(cfg)
+    if session is not None:
+        ssh_client, sftp_client = session
+    else:
+        ssh_client, sftp_client = sftp_connect_from_config(cfg)
     if not ssh_client or not sftp_client:
         logger.error("[UPLOAD] SFTP connection failed – aborting.")
         return
@@ -207,10 +224,17 @@ def upload_bids_and_sftp_files(
         logger.info("[UPLOAD] Dry-run enabled – no files will be transferred")
 
     newly_uploaded: Dict[str, List[str]] = {}
-    # Preserve the initial remote working directory so that subsequent path
-    # computations remain stable even if the SFTP client's CWD is altered by
-    # other helper functions.
-    initial_cwd = sftp_client.getcwd() or "/"
+    # Resolve the remote root once: a user-provided root wins, otherwise the
+    # initial SFTP working directory is captured so path computations stay
+    # stable even if helpers later change the CWD.
+    start_cwd = sftp_client.getcwd()
+    sftp_base = remote_root or start_cwd or "/"
+    # Remote directories confirmed to exist, shared across every leaf so that
+    # common prefixes such as ``/sub-01`` are only stat'ed once per upload.
+    known_remote_dirs: set[str] = {"/"}
+    # ``(fname, local_path, remote_path)`` triples transferred once every
+    # remote directory has been created.
+    pending_puts: List[Tuple[str, str, str]] = []
 
     try:
         # ------------------------------------------------------------------#
@@ -289,28 +313,6 @@ def upload_bids_and_sftp_files(
 
             remote_path_tuple = remap_path_tuple(path_tuple, path_map)
 
-            # Preserve the initial SFTP working directory (or user-provided
-            # remote root) so that path computations remain stable even if
-            # ``ensure_remote_dir_structure`` changes the current directory
-            # as a side effect.
-            sftp_base = remote_root or initial_cwd
-
-            if not is_direct_file and path_tuple:
-                parent_remote = (
-                    os.path.dirname(
-                        build_remote_path(
-                            remote_path_tuple,
-                            is_direct_file,
-                            sftp_base,
-                            cfg=pipeline_cfg,
-                        )
-                    )
-                    or "/"
-                )
-                logger.info(
-                    "[UPLOAD] Uploading %s → %s", path_tuple[-1], parent_remote
-                )
-
             # Build absolute remote path using the preserved base directory
             # instead of the mutable SFTP CWD.
             remote_full_path = build_remote_path(
@@ -320,6 +322,12 @@ def upload_bids_and_sftp_files(
                 cfg=pipeline_cfg,
             )
 
+            if not is_direct_file and path_tuple:
+                parent_remote = os.path.dirname(remote_full_path) or "/"
+                logger.info(
+                    "[UPLOAD] Uploading %s → %s", path_tuple[-1], parent_remote
+                )
+
             # Decide how this subtree will appear on CBRAIN so that path
             # normalisation can choose the appropriate "root" purely from
             # the upload context.
@@ -339,6 +347,7 @@ def upload_bids_and_sftp_files(
                     remote_path_tuple,
                     pipeline_cfg,
                     base_dir=sftp_base,
+                    known_dirs=known_remote_dirs,
                 ):
                     logger.debug(
                         "[UPLOAD] Created remote directories: %s", remote_full_path
@@ -395,12 +404,7 @@ def upload_bids_and_sftp_files(
                 if dry_run:
                     logger.info("[DRY] Would upload %s → %s", fname, rpath)
                 else:
-                    logger.info("[UPLOAD] Uploading %s → %s", fname, rpath)
-                    try:
-                        sftp_client.put(str(upload_path), rpath)
-                    except Exception as exc:  # noqa: BLE001
-                        logger.error("[UPLOAD] Failed to upload %s: %s", fname, exc)
-                        continue
+                    pending_puts.append((fname, str(upload_path), rpath))
 
             if top_folder:
                 # Preserve sub-directory context for single-file uploads so
@@ -422,10 +426,20 @@ def upload_bids_and_sftp_files(
                     # keep listing the missing filenames under the top folder.
                     newly_uploaded.setdefault(top_folder, []).extend(relative_missing)
 
+        _put_pending(sftp_client, pending_puts, workers=parallel_uploads)
+
     finally:
-        # Always close the SFTP session to free network resources.
-        sftp_client.close()
-        ssh_client.close()
+        # Close the SFTP session to free network resources.  A caller-owned
+        # session is left open instead, back in its original directory so the
+        # next upload on it resolves the same remote root.
+        if session is None:
+            sftp_client.close()
+            ssh_client.close()
+        else:
+            try:
+                sftp_client.chdir(start_cwd)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("[UPLOAD] Could not restore remote directory: %s", exc)
         if temp_root is not None:
             shutil.rmtree(temp_root, ignore_errors=True)
 
@@ -460,7 +474,10 @@ def upload_bids_and_sftp_files(
         else:
             basenames = list(all_targets)
         if filetypes is None:
-            cb_types = [guess_filetype(b, cfg) for b in basenames]
+            # Prefer the pipeline config loaded above over letting
+            # guess_filetypes load and merge it a second time.
+            infer_cfg = cfg if "filetype_inference" in cfg else pipeline_cfg
+            cb_types = guess_filetypes(basenames, infer_cfg)
         else:
             filetypes = filetypes or ["BidsSubject"]
             cb_types = [
@@ -496,14 +513,14 @@ def upload_bids_and_sftp_files(
         # 4b. Optionally move the userfiles to another provider     #
         # ----------------------------------------------------------#
         if move_provider:
+            # One listing of the provider resolves every registered name.
+            uf_ids = userfile_ids_by_name(
+                CbrainClient(base_url, token),
+                dp_id,
+                timeout=timeout,
+            )
             for folder in basenames:
-                uf_id = find_userfile_id_by_name_and_provider(
-                    base_url,
-                    token,
-                    folder,
-                    dp_id,
-                    timeout=timeout,
-                )
+                uf_id = uf_ids.get(folder)
                 if not uf_id:
                     logger.warning(
                         "[UPLOAD] Could not locate newly registered userfile %r.", folder
@@ -537,11 +554,56 @@ def upload_bids_and_sftp_files(
 # -----------------------------------------------------------------------------#
 # Internal utilities                                                            #
 # -----------------------------------------------------------------------------#
+def _put_pending(
+    sftp_client,
+    pending: Sequence[Tuple[str, str, str]],
+    *,
+    workers: int = _UPLOAD_WORKERS,
+) -> None:
+    """PUT every ``(fname, local_path, remote_path)`` triple in *pending*.
+
+    Up to *workers* files are in flight at once, each on a session checked
+    out of a :class:`~bids_cbrain_runner.commands.sftp.SFTPClientPool`.
+    When no extra session can be opened the files go one by one through
+    *sftp_client*, in order.  Failures are logged and do not stop the
+    remaining transfers.
+    """
+    if not pending:
+        return
+
+    clients = SFTPClientPool(sftp_client, max(1, min(workers, len(pending))))
+
+    def put(item: Tuple[str, str, str]) -> None:
+        fname, local_path, rpath = item
+        logger.info("[UPLOAD] Uploading %s → %s", fname, rpath)
+        try:
+            with clients.acquire() as client:
+                # paramiko's put() streams the open file through putfo()
+                # with pipelined writes, then stats the remote copy to
+                # confirm its size.
+                client.put(local_path, rpath)
+        except Exception as exc:  # noqa: BLE001
+            logger.error("[UPLOAD] Failed to upload %s: %s", fname, exc)
+
+    try:
+        if clients.sessions == 1:
+            for item in pending:
+                put(item)
+            return
+        with ThreadPoolExecutor(max_workers=clients.sessions) as pool:
+            for _ in pool.map(put, pending):
+                pass
+    finally:
+        clients.close()
+
+
 def ensure_remote_dir_structure(
     sftp_client,
     path_tuple: Tuple[str, ...],
     cfg: Mapping[str, object] | None = None,
     base_dir: str | None = None,
+    *,
+    known_dirs: Set[str] | None = None,
 ) -> bool:
     """Create directories on the SFTP server as needed.
 
@@ -557,6 +619,10 @@ def ensure_remote_dir_structure(
         cfg: Optional configuration dictionary providing the derivatives root.
         base_dir: Base directory for building the remote path. Defaults to the
             current directory of the SFTP client.
+        known_dirs: Optional set of remote directories already known to
+            exist.  Members are neither stat'ed nor created, and every
+            directory confirmed or created here is added to it, so callers
+            sharing one set across calls avoid re-probing common prefixes.
 
     Returns:
         bool: ``True`` if any directory was created; otherwise ``False``.
@@ -588,25 +654,38 @@ def ensure_remote_dir_structure(
     # Nothing to create when targeting the SFTP root.
     components = [p for p in remote_dir.strip("/").split("/") if p]
 
+    if known_dirs is None:
+        known_dirs = {"/"}
+
     for part in components:
         next_path = os.path.join(current_path, part).replace("\\", "/")
-        try:
-            sftp_client.stat(next_path)
-            sftp_client.chdir(next_path)
+        if next_path in known_dirs:
             current_path = next_path
             continue
-        except FileNotFoundError:
-            pass
-
+        # Attempt the mkdir directly: one round-trip for a missing directory
+        # instead of a stat followed by a mkdir.
         try:
             sftp_client.mkdir(next_path)
             created_any = True
-            sftp_client.chdir(next_path)
-            current_path = next_path
+        except OSError as exc:
+            # SFTP v3 servers usually report a generic failure rather than
+            # EEXIST, so fall back to a stat to tell "exists" from a real error.
+            if exc.errno != errno.EEXIST:
+                try:
+                    sftp_client.stat(next_path)
+                except OSError:
+                    logger.error("[UPLOAD] Could not mkdir %r: %s", next_path, exc)
+                    break
         except Exception as exc:  # noqa: BLE001
             logger.error("[UPLOAD] Could not mkdir %r: %s", next_path, exc)
-            return created_any
-
+            break
+        known_dirs.add(next_path)
+        current_path = next_path
+
+    # Leave the client in the deepest directory reached, as callers may
+    # upload relative to it.
+    if current_path != "/":
+        sftp_client.chdir(current_path)
     return created_any
 
 
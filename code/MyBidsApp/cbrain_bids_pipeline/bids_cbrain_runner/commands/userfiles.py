@@ -14,6 +14,7 @@ from typing import Dict, List, Optional, Sequence
 
 from ..api.client import cbrain_post, cbrain_put
 from ..api.client_openapi import ApiException, CbrainClient
+from ..utils.pagination import fetch_all_pages
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,9 @@ def fetch_all_userfiles(
 ) -> List[Dict[str, object]]:
     """Retrieve **all** userfiles visible to the session.
 
+    Pages after the first are requested concurrently; see
+    :func:`~bids_cbrain_runner.utils.pagination.fetch_all_pages`.
+
     Args:
         client:  Authenticated :class:`CbrainClient` instance.
         per_page: Page size for the REST pagination mechanism.
@@ -35,30 +39,15 @@ def fetch_all_userfiles(
     Returns:
         A list of raw JSON dictionaries exactly as returned by the API.
     """
-    all_files: List[Dict[str, object]] = []
-    page_num: int = 1
-
-    while True:
-        # Internal pagination; avoid cluttering DEBUG logs with noisy updates
-        try:
-            page_data = client.list_userfiles(
-                page=page_num, per_page=per_page, timeout=timeout
-            )
-            page_files = [
-                uf.to_dict() if hasattr(uf, "to_dict") else uf for uf in page_data
-            ]
-        except ApiException as exc:
-            logger.error("Could not fetch userfiles (page %d): %s", page_num, exc)
-            break
-
-        all_files.extend(page_files)
-
-        if len(page_files) < per_page:
-            break
-
-        page_num += 1
+    def fetch_page(page_num: int) -> List[Dict[str, object]]:
+        page_data = client.list_userfiles(
+            page=page_num, per_page=per_page, timeout=timeout
+        )
+        return [uf.to_dict() if hasattr(uf, "to_dict") else uf for uf in page_data]
 
-    return all_files
+    return fetch_all_pages(
+        fetch_page, per_page, errors=(ApiException,), label="userfiles"
+    )
 
 
 # -----------------------------------------------------------------------------#
@@ -222,6 +211,33 @@ def find_userfile_id_by_name_and_provider(
     return None
 
 
+def userfile_ids_by_name(
+    client: CbrainClient,
+    provider_id: int,
+    *,
+    timeout: float | None = None,
+) -> Dict[str, int]:
+    """Map userfile *names* to IDs for every userfile on *provider_id*.
+
+    Resolving several names this way costs one listing instead of one per
+    name with :func:`find_userfile_id_by_name_and_provider`.  When names
+    repeat, the first listed userfile wins, as it does there.
+
+    Args:
+        client: Authenticated :class:`CbrainClient`.
+        provider_id: Data Provider ID hosting the files.
+        timeout: Optional HTTP timeout forwarded to the API.
+
+    Returns:
+        Dictionary of ``{name: userfile_id}``.
+    """
+    ids: Dict[str, int] = {}
+    for uf in fetch_all_userfiles(client, per_page=500, timeout=timeout):
+        if uf.get("data_provider_id") == provider_id:
+            ids.setdefault(uf.get("name"), uf.get("id"))
+    return ids
+
+
 # -----------------------------------------------------------------------------#
 # Mutation helpers                                                              #
 # -----------------------------------------------------------------------------#
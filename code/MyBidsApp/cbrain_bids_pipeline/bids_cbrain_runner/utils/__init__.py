@@ -3,12 +3,13 @@
 # Reuse the package version information from the parent package
 from .. import __version__
 
-from .filetypes import guess_filetype
+from .filetypes import guess_filetype, guess_filetypes
 from .progress import Spinner, run_with_spinner
 from .paths import build_remote_path, infer_derivatives_root_from_steps
 
 __all__ = [
     "guess_filetype",
+    "guess_filetypes",
     "Spinner",
     "run_with_spinner",
     "build_remote_path",
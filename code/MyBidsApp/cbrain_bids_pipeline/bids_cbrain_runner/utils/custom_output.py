@@ -27,6 +27,7 @@ Design goals
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 import logging
 from string import Formatter
 from typing import Any, Dict, Iterable, Mapping, MutableMapping, Optional
@@ -55,6 +56,37 @@ class _LiteralFallbackFormatter(Formatter):
         return super().get_value(key, args, kwargs)
 
 
+@lru_cache(maxsize=128)
+def _parse_template(template: str) -> Optional[tuple[tuple[str, Optional[str]], ...]]:
+    """Split *template* into ``(literal, field_name)`` pairs, parsed once.
+
+    Returns ``None`` when a placeholder needs the full ``Formatter`` machinery
+    (format specs, conversions, attribute/index lookups or positional
+    fields); such templates are rendered through ``vformat`` instead.
+    """
+
+    parts = []
+    for literal, name, spec, conversion in Formatter().parse(template):
+        if name is not None and (
+            spec or conversion or not name or name.isdigit() or "." in name or "[" in name
+        ):
+            return None
+        parts.append((literal, name))
+    return tuple(parts)
+
+
+def _substitute(parts: tuple[tuple[str, Optional[str]], ...], context: Mapping[str, Any]) -> str:
+    """Join pre-parsed template *parts*, falling back to literal field names."""
+
+    out = []
+    for literal, name in parts:
+        out.append(literal)
+        if name is not None:
+            value = context.get(name)
+            out.append(name if value is None else format(value))
+    return "".join(out)
+
+
 @dataclass(slots=True)
 class CustomOutputRenderer:
     """Render templated output directory names using tool parameters.
@@ -101,7 +133,11 @@ class CustomOutputRenderer:
                 logger.warning("[WARN] Custom output '%s' is not a string; skipping.", key)
                 continue
             try:
-                value = self._formatter.vformat(template, (), context)
+                parts = _parse_template(template)
+                if parts is None:
+                    value = self._formatter.vformat(template, (), context)
+                else:
+                    value = _substitute(parts, context)
             except Exception as exc:  # pragma: no cover - defensive guard
                 logger.error(
                     "[ERROR] Could not render custom output '%s': %s",
@@ -115,6 +151,24 @@ class CustomOutputRenderer:
 
         return resolved
 
+    def prime(self, records: Iterable[Any]) -> None:
+        """Seed the userfile name cache from already-fetched *records*.
+
+        Batch launches list the whole group before launching, and those
+        records already carry each userfile's ``name``.  Priming the cache with
+        them lets templates resolve without one ``get_userfile`` request per
+        placeholder.
+        """
+
+        for record in records:
+            if isinstance(record, dict):
+                uid, name = record.get("id"), record.get("name")
+            else:
+                uid, name = getattr(record, "id", None), getattr(record, "name", None)
+            uid = self._coerce_userfile_id(uid)
+            if uid is not None and name:
+                self._name_cache.setdefault(uid, name)
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
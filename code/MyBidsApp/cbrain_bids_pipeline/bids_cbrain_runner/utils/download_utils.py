@@ -18,13 +18,14 @@ Key responsibilities
    behaviours:
    • :func:`naive_download`  – plain recursive mirror
    • :func:`flattened_download`  – remove an additional wrapper directory
-4. **Recursive walker** – :func:`_naive_recursive` is shared by both public
-   strategies and performs the depth-first copy while honouring *skip-dirs*
+4. **Tree walker** – :func:`_naive_walk` is shared by both public
+   strategies and performs an iterative breadth-first copy honouring *skip-dirs*
    and *force* semantics.
 
 All functions are **side-effect free** unless explicitly documented
-(otherwise they read from disk/network but do not modify global state).  No
-function mutates its input arguments.
+(otherwise they read from disk/network but do not modify global state beyond
+a small per-configuration memo of derived values).  No function mutates its
+input arguments.
 """
 
 from __future__ import annotations
@@ -32,71 +33,116 @@ from __future__ import annotations
 import json
 import logging
 import os
-from fnmatch import fnmatch
+import re
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from fnmatch import translate
 from pathlib import Path, PurePosixPath
-from typing import Mapping, MutableMapping, Sequence, Set
+from typing import AbstractSet, Mapping, Sequence, Set
 
-import yaml  # noqa: F401 – retained for potential future YAML writes
+try:  # Optional C-accelerated JSON encoder
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    _orjson = None
 
-from bids_cbrain_runner.commands.sftp import list_subdirs_and_files
+from bids_cbrain_runner.commands.sftp import SFTPClientPool, list_subdirs_and_files
 
 from .metadata import runner_generatedby_entry
+from .paths import join_remote
 
+# Entity patterns used when inferring and normalising BIDS labels.
+_SUB_TOKEN_RE = re.compile(r"sub-[^_]+")
+_SES_TOKEN_RE = re.compile(r"ses-[^_]+")
+_SUB_PREFIX_RE = re.compile(r"(sub-[^_]+)(.*)")
+_SUB_LABEL_RE = re.compile(r"(sub-[^_/\-]+)")
+_SES_LABEL_RE = re.compile(r"(ses-[^_/\-]+)")
 
-def _find_session_component(path: str) -> str | None:
-    """Return the ``ses-<label>`` component from *path* if present."""
-    for part in Path(path).parts:
-        if part.startswith("ses-"):
-            return part
-    return None
+# Default number of concurrent SFTP GET requests issued by the download
+# strategies (see the ``parallel_downloads`` arguments).
+_DOWNLOAD_WORKERS = 4
 
+_LOCAL_SEPS = os.sep + (os.altsep or "")
 
-def _find_subject_component(path: str) -> str | None:
-    """Return the ``sub-<label>`` component from *path* if present."""
-    for part in Path(path).parts:
-        if part.startswith("sub-"):
-            return part
-    return None
 
+def _join_local(parent: str, name: str) -> str:
+    """Append a single path component to a local directory.
+
+    Equivalent to :func:`os.path.join` when *name* is a plain entry name (no
+    separators, never absolute), which holds for every name coming from a
+    remote listing.  The walkers call this once per file and directory.
+    """
+    if not parent or parent[-1] in _LOCAL_SEPS:
+        return parent + name
+    return f"{parent}{os.sep}{name}"
+
+
+def _dir_tokens(directory: str) -> tuple[str | None, str | None]:
+    """Return the first ``sub-`` and ``ses-`` components of *directory*.
+
+    Both labels are collected in a single pass over the path so callers can
+    derive them once per destination directory rather than once per file.
+    """
+    sub = ses = None
+    for part in Path(directory).parts:
+        if sub is None and part.startswith("sub-"):
+            sub = part
+        elif ses is None and part.startswith("ses-"):
+            ses = part
+    return sub, ses
 
-def _normalize_session_name(directory: str, fname: str) -> str:
-    """Insert or replace the session label in *fname* based on *directory*.
 
-    The function inspects *directory* for a ``ses-`` component and ensures
-    that *fname* contains the same session label.  When a different session is
-    already present in the file name it is replaced.  If the file lacks any
-    session token the label is inserted after the subject identifier when
-    available or prepended otherwise.
+def _normalize_session_name(ses: str | None, fname: str) -> str:
+    """Insert or replace the session label *ses* in *fname*.
+
+    When a different session is already present in the file name it is
+    replaced.  If the file lacks any session token the label is inserted after
+    the subject identifier when available or prepended otherwise.
     """
-    ses = _find_session_component(directory)
     if not ses:
         return fname
 
-    import re
-
-    if re.search(r"ses-[^_]+", fname):
-        return re.sub(r"ses-[^_]+", ses, fname)
+    if _SES_TOKEN_RE.search(fname):
+        return _SES_TOKEN_RE.sub(ses, fname)
 
-    m = re.match(r"(sub-[^_]+)(.*)", fname)
+    m = _SUB_PREFIX_RE.match(fname)
     if m:
         return f"{m.group(1)}_{ses}{m.group(2)}"
     return f"{ses}_{fname}"
 
 
-def _normalize_subject_name(directory: str, fname: str) -> str:
-    """Insert or replace the subject label in *fname* based on *directory*."""
-    sub = _find_subject_component(directory)
+def _normalize_subject_name(sub: str | None, fname: str) -> str:
+    """Insert or replace the subject label *sub* in *fname*."""
     if not sub:
         return fname
 
-    import re
-
-    if re.search(r"sub-[^_]+", fname):
-        return re.sub(r"sub-[^_]+", sub, fname)
+    if _SUB_TOKEN_RE.search(fname):
+        return _SUB_TOKEN_RE.sub(sub, fname)
 
     return f"{sub}_{fname}"
 
 
+# Compiled glob patterns keyed by the glob text.  Include patterns come from a
+# handful of configuration entries, so the cache stays small; matching is
+# case-insensitive on Windows to mirror :func:`fnmatch.fnmatch`.
+_PATTERN_CACHE: dict[str, re.Pattern[str]] = {}
+_PATTERN_FLAGS = re.IGNORECASE if os.name == "nt" else 0
+
+
+def _get_pat(pat: str) -> re.Pattern[str]:
+    """Return the compiled regular expression for glob *pat*."""
+    compiled = _PATTERN_CACHE.get(pat)
+    if compiled is None:
+        compiled = _PATTERN_CACHE.setdefault(pat, re.compile(translate(pat), _PATTERN_FLAGS))
+    return compiled
+
+
+def _glob_match(name: str, pat: str) -> bool:
+    """Match a single path component *name* against glob *pat*."""
+    return _get_pat(pat).match(name) is not None
+
+
 def _path_matches(rel_path: str, patterns: Sequence[str]) -> bool:
     """Return *True* if *rel_path* shares a prefix with any glob in *patterns*.
 
@@ -110,7 +156,7 @@ def _path_matches(rel_path: str, patterns: Sequence[str]) -> bool:
     for pat in patterns:
         pat_parts = PurePosixPath(pat).parts
         min_len = min(len(rel_parts), len(pat_parts))
-        if all(fnmatch(rel_parts[i], pat_parts[i]) for i in range(min_len)):
+        if all(_glob_match(rel_parts[i], pat_parts[i]) for i in range(min_len)):
             return True
     return False
 
@@ -130,6 +176,37 @@ def should_include(rel_path: str, patterns: Sequence[str] | None) -> bool:
     return _path_matches(rel_path, patterns)
 
 
+def _include_prefixes(
+    patterns: Sequence[str] | None,
+) -> tuple[tuple[str, ...], ...] | None:
+    """Split *patterns* into path-component tuples once.
+
+    *None* is returned when no filtering is requested.  The result is meant
+    for :func:`_prefix_match`, which avoids re-parsing every pattern for each
+    remote entry visited during a download.
+    """
+    if not patterns:
+        return None
+    return tuple(PurePosixPath(p).parts for p in patterns)
+
+
+def _prefix_match(
+    rel_parts: tuple[str, ...], prefixes: tuple[tuple[str, ...], ...] | None
+) -> bool:
+    """Equivalent of :func:`should_include` for pre-split paths and patterns.
+
+    A path is kept when it is an ancestor or descendant of (or equal to) any
+    pattern, comparing component by component.  Literal components are
+    checked with ``==`` before falling back to :func:`_glob_match`.
+    """
+    if prefixes is None or not rel_parts:
+        return True
+    return any(
+        all(r == p or _glob_match(r, p) for r, p in zip(rel_parts, pat_parts))
+        for pat_parts in prefixes
+    )
+
+
 def _transfer_file(
     sftp,
     src_file: str,
@@ -140,24 +217,263 @@ def _transfer_file(
     normalize_subject: bool,
     force: bool,
     dry_run: bool,
+    pending: dict[str, tuple[str, str]] | None = None,
+    tokens: tuple[str | None, str | None] | None = None,
+    made_dirs: Set[str] | None = None,
 ) -> None:
-    """Copy *src_file* into *dst_dir* honouring force/dry-run semantics."""
+    """Copy *src_file* into *dst_dir* honouring force/dry-run semantics.
+
+    When *pending* is given the ``(src, dst)`` pair is queued in it, keyed by
+    destination, instead of being fetched immediately; :func:`_fetch_pending`
+    performs the GETs.  Since nothing exists locally yet at queue time, a
+    second source mapping to an already queued destination is dropped, or
+    replaces the first one when *force* is set, exactly as a serial
+    download would skip or overwrite it.
+    *tokens* are the ``(sub, ses)`` labels of *dst_dir* as returned by
+    :func:`_dir_tokens`; callers transferring many files into the same
+    directory pass them in so the path is only parsed once.  With
+    *made_dirs*, *dst_dir* is created through :func:`_makedirs_once` before
+    the file is queued or fetched, so each destination directory costs one
+    ``mkdir`` per download regardless of how many files land in it.
+    """
     out_name = fname
-    if normalize_subject:
-        out_name = _normalize_subject_name(dst_dir, out_name)
-    if normalize_session:
-        out_name = _normalize_session_name(dst_dir, out_name)
-    dst_file = os.path.join(dst_dir, out_name)
+    if normalize_subject or normalize_session:
+        sub, ses = tokens if tokens is not None else _dir_tokens(dst_dir)
+        if normalize_subject:
+            out_name = _normalize_subject_name(sub, out_name)
+        if normalize_session:
+            out_name = _normalize_session_name(ses, out_name)
+    dst_file = _join_local(dst_dir, out_name)
     if not force and os.path.exists(dst_file):
         return
     if dry_run:
         logger.info("[DRY] Would GET %s → %s", src_file, dst_file)
+        return
+    if made_dirs is not None:
+        _makedirs_once(dst_dir, made_dirs)
+    if pending is not None:
+        if force or dst_file not in pending:
+            pending[dst_file] = (src_file, dst_file)
     else:
         sftp.get(src_file, dst_file)
         logger.info("GET %s → %s", src_file, dst_file)
 
+
+def _list_cached(
+    sftp, path: str, cache: dict[str, tuple[list[str], list[str]]]
+) -> tuple[list[str], list[str]]:
+    """Return ``list_subdirs_and_files(sftp, path)``, memoised in *cache*.
+
+    Entry names are interned: cohort-level trees repeat the same components
+    (``sub-001``, ``ses-01``, ``anat`` …) thousands of times, and the walker
+    uses them in relative-path tuples and set/dict lookups (*skip_dirs*,
+    *path_map*), where identical objects compare without a character scan.
+    Callers must not mutate the returned lists.
+    """
+    hit = cache.get(path)
+    if hit is None:
+        subdirs, files = list_subdirs_and_files(sftp, path)
+        hit = cache[sys.intern(path)] = (
+            [sys.intern(d) for d in subdirs],
+            [sys.intern(f) for f in files],
+        )
+    return hit
+
+
+def _makedirs_once(path: str, made: Set[str]) -> None:
+    """Create *path* (and parents) unless it is already recorded in *made*.
+
+    The set is scoped to a single download so repeated files beneath the same
+    directory skip the ``stat``/``mkdir`` round trips.
+    """
+    if path in made:
+        return
+    os.makedirs(path, exist_ok=True)
+    # Ancestors now exist too; record them so a later file landing directly
+    # in one of them does not trigger another makedirs.
+    while path not in made:
+        made.add(path)
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+
+
+def _fetch_pending(
+    sftp,
+    pending: Sequence[tuple[str, str]],
+    *,
+    workers: int = _DOWNLOAD_WORKERS,
+) -> None:
+    """GET every ``(src, dst)`` pair in *pending*, several at a time.
+
+    SFTP transfers of small files are dominated by per-request round trips,
+    so up to *workers* requests are kept in flight.  Each worker checks out
+    a session from a :class:`~bids_cbrain_runner.commands.sftp.SFTPClientPool`.
+    When no extra session can be opened the files go one by one through
+    *sftp*, in order.  The first failing transfer re-raises its exception
+    once the pool has drained.
+    """
+    if not pending:
+        return
+
+    workers = max(1, min(workers, len(pending)))
+    clients = SFTPClientPool(sftp, workers) if workers > 1 else None
+
+    if clients is not None and clients.sessions > 1:
+
+        def fetch(pair: tuple[str, str]) -> None:
+            with clients.acquire() as client:
+                client.get(*pair)
+            logger.info("GET %s → %s", *pair)
+
+        try:
+            with ThreadPoolExecutor(max_workers=clients.sessions) as pool:
+                for _ in pool.map(fetch, pending):
+                    pass
+        finally:
+            clients.close()
+        return
+
+    # One session only: Paramiko clients must not be shared across threads
+    for src, dst in pending:
+        sftp.get(src, dst)
+        logger.info("GET %s → %s", src, dst)
+
 logger = logging.getLogger(__name__)
 
+# Values derived from a configuration mapping, keyed by
+# ``(kind, id(config_dict), tool_name)``.  Each entry keeps a reference to the
+# mapping it was computed from so the id cannot be recycled for a different
+# object while the entry is alive.  Configurations are treated as read-only
+# once loaded.
+_CONFIG_MEMO: dict[tuple[str, int, str], tuple[object, object]] = {}
+_CONFIG_MEMO_MAX = 64
+
+
+def _memo_for_config(kind: str, config_dict: object, tool_name: str, compute):
+    """Return ``compute()`` memoised per *config_dict* identity and *tool_name*."""
+    key = (kind, id(config_dict), tool_name)
+    hit = _CONFIG_MEMO.get(key)
+    if hit is not None and hit[0] is config_dict:
+        return hit[1]
+    value = compute()
+    if len(_CONFIG_MEMO) >= _CONFIG_MEMO_MAX:
+        _CONFIG_MEMO.clear()
+    _CONFIG_MEMO[key] = (config_dict, value)
+    return value
+
+
+def _configured_output_dir(config_dict: Mapping[str, object], tool_name: str) -> str | None:
+    """Return ``cbrain.<tool>.<tool>_output_dir`` from *config_dict* if set."""
+
+    def compute() -> str | None:
+        tool_conf = config_dict.get("cbrain", {}).get(tool_name, {})
+        return tool_conf.get(f"{tool_name}_output_dir")
+
+    return _memo_for_config("output_dir", config_dict, tool_name, compute)
+
+
+def _dump_json_bytes(obj: object) -> bytes:
+    """Encode *obj* as two-space indented UTF-8 JSON (via orjson if present)."""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+@dataclass(frozen=True, slots=True)
+class DatasetDesc:
+    """Canonical *dataset_description.json* content for one CBRAIN tool.
+
+    Instances are immutable and hashable.  The JSON document is encoded once
+    on construction and exposed through :attr:`as_bytes`, so writing the same
+    description into many derivative folders costs a single ``write`` each.
+
+    Attributes:
+        name: Dataset (and pipeline) name.
+        bids_version: Value of ``BIDSVersion``.
+        dataset_type: Value of ``DatasetType``.
+        version: Pipeline version reported under ``PipelineDescription``.
+        description: Pipeline description reported under
+            ``PipelineDescription``.
+        generated_by: ``GeneratedBy`` entries, each stored as a tuple of
+            ``(key, value)`` pairs in output order.
+    """
+
+    name: str
+    bids_version: str = ""
+    dataset_type: str = "derivative"
+    version: str = ""
+    description: str = ""
+    generated_by: tuple[tuple[tuple[str, object], ...], ...] = ()
+    _encoded: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_encoded", _dump_json_bytes(self.to_dict()))
+
+    @classmethod
+    def from_config(cls, tool_meta: Mapping[str, object], tool_name: str) -> DatasetDesc:
+        """Build an instance from a ``dataset_descriptions.cbrain.<tool>`` entry.
+
+        The runner's own ``GeneratedBy`` entry is always listed first.
+        """
+        generated_by = [tuple(runner_generatedby_entry().items())]
+        for g in tool_meta.get("generatedby", []):  # type: ignore[union-attr]
+            generated_by.append(
+                (
+                    ("Name", g.get("name", "")),
+                    ("Version", g.get("version", "")),
+                    ("CodeURL", g.get("codeURL", "")),
+                    ("Description", g.get("description", "")),
+                )
+            )
+        return cls(
+            name=tool_meta.get("name", tool_name),  # type: ignore[arg-type]
+            bids_version=tool_meta.get("bids_version", ""),  # type: ignore[arg-type]
+            dataset_type=tool_meta.get("dataset_type", "derivative"),  # type: ignore[arg-type]
+            version=tool_meta.get("version", ""),  # type: ignore[arg-type]
+            description=tool_meta.get("description", ""),  # type: ignore[arg-type]
+            generated_by=tuple(generated_by),
+        )
+
+    def to_dict(self) -> dict[str, object]:
+        """Return the BIDS ``dataset_description.json`` mapping."""
+        return {
+            "Name": self.name,
+            "BIDSVersion": self.bids_version,
+            "DatasetType": self.dataset_type,
+            "PipelineDescription": {
+                "Name": self.name,
+                "Version": self.version,
+                "Description": self.description,
+            },
+            "GeneratedBy": [dict(entry) for entry in self.generated_by],
+        }
+
+    @property
+    def as_bytes(self) -> bytes:
+        """Indented UTF-8 JSON encoding of :meth:`to_dict`."""
+        return self._encoded
+
+
+def _dataset_description(
+    config_dict: Mapping[str, object], tool_name: str
+) -> DatasetDesc | None:
+    """Return the :class:`DatasetDesc` configured for *tool_name*.
+
+    The result is memoised per *config_dict*; *None* is returned when the
+    configuration holds no metadata for the tool.
+    """
+
+    def compute() -> DatasetDesc | None:
+        try:
+            tool_meta: Mapping[str, object] = config_dict["dataset_descriptions"]["cbrain"][tool_name]  # type: ignore[index]
+        except KeyError:
+            return None
+        return DatasetDesc.from_config(tool_meta, tool_name)
+
+    return _memo_for_config("dataset_description", config_dict, tool_name, compute)
+
 
 # ────────────────────────────────────────────────────────────────────────────
 # Destination helpers & metadata writers
@@ -209,32 +525,33 @@ def resolve_output_dir(
         *output_dir_name* is provided it **always** takes precedence over
         configuration-derived locations.
     """
-    # Start with the default <BIDS_ROOT>/derivatives/<tool_name>
-    out_dir = os.path.join(bids_root, "derivatives", tool_name)
-
-    # Honour an explicit override from the YAML configuration
-    try:
-        if config_dict:
-            tool_conf = config_dict.get("cbrain", {}).get(tool_name, {})
-            candidate = tool_conf.get(f"{tool_name}_output_dir")
-            if candidate:
-                out_dir = (
-                    candidate if os.path.isabs(candidate) else os.path.join(bids_root, candidate)
-                )
-    except Exception as exc:  # noqa: BLE001 – diagnostic only
-        logger.warning("Could not parse config for %s output directory: %s", tool_name, exc)
-
-    # Finally, allow a CLI-supplied output directory to override everything
+    # A CLI-supplied output directory overrides everything, so the
+    # configuration is only consulted without one.
+    out_dir: str | None = None
     if output_dir_name:
         out_dir = (
             output_dir_name
             if os.path.isabs(output_dir_name)
             else os.path.join(bids_root, "derivatives", output_dir_name)
         )
+    elif config_dict:
+        # Honour an explicit override from the YAML configuration
+        try:
+            candidate = _configured_output_dir(config_dict, tool_name)
+            if candidate:
+                out_dir = (
+                    candidate if os.path.isabs(candidate) else os.path.join(bids_root, candidate)
+                )
+        except Exception as exc:  # noqa: BLE001 – diagnostic only
+            logger.warning("Could not parse config for %s output directory: %s", tool_name, exc)
+
+    # Fall back to the default <BIDS_ROOT>/derivatives/<tool_name>
+    if out_dir is None:
+        out_dir = os.path.join(bids_root, "derivatives", tool_name)
 
     # Create the directory tree when needed
     if not dry_run and (force or not os.path.exists(out_dir)):
-        Path(out_dir).mkdir(parents=True, exist_ok=True)
+        os.makedirs(out_dir, exist_ok=True)
 
     return out_dir
 
@@ -272,45 +589,26 @@ def maybe_write_dataset_description(
     if os.path.exists(dd_path) or not config_dict:
         return
 
-    try:
-        tool_meta: Mapping[str, object] = config_dict["dataset_descriptions"]["cbrain"][tool_name]  # type: ignore[index]
-    except KeyError:
+    desc = _dataset_description(config_dict, tool_name)
+    if desc is None:
         # No metadata available for this tool – silently ignore
         return
-
-    generated_by = [
-        runner_generatedby_entry(),
-        *[
-            {
-                "Name": g.get("name", ""),
-                "Version": g.get("version", ""),
-                "CodeURL": g.get("codeURL", ""),
-                "Description": g.get("description", ""),
-            }
-            for g in tool_meta.get("generatedby", [])
-        ],
-    ]
-
-    dataset_json: MutableMapping[str, object] = {
-        "Name": tool_meta.get("name", tool_name),
-        "BIDSVersion": tool_meta.get("bids_version", ""),
-        "DatasetType": tool_meta.get("dataset_type", "derivative"),
-        "PipelineDescription": {
-            "Name": tool_meta.get("name", tool_name),
-            "Version": tool_meta.get("version", ""),
-            "Description": tool_meta.get("description", ""),
-        },
-        "GeneratedBy": generated_by,
-    }
+    payload = desc.as_bytes
 
     if dry_run:
         logger.info("[DRY RUN] Would write dataset_description.json to %s", dd_path)
-        logger.debug(json.dumps(dataset_json, indent=2))
+        logger.debug(payload.decode("utf-8"))
         return
 
     try:
-        with open(dd_path, "w", encoding="utf-8") as fh:
-            json.dump(dataset_json, fh, indent=2)
+        # One pre-encoded buffer, written without a buffered file object
+        fd = os.open(dd_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
         logger.info("Created dataset_description.json → %s", dd_path)
     except Exception as exc:  # noqa: BLE001 – disk I/O failure
         logger.error("Failed to write dataset_description.json: %s", exc)
@@ -319,6 +617,30 @@ def maybe_write_dataset_description(
 # ────────────────────────────────────────────────────────────────────────────
 # Download strategies (public API)
 # ────────────────────────────────────────────────────────────────────────────
+def _compile_dir_classifier(
+    skip_dirs: AbstractSet[str], wrapper: str | None
+) -> re.Pattern[str] | None:
+    """Return one pattern tagging names as ``skip`` or ``wrap``.
+
+    Skip names take precedence, mirroring the early exit in
+    :func:`flattened_download` when the wrapper itself is skipped.
+    """
+    groups = []
+    if skip_dirs:
+        groups.append("(?P<skip>%s)" % "|".join(map(re.escape, sorted(skip_dirs))))
+    if wrapper:
+        groups.append("(?P<wrap>%s)" % re.escape(wrapper))
+    return re.compile("|".join(groups)) if groups else None
+
+
+def _classify_dir(classifier: re.Pattern[str] | None, name: str) -> str | None:
+    """Return the group name *classifier* assigns to *name*, if any."""
+    if classifier is None:
+        return None
+    m = classifier.fullmatch(name)
+    return m.lastgroup if m else None
+
+
 def flattened_download(
     sftp,
     remote_dir: str,
@@ -336,6 +658,7 @@ def flattened_download(
     normalize_subject: bool = False,
     dry_run: bool = False,
     force: bool = False,
+    parallel_downloads: int = _DOWNLOAD_WORKERS,
 ) -> None:
     """Download *remote_dir* while removing an extra wrapper directory.
 
@@ -380,15 +703,20 @@ def flattened_download(
             label of their containing directory.
         dry_run: If *True*, log planned transfers but skip network/disk I/O.
         force: If *True*, overwrite existing local files.
+        parallel_downloads: Maximum number of files fetched concurrently,
+            each over its own SFTP channel when the server allows it.
 
     Raises:
         Any exception from Paramiko I/O propagates to the caller; handling is
         the responsibility of the CLI layer.
     """
-    skip_dirs_set: Set[str] = set(skip_dirs or [])
-    keep_dirs_set: Set[str] = set(keep_dirs or [])
-    skip_files_set: Set[str] = set(skip_files or [])
-    subject_dirs_set: Set[str] = set(subject_dirs or [])
+    # Membership tests happen per traversed entry: freeze the name lists into
+    # hashed sets (and the include globs into a tuple) once per call.
+    skip_dirs_set: AbstractSet[str] = frozenset(skip_dirs or ())
+    keep_dirs_set: AbstractSet[str] = frozenset(keep_dirs or ())
+    skip_files_set: AbstractSet[str] = frozenset(skip_files or ())
+    subject_dirs_set: AbstractSet[str] = frozenset(subject_dirs or ())
+    include_dirs = tuple(include_dirs) if include_dirs else None
     path_map = {k: list(v) if isinstance(v, (list, tuple)) else [v] for k, v in (path_map or {}).items()}
     wrapper = wrapper or tool_name
 
@@ -398,20 +726,30 @@ def flattened_download(
     if wrapper and wrapper in skip_dirs_set:
         return
 
-    # Immediate listing of remote_dir
-    subdirs, files = list_subdirs_and_files(sftp, remote_dir)
-    subdirs = [d for d in subdirs if d not in skip_dirs_set]
-    subdirs = [d for d in subdirs if should_include(d, include_dirs)]
-    files = [f for f in files if should_include(f, include_dirs)]
+    # Transfers are collected during the (single-threaded) traversal and
+    # fetched concurrently at the end.
+    pending: dict[str, tuple[str, str]] = {}
+    made_dirs: Set[str] = set()
+    # Remote listings are read-only for the duration of the download; share
+    # them between the wrapper probing below and the tree walker.
+    dircache: dict[str, tuple[list[str], list[str]]] = {}
+
+    # Immediate listing of remote_dir; each entry is classified once against
+    # the skip/wrapper names with a single compiled pattern
+    classifier = _compile_dir_classifier(skip_dirs_set, wrapper)
+    subdirs, files = _list_cached(sftp, remote_dir, dircache)
+    kinds = {d: _classify_dir(classifier, d) for d in subdirs}
+    subdirs = [d for d in subdirs if kinds[d] != "skip"]
+    include_prefixes = _include_prefixes(include_dirs)
+    subdirs = [d for d in subdirs if _prefix_match((d,), include_prefixes)]
+    files = [f for f in files if _prefix_match((f,), include_prefixes)]
 
     # ------------------------------------------------------------------ #
     # Derive sub- and ses- identifiers                                  #
     # ------------------------------------------------------------------ #
-    import re
-
     name = os.path.basename(remote_dir.lstrip("/"))
-    sub_match = re.search(r"(sub-[^_/\-]+)", name)
-    ses_match = re.search(r"(ses-[^_/\-]+)", name)
+    sub_match = _SUB_LABEL_RE.search(name)
+    ses_match = _SES_LABEL_RE.search(name)
     sub = sub_match.group(1) if sub_match else None
     ses = ses_match.group(1) if ses_match else None
 
@@ -419,7 +757,7 @@ def flattened_download(
         candidate = next((d for d in subdirs if d.startswith("sub-")), None)
         if candidate:
             sub = candidate
-            inner, _ = list_subdirs_and_files(sftp, os.path.join(remote_dir, candidate))
+            inner, _ = _list_cached(sftp, join_remote(remote_dir, candidate), dircache)
             ses = next((d for d in inner if d.startswith("ses-")), ses)
 
     if not sub:
@@ -432,7 +770,7 @@ def flattened_download(
     )
 
     mapping: dict[str, str] = {}
-    wrapper_present = wrapper in subdirs if wrapper else False
+    wrapper_present = any(kinds[d] == "wrap" for d in subdirs)
 
     if wrapper_present:
         mapping[wrapper] = primary
@@ -462,28 +800,28 @@ def flattened_download(
 
     for dest in mapping.values():
         if not dry_run:
-            Path(dest).mkdir(parents=True, exist_ok=True)
+            _makedirs_once(dest, made_dirs)
 
     subdirs = [d for d in subdirs if d in mapping]
 
     for sd in subdirs:
-        orig_src = os.path.join(remote_dir, sd)
+        orig_src = join_remote(remote_dir, sd)
         dst = mapping[sd]
 
-        root_subdirs, root_files = list_subdirs_and_files(sftp, orig_src)
+        root_subdirs, root_files = _list_cached(sftp, orig_src, dircache)
         src = orig_src
 
         if wrapper_present and sd == wrapper:
             inner = root_subdirs
             if len(inner) == 1 and inner[0].startswith("sub-"):
-                src = os.path.join(src, inner[0])
+                src = join_remote(src, inner[0])
         elif wrapper_present and sd in keep_dirs_set:
             inner = root_subdirs
             if len(inner) == 1 and sub and inner[0] == sub:
-                src = os.path.join(src, sub)
-                inner, _ = list_subdirs_and_files(sftp, src)
+                src = join_remote(src, sub)
+                inner, _ = _list_cached(sftp, src, dircache)
             if ses and len(inner) == 1 and inner[0] == ses:
-                src = os.path.join(src, ses)
+                src = join_remote(src, ses)
         elif not wrapper_present and sd in subject_dirs_set:
             if sub and sub in root_subdirs:
                 # Copy root files to destination first.  Special-case
@@ -493,14 +831,13 @@ def flattened_download(
                 # ``QC/sub-001/dataset_description.json``).
                 base_dest = os.path.join(local_root, sd)
                 if not dry_run:
-                    Path(base_dest).mkdir(parents=True, exist_ok=True)
+                    _makedirs_once(base_dest, made_dirs)
                 for fname in root_files:
                     if fname in skip_files_set:
                         continue
-                    rel_file = os.path.join(sd, fname)
-                    if not should_include(rel_file, include_dirs):
+                    if not _prefix_match((sd, fname), include_prefixes):
                         continue
-                    src_file = os.path.join(orig_src, fname)
+                    src_file = join_remote(orig_src, fname)
                     dest_dir = base_dest if fname == "dataset_description.json" else dst
                     _transfer_file(
                         sftp,
@@ -511,63 +848,74 @@ def flattened_download(
                         normalize_subject=normalize_subject,
                         force=force,
                         dry_run=dry_run,
+                        pending=pending,
+                        made_dirs=made_dirs,
                     )
                 # Merge subject directory directly under destination
-                _naive_recursive(
+                _naive_walk(
                     sftp,
-                    os.path.join(orig_src, sub),
+                    join_remote(orig_src, sub),
                     dst,
                     skip_dirs=skip_dirs_set,
                     skip_files=skip_files_set,
                     dry_run=dry_run,
+                    pending=pending,
                     force=force,
                     path_map=path_map,
                     normalize_session=normalize_session,
                     normalize_subject=normalize_subject,
                     include_dirs=include_dirs,
                     root_path=remote_dir,
+                    _made_dirs=made_dirs,
+                    _dircache=dircache,
                 )
                 root_subdirs = [d for d in root_subdirs if d != sub]
                 for inner in root_subdirs:
-                    _naive_recursive(
+                    _naive_walk(
                         sftp,
-                        os.path.join(orig_src, inner),
+                        join_remote(orig_src, inner),
                         os.path.join(dst, inner),
                         skip_dirs=skip_dirs_set,
                         skip_files=skip_files_set,
                         dry_run=dry_run,
+                        pending=pending,
                         force=force,
                         path_map=path_map,
                         normalize_session=normalize_session,
                         normalize_subject=normalize_subject,
                         include_dirs=include_dirs,
                         root_path=remote_dir,
+                        _made_dirs=made_dirs,
+                        _dircache=dircache,
                     )
                 continue
         
-        _naive_recursive(
+        _naive_walk(
             sftp,
             src,
             dst,
             skip_dirs=skip_dirs_set,
             skip_files=skip_files_set,
             dry_run=dry_run,
+            pending=pending,
             force=force,
             path_map=path_map,
             normalize_session=normalize_session,
             normalize_subject=normalize_subject,
             include_dirs=include_dirs,
             root_path=remote_dir,
+            _made_dirs=made_dirs,
+            _dircache=dircache,
         )
 
         if sd in keep_dirs_set and src != orig_src:
+            dst_tokens = _dir_tokens(dst)
             for fname in root_files:
                 if fname in skip_files_set:
                     continue
-                rel_file = os.path.join(sd, fname)
-                if not should_include(rel_file, include_dirs):
+                if not _prefix_match((sd, fname), include_prefixes):
                     continue
-                src_file = os.path.join(orig_src, fname)
+                src_file = join_remote(orig_src, fname)
                 _transfer_file(
                     sftp,
                     src_file,
@@ -577,14 +925,18 @@ def flattened_download(
                     normalize_subject=normalize_subject,
                     force=force,
                     dry_run=dry_run,
+                    pending=pending,
+                    tokens=dst_tokens,
+                    made_dirs=made_dirs,
                 )
 
+    root_tokens = _dir_tokens(local_root)
     for fname in files:
         if fname in skip_files_set:
             continue
-        if not should_include(fname, include_dirs):
+        if not _prefix_match((fname,), include_prefixes):
             continue
-        src = os.path.join(remote_dir, fname)
+        src = join_remote(remote_dir, fname)
         _transfer_file(
             sftp,
             src,
@@ -594,8 +946,13 @@ def flattened_download(
             normalize_subject=normalize_subject,
             force=force,
             dry_run=dry_run,
+            pending=pending,
+            tokens=root_tokens,
+            made_dirs=made_dirs,
         )
 
+    _fetch_pending(sftp, list(pending.values()), workers=parallel_downloads)
+
 
 def naive_download(
     sftp,
@@ -610,6 +967,7 @@ def naive_download(
     normalize_subject: bool = False,
     dry_run: bool = False,
     force: bool = False,
+    parallel_downloads: int = _DOWNLOAD_WORKERS,
 ) -> None:
     """Recursively mirror *remote_dir* under *local_root*.
 
@@ -620,8 +978,8 @@ def naive_download(
         sftp: Active Paramiko SFTP client.
         remote_dir: Absolute remote directory to mirror.
         local_root: Local directory that becomes the root of the mirror.
-        skip_dirs: Sub-directories to skip entirely during recursion.
-        skip_files: File names to ignore during recursion.
+        skip_dirs: Sub-directories to skip entirely during traversal.
+        skip_files: File names to ignore during traversal.
         include_dirs: Glob patterns restricting which paths are downloaded.
         path_map: Optional mapping of directory names to alternative
             destination paths relative to their parent.  When a directory is
@@ -633,37 +991,42 @@ def naive_download(
             label when beneath a ``sub-`` directory.
         dry_run: If *True*, log operations without performing them.
         force: If *True*, overwrite any existing local files.
+        parallel_downloads: Maximum number of files fetched concurrently,
+            each over its own SFTP channel when the server allows it.
     """
     base = os.path.basename(remote_dir.lstrip("/"))
     dest = os.path.join(local_root, base)
 
     mapping = {k: list(v) if isinstance(v, (list, tuple)) else [v] for k, v in (path_map or {}).items()}
-    _naive_recursive(
+    pending: dict[str, tuple[str, str]] = {}
+    _naive_walk(
         sftp,
         remote_dir,
         dest,
-        skip_dirs=set(skip_dirs or []),
-        skip_files=set(skip_files or []),
-        include_dirs=include_dirs,
+        skip_dirs=frozenset(skip_dirs or ()),
+        skip_files=frozenset(skip_files or ()),
+        include_dirs=tuple(include_dirs) if include_dirs else None,
         dry_run=dry_run,
+        pending=pending,
         force=force,
         path_map=mapping,
         normalize_session=normalize_session,
         normalize_subject=normalize_subject,
         root_path=remote_dir,
     )
+    _fetch_pending(sftp, list(pending.values()), workers=parallel_downloads)
 
 
 # ────────────────────────────────────────────────────────────────────────────
 # Internal shared walker
 # ────────────────────────────────────────────────────────────────────────────
-def _naive_recursive(
+def _naive_walk(
     sftp,
     remote_path: str,
     local_path: str,
     *,
-    skip_dirs: Set[str],
-    skip_files: Set[str],
+    skip_dirs: AbstractSet[str],
+    skip_files: AbstractSet[str],
     dry_run: bool,
     force: bool,
     path_map: Mapping[str, Sequence[str]] | None = None,
@@ -671,9 +1034,12 @@ def _naive_recursive(
     normalize_subject: bool = False,
     include_dirs: Sequence[str] | None = None,
     root_path: str | None = None,
+    pending: dict[str, tuple[str, str]] | None = None,
     _mapped: Set[str] | None = None,
+    _made_dirs: Set[str] | None = None,
+    _dircache: dict[str, tuple[list[str], list[str]]] | None = None,
 ) -> None:
-    """Depth-first copy of *remote_path* → *local_path*.
+    """Breadth-first copy of *remote_path* → *local_path*.
 
     Args:
         sftp: Active Paramiko SFTP client.
@@ -689,86 +1055,87 @@ def _naive_recursive(
             relative paths.
         root_path: Anchor for relative path computation; defaults to the first
             ``remote_path`` provided.
+        pending: Optional dict collecting ``(src, dst)`` pairs, keyed by
+            destination, for a later :func:`_fetch_pending` instead of
+            fetching each file inline.
         _mapped: Internal set tracking which remote paths have been remapped.
+        _made_dirs: Internal set of local directories already created during
+            this download.
+        _dircache: Internal per-download cache of remote directory listings.
 
     Notes:
         The function is intentionally *chatty* at INFO level to facilitate
         monitoring of long transfers.
     """
     _mapped = _mapped or set()
+    _made_dirs = set() if _made_dirs is None else _made_dirs
+    _dircache = {} if _dircache is None else _dircache
     root_path = root_path or remote_path
-    rel_path = os.path.relpath(remote_path, root_path).replace("\\", "/")
-    if not should_include(rel_path, include_dirs):
+
+    # Include patterns act as a prefix filter: a directory outside every
+    # pattern is never queued, so its subtree is never listed remotely.
+    prefixes = _include_prefixes(include_dirs)
+    normalize = normalize_session or normalize_subject
+    root_rel = os.path.relpath(remote_path, root_path).replace("\\", "/")
+    root_parts = PurePosixPath(root_rel).parts
+    if not _prefix_match(root_parts, prefixes):
         return
-    base_name = os.path.basename(remote_path)
-    if path_map and base_name in path_map and remote_path not in _mapped:
-        _mapped.add(remote_path)
-        parent = os.path.dirname(local_path)
-        targets = [os.path.join(parent, rel) for rel in path_map[base_name]]
-        for dest in targets:
-            _naive_recursive(
+
+    # Breadth-first walk driven by an explicit queue; one directory listing
+    # per node and no Python call frame per level of the remote tree.  Each
+    # entry carries its path components relative to *root_path*.
+    queue: deque[tuple[str, str, tuple[str, ...]]] = deque(
+        [(remote_path, local_path, root_parts)]
+    )
+    while queue:
+        cur_remote, cur_local, rel_parts = queue.popleft()
+        base_name = os.path.basename(cur_remote)
+        if path_map and base_name in path_map and cur_remote not in _mapped:
+            _mapped.add(cur_remote)
+            parent = os.path.dirname(cur_local)
+            queue.extend(
+                (cur_remote, os.path.join(parent, rel), rel_parts)
+                for rel in path_map[base_name]
+            )
+            continue
+
+        subdirs, files = _list_cached(sftp, cur_remote, _dircache)
+
+        if not dry_run:
+            _makedirs_once(cur_local, _made_dirs)
+
+        # -------------------------------------------------------------- #
+        # File transfers at current depth                                #
+        # -------------------------------------------------------------- #
+        tokens = _dir_tokens(cur_local) if normalize else None
+        for fname in files:
+            if fname in skip_files:
+                continue
+            if not _prefix_match((*rel_parts, fname), prefixes):
+                continue
+            _transfer_file(
                 sftp,
-                remote_path,
-                dest,
-                skip_dirs=skip_dirs,
-                skip_files=skip_files,
-                dry_run=dry_run,
-                force=force,
-                path_map=path_map,
+                join_remote(cur_remote, fname),
+                cur_local,
+                fname,
                 normalize_session=normalize_session,
                 normalize_subject=normalize_subject,
-                include_dirs=include_dirs,
-                root_path=root_path,
-                _mapped=_mapped,
+                force=force,
+                dry_run=dry_run,
+                pending=pending,
+                tokens=tokens,
+                made_dirs=_made_dirs,
             )
-        return
 
-    subdirs, files = list_subdirs_and_files(sftp, remote_path)
-    subdirs = [d for d in subdirs if d not in skip_dirs]
-
-    if not dry_run:
-        Path(local_path).mkdir(parents=True, exist_ok=True)
-
-    # ------------------------------------------------------------------ #
-    # File transfers at current depth                                    #
-    # ------------------------------------------------------------------ #
-    for fname in files:
-        if fname in skip_files:
-            continue
-        file_rel = os.path.join(rel_path, fname).lstrip("./")
-        if not should_include(file_rel, include_dirs):
-            continue
-        src = os.path.join(remote_path, fname)
-        _transfer_file(
-            sftp,
-            src,
-            local_path,
-            fname,
-            normalize_session=normalize_session,
-            normalize_subject=normalize_subject,
-            force=force,
-            dry_run=dry_run,
-        )
-
-    # ------------------------------------------------------------------ #
-    # Recurse into sub-directories                                        #
-    # ------------------------------------------------------------------ #
-    for sd in subdirs:
-        sub_rel = os.path.join(rel_path, sd).lstrip("./")
-        if not should_include(sub_rel, include_dirs):
-            continue
-        _naive_recursive(
-            sftp,
-            os.path.join(remote_path, sd),
-            os.path.join(local_path, sd),
-            skip_dirs=skip_dirs,
-            skip_files=skip_files,
-            dry_run=dry_run,
-            force=force,
-            path_map=path_map,
-            normalize_session=normalize_session,
-            normalize_subject=normalize_subject,
-            include_dirs=include_dirs,
-            root_path=root_path,
-            _mapped=_mapped,
-        )
+        # -------------------------------------------------------------- #
+        # Queue sub-directories                                          #
+        # -------------------------------------------------------------- #
+        for sd in subdirs:
+            if sd in skip_dirs:
+                continue
+            sub_parts = (*rel_parts, sd)
+            if not _prefix_match(sub_parts, prefixes):
+                continue
+            queue.append(
+                (join_remote(cur_remote, sd), _join_local(cur_local, sd), sub_parts)
+            )
@@ -3,11 +3,31 @@
 from __future__ import annotations
 
 import fnmatch
-from typing import Mapping
+import os
+import re
+from functools import lru_cache
+from typing import List, Mapping, Sequence
 
 from bids_cbrain_runner.api.config_loaders import load_pipeline_config
 
 
+@lru_cache(maxsize=32)
+def _compile_patterns(items: tuple[tuple[str, str], ...]) -> tuple[re.Pattern[str], tuple[str, ...]]:
+    """Fold ``(glob, filetype)`` rules into one regular expression.
+
+    Each glob becomes a named alternative ``_ft<i>`` so the matching group's
+    index maps back to its filetype.  Alternatives are tried in order, which
+    preserves the first-match-wins semantics of looping over the rules.  The
+    prefix must not collide with the ``g<n>`` groups that
+    :func:`fnmatch.translate` emits for multi-``*`` globs on Python < 3.11.
+    """
+    regex = "|".join(
+        "(?P<_ft%d>%s)" % (i, fnmatch.translate(os.path.normcase(glob)))
+        for i, (glob, _) in enumerate(items)
+    )
+    return re.compile(regex), tuple(ftype for _, ftype in items)
+
+
 def guess_filetype(name: str, cfg: Mapping[str, object] | None = None) -> str:
     """Return the CBRAIN file type for *name* based on pattern rules.
 
@@ -20,6 +40,26 @@ def guess_filetype(name: str, cfg: Mapping[str, object] | None = None) -> str:
         The guessed CBRAIN filetype. Defaults to the ``fallback`` value from the
         configuration.
     """
+    return guess_filetypes([name], cfg)[0]
+
+
+def guess_filetypes(
+    names: Sequence[str], cfg: Mapping[str, object] | None = None
+) -> List[str]:
+    """Return the CBRAIN file type of every entry in *names*.
+
+    Equivalent to calling :func:`guess_filetype` for each name, but the
+    configuration is resolved (and, when needed, loaded) only once.
+
+    Args:
+        names: Basenames or folder names whose types should be inferred.
+        cfg: Pipeline configuration dictionary. When ``None`` or lacking a
+            ``filetype_inference`` section, it is loaded via
+            :func:`load_pipeline_config`.
+
+    Returns:
+        One filetype per name, in order.
+    """
     if cfg is None or "filetype_inference" not in cfg:
         cfg = load_pipeline_config()
 
@@ -27,7 +67,11 @@ def guess_filetype(name: str, cfg: Mapping[str, object] | None = None) -> str:
     patterns: Mapping[str, str] = inference.get("patterns", {})
     fallback: str = inference.get("fallback", "BidsSubject")
 
-    for pattern, ftype in patterns.items():
-        if fnmatch.fnmatch(name, pattern):
-            return ftype
-    return fallback
+    if not patterns:
+        return [fallback] * len(names)
+    regex, ftypes = _compile_patterns(tuple(patterns.items()))
+    result: List[str] = []
+    for name in names:
+        m = regex.match(os.path.normcase(name))
+        result.append(fallback if m is None else ftypes[int(m.lastgroup[3:])])
+    return result
@@ -26,6 +26,8 @@ from __future__ import annotations
 import fnmatch
 import logging
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable, List, MutableMapping, Sequence, Tuple
 
@@ -34,6 +36,15 @@ logger = logging.getLogger(__name__)
 # Patterns ignored during directory listings (matches Finder & resource files)
 DEFAULT_IGNORE_GLOBS: List[str] = ["*.DS_Store", "._*"]
 
+
+@lru_cache(maxsize=32)
+def _compile_ignore(globs: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Fold *globs* into one regex so each entry is tested with a single match."""
+    if not globs:
+        return None
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(g)) for g in globs))
+
+
 # -----------------------------------------------------------------------------
 # Public API – tree builders / collectors
 # -----------------------------------------------------------------------------
@@ -118,8 +129,8 @@ def _recursive_local_walk(
     subdirs, files = local_list_subdirs_and_files(current_dir, ignore_globs)
 
     # --- Match against directory names ----------------------------------------
-    matched_subdirs: List[str] = [sd for sd in subdirs if fnmatch.fnmatch(sd, pattern)]
-    matched_files: List[str] = [f for f in files if fnmatch.fnmatch(f, pattern)]
+    matched_subdirs: List[str] = fnmatch.filter(subdirs, pattern)
+    matched_files: List[str] = fnmatch.filter(files, pattern)
 
     # --- Handle direct file matches (leaf nodes) ------------------------------
     if matched_files:
@@ -191,11 +202,19 @@ def local_list_subdirs_and_files(
         A tuple ``(subdirs, files)``. Errors are logged and empty lists are
         returned when the directory cannot be read.
     """
+    ignore = _compile_ignore(tuple(ignore_globs))
+    subdirs: List[str] = []
+    files: List[str] = []
     try:
-        contents = os.listdir(directory)
-        contents = [
-            c for c in contents if not any(fnmatch.fnmatch(c, pat) for pat in ignore_globs)
-        ]
+        # ``scandir`` reports each entry's type from the directory read itself,
+        # so classifying entries needs no extra ``stat`` per name.  Symlinks
+        # are followed, as ``os.path.isdir`` did.
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if ignore is not None and ignore.match(os.path.normcase(name)):
+                    continue
+                (subdirs if entry.is_dir() else files).append(name)
     except FileNotFoundError:
         logger.error("[LOCAL] Directory not found: %s", directory)
         return ([], [])
@@ -203,12 +222,6 @@ def local_list_subdirs_and_files(
         logger.error("[LOCAL] Could not listdir '%s': %s", directory, exc)
         return ([], [])
 
-    subdirs: List[str] = []
-    files: List[str] = []
-    for entry in contents:
-        full_path = os.path.join(directory, entry)
-        (subdirs if os.path.isdir(full_path) else files).append(entry)
-
     subdirs.sort()
     files.sort()
     return subdirs, files
@@ -0,0 +1,68 @@
+"""Helpers for walking paginated CBRAIN listings.
+
+CBRAIN's ``/userfiles`` and ``/tasks`` endpoints do not report a total count,
+so the end of a listing is only known once a short page comes back.  Fetching
+one page at a time therefore costs one round-trip per page.
+:func:`fetch_all_pages` instead requests the first page on its own (most
+listings fit in it) and then requests the following pages in windows of
+*workers* concurrent requests.  This trades at most ``workers - 1`` requests
+past the last page for overlapping the network latency of the rest.
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+# Number of pages requested concurrently once a listing spans several pages.
+PAGE_WORKERS = 4
+
+
+def fetch_all_pages(
+    fetch_page: Callable[[int], List[Dict[str, object]]],
+    per_page: int,
+    *,
+    errors: Tuple[Type[BaseException], ...] = (),
+    label: str = "records",
+    workers: int = PAGE_WORKERS,
+) -> List[Dict[str, object]]:
+    """Concatenate every page returned by *fetch_page*, in page order.
+
+    Args:
+        fetch_page: Callable returning the records of a 1-based page number.
+        per_page: Page size used by *fetch_page*; a shorter page ends the
+            listing.
+        errors: Exception types that stop the listing.  They are logged, and
+            the records gathered from earlier pages are returned.
+        label: Noun used in log messages (e.g. ``"userfiles"``).
+        workers: Maximum number of pages requested concurrently.
+
+    Returns:
+        Records from all pages up to the first short (or failed) page.
+    """
+    records: List[Dict[str, object]] = []
+    page = 1
+    window = 1
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        while True:
+            pages = range(page, page + window)
+            futures = [pool.submit(fetch_page, num) for num in pages]
+            for num, future in zip(pages, futures):
+                try:
+                    items = future.result()
+                except errors as exc:
+                    logger.error("Could not fetch %s (page %d): %s", label, num, exc)
+                    items = None
+                if items is None or len(items) < per_page:
+                    # Requests past the end of the listing are discarded.
+                    for pending in futures:
+                        pending.cancel()
+                    if items is not None:
+                        records.extend(items)
+                    return records
+                records.extend(items)
+            page += window
+            window = max(1, workers)
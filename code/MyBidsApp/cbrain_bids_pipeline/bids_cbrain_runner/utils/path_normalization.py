@@ -10,6 +10,12 @@ from typing import Any, Mapping
 
 logger = logging.getLogger(__name__)
 
+# Optional C-accelerated decoder for JSON sidecars.
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    _json_loads = json.loads
+
 
 def _looks_like_absolute_path(value: str) -> bool:
     """Heuristic check for absolute paths (POSIX and Windows)."""
@@ -106,12 +112,25 @@ def _normalize_bids_json(
 ) -> Path | None:
     """Rewrite absolute IntendedFor paths to CBRAIN-friendly relatives."""
     try:
-        text = local_path.read_text(encoding="utf-8")
-        data = json.loads(text)
-    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        raw = local_path.read_bytes()
+    except OSError:
         logger.debug("[NORMALIZE] Skipping unreadable or non-JSON file %s", local_path)
         return None
 
+    # Most sidecars carry no IntendedFor at all; skip parsing those.
+    if b"IntendedFor" not in raw:
+        return None
+
+    try:
+        data = _json_loads(raw)
+    except ValueError:
+        try:
+            # orjson rejects NaN/Infinity, which the stdlib decoder accepts.
+            data = json.loads(raw.decode("utf-8"))
+        except ValueError:
+            logger.debug("[NORMALIZE] Skipping unreadable or non-JSON file %s", local_path)
+            return None
+
     if not isinstance(data, dict) or "IntendedFor" not in data:
         return None
 
@@ -107,6 +107,20 @@ def build_remote_path(
     return "/" + "/".join(parts) if parts else "/"
 
 
+def join_remote(parent: str, *names: str) -> str:
+    """Join SFTP path components with ``/`` whatever the local platform.
+
+    Unlike :func:`os.path.join`, no backslashes are introduced on Windows
+    and no per-component normalisation is performed, which keeps the hot
+    remote tree walks cheap.  *names* must be plain entry names (no leading
+    slash).
+    """
+    if not parent:
+        return "/".join(names)
+    # A bare "/" strips to "", so the join still yields an absolute path.
+    return "/".join((parent.rstrip("/"), *names))
+
+
 def remap_path_tuple(
     path_tuple: Sequence[str], path_map: Dict[str, str] | None = None
 ) -> Tuple[str, ...]:
@@ -3,10 +3,46 @@ import types
 import json
 import os
 
+import pytest
+
+# -------------------------------------------------------------------------
+# Shared stand-in for ``bids_cbrain_runner.api.client_openapi`` used by the
+# CLI tests.  The classes and module are built once and registered before
+# anything from *bids_cbrain_runner* is imported, so the CLI never pulls in
+# the real OpenAPI wrapper.  ``setdefault`` leaves an already-loaded real
+# module untouched.
+# -------------------------------------------------------------------------
+_CLIENT_OPENAPI = 'bids_cbrain_runner.api.client_openapi'
+
+
+class _StubCbrainClient:
+    def __init__(self, *a, **k):
+        pass
+
+
+class _StubCbrainTaskError(Exception):
+    pass
+
+
+_CLIENT_STUB = types.ModuleType(_CLIENT_OPENAPI)
+_CLIENT_STUB.CbrainClient = _StubCbrainClient
+_CLIENT_STUB.CbrainTaskError = _StubCbrainTaskError
+_CLIENT_STUB.ApiException = Exception
+sys.modules.setdefault(_CLIENT_OPENAPI, _CLIENT_STUB)
+
 if 'yaml' not in sys.modules:
     yaml_mod = types.ModuleType('yaml')
     yaml_mod.safe_dump = lambda data, stream, **kw: json.dump(data, stream)
     yaml_mod.safe_load = lambda stream: json.load(stream)
+    yaml_mod.dump = lambda data, stream, Dumper=None, **kw: json.dump(data, stream)
+    yaml_mod.load = lambda stream, Loader=None: json.load(stream)
+    yaml_mod.YAMLError = ValueError
+    class SafeLoader:
+        pass
+    class SafeDumper:
+        pass
+    yaml_mod.SafeLoader = SafeLoader
+    yaml_mod.SafeDumper = SafeDumper
     sys.modules['yaml'] = yaml_mod
 
 if 'paramiko' not in sys.modules:
@@ -144,9 +180,107 @@ if 'openapi_client' not in sys.modules:
     sys.modules['openapi_client.api_client'] = oc_api_client
     sys.modules['openapi_client.configuration'] = oc_config
     sys.modules['openapi_client.exceptions'] = oc_exceptions
+    _OPENAPI_STUBBED = True
+else:
+    _OPENAPI_STUBBED = False
+
+
+# -------------------------------------------------------------------------
+# ``openapi_client.models`` stand-in.  Built once at import time; the
+# session fixture below registers it for every model sub-module in a single
+# ``sys.modules.update``.  ``client_openapi`` falls back to its own
+# lightweight models when a name is missing, so registration order relative
+# to collection-time imports does not matter.
+# -------------------------------------------------------------------------
+class _DummyModel:
+    def __init__(self, *a, **k):
+        pass
+
+
+class _StubMultiUserfilesModReq:
+    def __init__(self, file_ids=None):
+        self.file_ids = file_ids
+
+    def to_dict(self):
+        return {"file_ids": self.file_ids}
+
+
+_OPENAPI_MODEL_CLASSES = dict.fromkeys(
+    (
+        'Bourreau', 'CbrainTask', 'CbrainTaskModReq', 'DataProvider',
+        'FileInfo', 'Group', 'GroupModReq', 'MultiRegistrationModReq',
+        'RegistrationInfo', 'SessionInfo', 'Tag', 'TagModReq', 'Tool',
+        'ToolConfig', 'User', 'UserModReq', 'Userfile', 'UserfileModReq',
+    ),
+    _DummyModel,
+)
+_OPENAPI_MODEL_CLASSES['MultiUserfilesModReq'] = _StubMultiUserfilesModReq
+
+_OPENAPI_MODEL_MODULES = (
+    'bourreau', 'cbrain_task', 'cbrain_task_mod_req', 'data_provider',
+    'file_info', 'group', 'group_mod_req', 'multi_registration_mod_req',
+    'multi_userfiles_mod_req', 'registration_info', 'session_info', 'tag',
+    'tag_mod_req', 'tool', 'tool_config', 'user', 'user_mod_req',
+    'userfile', 'userfile_mod_req',
+)
+
+_MODELS_STUB = types.ModuleType('openapi_client.models')
+_MODELS_STUB.__dict__.update(_OPENAPI_MODEL_CLASSES)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _stub_openapi_models():
+    """Register :data:`_MODELS_STUB` when ``openapi_client`` is stubbed."""
+    if _OPENAPI_STUBBED:
+        sys.modules.setdefault('openapi_client.models', _MODELS_STUB)
+        sys.modules.update(
+            {f'openapi_client.models.{n}': _MODELS_STUB for n in _OPENAPI_MODEL_MODULES}
+        )
+    return _MODELS_STUB
 
 # Ensure the bids_cbrain_runner package is importable
 pkg_root = os.path.abspath(os.path.join(__file__, "..", ".."))
 pkg_root = os.path.normpath(pkg_root)
 if pkg_root not in sys.path:
     sys.path.insert(0, pkg_root)
+
+
+# Import the CLI exactly once, against the stub, while this conftest loads.
+# Each pytest(-xdist) worker therefore pays the import cost a single time.
+# The stub is unregistered afterwards so tests that exercise the real
+# wrapper still import the genuine module.
+from bids_cbrain_runner import cli as _CLI_MOD  # noqa: E402
+
+if sys.modules.get(_CLIENT_OPENAPI) is _CLIENT_STUB:
+    del sys.modules[_CLIENT_OPENAPI]
+
+
+@pytest.fixture(scope="session")
+def cli_mod():
+    """Return :mod:`bids_cbrain_runner.cli` imported against the stub."""
+    return _CLI_MOD
+
+
+class _SpinnerRecorder:
+    """Drop-in for ``run_with_spinner`` that records each ``show`` flag."""
+
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, func, msg, show=True):
+        self.calls.append(show)
+        return func()
+
+
+@pytest.fixture
+def spinner_recorder():
+    """Return a fresh :class:`_SpinnerRecorder`."""
+    return _SpinnerRecorder()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_home(tmp_path_factory, monkeypatch):
+    """Keep pipeline-config snapshots out of the real ``~/.cache``."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
@@ -1,6 +1,4 @@
 import json
-import sys
-import types
 
 from bids_cbrain_runner.commands.alias import AliasSpec, make_task_aliases
 
@@ -70,21 +68,6 @@ def test_make_task_aliases_dry_run(tmp_path, monkeypatch, caplog):
     assert any("Would symlink" in msg for msg in caplog.text.splitlines())
 
 
-def _import_cli_with_stubs():
-    stub = types.ModuleType("bids_cbrain_runner.api.client_openapi")
-    stub.ApiException = Exception
-
-    class CbrainClient:
-        def __init__(self, *a, **k):
-            pass
-
-    stub.CbrainClient = CbrainClient
-    stub.CbrainTaskError = Exception
-    sys.modules["bids_cbrain_runner.api.client_openapi"] = stub
-    from bids_cbrain_runner import cli as cli_mod
-    return cli_mod
-
-
 def _common_patches(monkeypatch, cli_mod):
     monkeypatch.setattr(cli_mod, "get_sftp_provider_config", lambda provider_name=None: {})
     monkeypatch.setattr(cli_mod, "load_cbrain_config", lambda: {})
@@ -96,8 +79,7 @@ def _common_patches(monkeypatch, cli_mod):
     )
 
 
-def test_cli_alias(monkeypatch, tmp_path):
-    cli_mod = _import_cli_with_stubs()
+def test_cli_alias(monkeypatch, tmp_path, cli_mod):
     _common_patches(monkeypatch, cli_mod)
 
     func = tmp_path / "sub-001" / "ses-01" / "func"
@@ -108,9 +90,8 @@ def test_cli_alias(monkeypatch, tmp_path):
     )
     monkeypatch.chdir(tmp_path)
     argv = ["prog", "--alias", "foo=bar,sub=001,ses=01"]
-    monkeypatch.setattr(sys, "argv", argv)
 
-    cli_mod.main()
+    cli_mod.main(argv[1:])
 
     assert (func / "sub-001_ses-01_task-bar_run-01_bold.nii.gz").is_symlink()
     with open(func / "sub-001_ses-01_task-bar_run-01_bold.json") as fh:
@@ -155,3 +155,12 @@ def test_remap_path_tuple_suffix():
     original = ("sub-01", "anat")
     mapped = remap_path_tuple(original, {"anat": "ses-01/anat"})
     assert mapped == ("sub-01", "ses-01", "anat")
+
+
+def test_join_remote():
+    from bids_cbrain_runner.utils.paths import join_remote
+
+    assert join_remote("/", "a") == "/a"
+    assert join_remote("/uf/", "a", "b") == "/uf/a/b"
+    assert join_remote("/uf", "a") == "/uf/a"
+    assert join_remote("", "a", "b") == "a/b"
@@ -1,25 +1,4 @@
-import sys
-import types
 import pytest
-def _import_cli_with_stubs():
-    import importlib
-    import sys
-    import types
-
-    stub = types.ModuleType('bids_cbrain_runner.api.client_openapi')
-    stub.ApiException = Exception
-    class CbrainClient:
-        def __init__(self, *a, **k):
-            pass
-    stub.CbrainClient = CbrainClient
-    stub.CbrainTaskError = Exception
-    sys.modules['bids_cbrain_runner.api.client_openapi'] = stub
-
-    # Force a fresh import so the stubbed module is used even if the CLI was
-    # previously imported by another test.
-    sys.modules.pop('bids_cbrain_runner.cli', None)
-    cli_mod = importlib.import_module('bids_cbrain_runner.cli')
-    return cli_mod
 
 
 def _common_patches(monkeypatch, cli_mod):
@@ -29,8 +8,7 @@ def _common_patches(monkeypatch, cli_mod):
     monkeypatch.setattr(cli_mod, "ensure_token", lambda **kw: {"cbrain_api_token": "tok", "cbrain_base_url": "https://x"})
 
 
-def test_delete_userfile_dry_run(monkeypatch):
-    cli_mod = _import_cli_with_stubs()
+def test_delete_userfile_dry_run(monkeypatch, cli_mod):
     _common_patches(monkeypatch, cli_mod)
 
     called = {}
@@ -41,15 +19,13 @@ def test_delete_userfile_dry_run(monkeypatch):
     )
 
     argv = ["prog", "--delete-userfile", "42", "--dry-delete"]
-    monkeypatch.setattr(sys, "argv", argv)
 
-    cli_mod.main()
+    cli_mod.main(argv[1:])
 
     assert called.get("args") == (42, True)
 
 
-def test_delete_group_filetype_resolves(monkeypatch):
-    cli_mod = _import_cli_with_stubs()
+def test_delete_group_filetype_resolves(monkeypatch, cli_mod):
     _common_patches(monkeypatch, cli_mod)
 
     resolved = {}
@@ -70,9 +46,8 @@ def test_delete_group_filetype_resolves(monkeypatch):
     )
 
     argv = ["prog", "--delete-group", "Trial", "--delete-filetype", "mnc", "txt"]
-    monkeypatch.setattr(sys, "argv", argv)
 
-    cli_mod.main()
+    cli_mod.main(argv[1:])
 
     assert resolved.get("value") == "Trial"
     assert calls and calls[0][:2] == (7, ["mnc", "txt"])
@@ -1,23 +1,6 @@
-import sys
-import types
 import pytest
 
 
-def _import_cli_with_stubs():
-    stub = types.ModuleType("bids_cbrain_runner.api.client_openapi")
-    stub.ApiException = Exception
-
-    class CbrainClient: ...
-
-    stub.CbrainClient = CbrainClient
-    stub.CbrainTaskError = Exception
-    sys.modules["bids_cbrain_runner.api.client_openapi"] = stub
-
-    from bids_cbrain_runner import cli as cli_mod
-
-    return cli_mod
-
-
 def _common_patches(monkeypatch, cli_mod):
     monkeypatch.setattr(
         cli_mod, "get_sftp_provider_config", lambda provider_name=None: {}
@@ -32,8 +15,7 @@ def _common_patches(monkeypatch, cli_mod):
     monkeypatch.setattr(cli_mod, "resolve_group_id", lambda *a, **k: 1)
 
 
-def test_alias_after_download_subcommand(monkeypatch):
-    cli_mod = _import_cli_with_stubs()
+def test_alias_after_download_subcommand(monkeypatch, cli_mod):
     _common_patches(monkeypatch, cli_mod)
 
     alias_specs = []
@@ -60,9 +42,8 @@ def test_alias_after_download_subcommand(monkeypatch):
         "func",
         "6cat=assocmemory",
     ]
-    monkeypatch.setattr(sys, "argv", argv)
     with pytest.raises(SystemExit):
-        cli_mod.main()
+        cli_mod.main(argv[1:])
 
     assert alias_specs
     spec = alias_specs[0][0]
@@ -75,8 +56,7 @@ def test_alias_after_download_subcommand(monkeypatch):
     assert spec.new == "assocmemory"
 
 
-def test_alias_after_download_dry_run(monkeypatch):
-    cli_mod = _import_cli_with_stubs()
+def test_alias_after_download_dry_run(monkeypatch, cli_mod):
     _common_patches(monkeypatch, cli_mod)
 
     called = {}
@@ -104,9 +84,8 @@ def test_alias_after_download_dry_run(monkeypatch):
         "6cat=assocmemory",
         "--dry-run",
     ]
-    monkeypatch.setattr(sys, "argv", argv)
     with pytest.raises(SystemExit):
-        cli_mod.main()
+        cli_mod.main(argv[1:])
 
     assert called.get("dry_run") is True
 
@@ -1,5 +1,4 @@
 import logging
-import sys
 import types
 
 import pytest
@@ -9,21 +8,7 @@ def ensure_token_stub(**_):
     return {"cbrain_api_token": "tok", "cbrain_base_url": "https://x"}
 
 
-def _import_cli_with_stubs():
-    stub = types.ModuleType('bids_cbrain_runner.api.client_openapi')
-    stub.ApiException = Exception
-    class CbrainClient: ...
-    stub.CbrainClient = CbrainClient
-    stub.CbrainTaskError = Exception
-    sys.modules['bids_cbrain_runner.api.client_openapi'] = stub
-
-    from bids_cbrain_runner import cli as cli_mod
-    return cli_mod
-
-
-def test_download_missing_dataset(monkeypatch, tmp_path, caplog):
-    cli_mod = _import_cli_with_stubs()
-
+def test_download_missing_dataset(monkeypatch, tmp_path, caplog, cli_mod):
     monkeypatch.setattr(
         cli_mod,
         "get_sftp_provider_config",
@@ -49,20 +34,17 @@ def test_download_missing_dataset(monkeypatch, tmp_path, caplog):
         "--group",
         "1",
     ]
-    monkeypatch.setattr(sys, "argv", argv)
     monkeypatch.chdir(str(tmp_path))
 
     caplog.set_level(logging.ERROR)
     with pytest.raises(SystemExit) as exc:
-        cli_mod.main()
+        cli_mod.main(argv[1:])
     assert exc.value.code == 1
 
     assert "dataset missing" in caplog.text
 
 
-def test_download_http_error(monkeypatch, tmp_path, caplog):
-    cli_mod = _import_cli_with_stubs()
-
+def test_download_http_error(monkeypatch, tmp_path, caplog, cli_mod):
     monkeypatch.setattr(
         cli_mod,
         "get_sftp_provider_config",
@@ -86,19 +68,16 @@ def test_download_http_error(monkeypatch, tmp_path, caplog):
         "--group",
         "1",
     ]
-    monkeypatch.setattr(sys, "argv", argv)
     monkeypatch.chdir(str(tmp_path))
 
     caplog.set_level(logging.ERROR)
     with pytest.raises(SystemExit) as exc:
-        cli_mod.main()
+        cli_mod.main(argv[1:])
     assert exc.value.code == 1
     assert "HTTP 404" in caplog.text
 
 
-def test_download_request_exception(monkeypatch, tmp_path, caplog):
-    cli_mod = _import_cli_with_stubs()
-
+def test_download_request_exception(monkeypatch, tmp_path, caplog, cli_mod):
     monkeypatch.setattr(
         cli_mod,
         "get_sftp_provider_config",
@@ -131,11 +110,10 @@ def test_download_request_exception(monkeypatch, tmp_path, caplog):
         "--id",
         "1",
     ]
-    monkeypatch.setattr(sys, "argv", argv)
     monkeypatch.chdir(str(tmp_path))
 
     caplog.set_level(logging.ERROR)
     with pytest.raises(SystemExit) as exc:
-        cli_mod.main()
+        cli_mod.main(argv[1:])
     assert exc.value.code == 1
     assert "timeout" in caplog.text
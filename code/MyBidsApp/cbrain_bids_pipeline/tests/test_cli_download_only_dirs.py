@@ -1,23 +1,7 @@
-import sys
-import types
-
 import pytest
 
 
-def _import_cli_with_stubs():
-    stub = types.ModuleType('bids_cbrain_runner.api.client_openapi')
-    stub.ApiException = Exception
-    class CbrainClient: ...
-    stub.CbrainClient = CbrainClient
-    stub.CbrainTaskError = Exception
-    sys.modules['bids_cbrain_runner.api.client_openapi'] = stub
-
-    from bids_cbrain_runner import cli as cli_mod
-    return cli_mod
-
-
-def _setup_common(monkeypatch):
-    cli_mod = _import_cli_with_stubs()
+def _setup_common(monkeypatch, cli_mod):
     monkeypatch.setattr(cli_mod, "get_sftp_provider_config", lambda provider_name=None: {})
     monkeypatch.setattr(cli_mod, "load_cbrain_config", lambda: {})
     monkeypatch.setattr(cli_mod, "load_tools_config", lambda: {})
@@ -26,11 +10,10 @@ def _setup_common(monkeypatch):
         "ensure_token",
         lambda **kw: {"cbrain_api_token": "tok", "cbrain_base_url": "https://x"},
     )
-    return cli_mod
 
 
-def test_download_only_dirs(monkeypatch):
-    cli_mod = _setup_common(monkeypatch)
+def test_download_only_dirs(monkeypatch, cli_mod):
+    _setup_common(monkeypatch, cli_mod)
     monkeypatch.setattr(cli_mod, "resolve_group_id", lambda *a, **k: 7)
 
     dl_calls = []
@@ -47,10 +30,9 @@ def test_download_only_dirs(monkeypatch):
         "sub-*/figures",
         "sub-*/ses-*/anat",
     ]
-    monkeypatch.setattr(sys, "argv", argv)
 
     with pytest.raises(SystemExit):
-        cli_mod.main()
+        cli_mod.main(argv[1:])
 
     assert dl_calls
     assert dl_calls[0]["include_dirs"] == ["sub-*/figures", "sub-*/ses-*/anat"]
@@ -1,31 +1,17 @@
-import sys
-import types
 import pytest
 
+from bids_cbrain_runner.commands import tool_launcher as tl_mod
 
-def _import_cli_with_stubs():
-    stub = types.ModuleType('bids_cbrain_runner.api.client_openapi')
-    stub.ApiException = Exception
-    class CbrainClient: ...
-    stub.CbrainClient = CbrainClient
-    stub.CbrainTaskError = Exception
-    sys.modules['bids_cbrain_runner.api.client_openapi'] = stub
 
-    from bids_cbrain_runner import cli as cli_mod
-    return cli_mod
-
-
-def _setup_common(monkeypatch):
-    cli_mod = _import_cli_with_stubs()
+def _setup_common(monkeypatch, cli_mod):
     monkeypatch.setattr(cli_mod, "get_sftp_provider_config", lambda provider_name=None: {})
     monkeypatch.setattr(cli_mod, "load_cbrain_config", lambda: {})
     monkeypatch.setattr(cli_mod, "load_tools_config", lambda: {})
     monkeypatch.setattr(cli_mod, "ensure_token", lambda **kw: {"cbrain_api_token": "tok", "cbrain_base_url": "https://x"})
-    return cli_mod
 
 
-def test_cli_launch_tool_group_name(monkeypatch):
-    cli_mod = _setup_common(monkeypatch)
+def test_cli_launch_tool_group_name(monkeypatch, cli_mod):
+    _setup_common(monkeypatch, cli_mod)
 
     monkeypatch.setattr(
         cli_mod,
@@ -43,17 +29,16 @@ def test_cli_launch_tool_group_name(monkeypatch):
         "--group-id",
         "MyProj",
     ]
-    monkeypatch.setattr(sys, "argv", argv)
     with pytest.raises(SystemExit):
-        cli_mod.main()
+        cli_mod.main(argv[1:])
 
     assert launch_calls and launch_calls[0]["group_id"] == 42
     assert launch_calls[0]["show_spinner"] is True
     assert launch_calls[0]["custom_output_templates"] == {}
 
 
-def test_cli_launch_tool_custom_output(monkeypatch):
-    cli_mod = _setup_common(monkeypatch)
+def test_cli_launch_tool_custom_output(monkeypatch, cli_mod):
+    _setup_common(monkeypatch, cli_mod)
 
     monkeypatch.setattr(
         cli_mod,
@@ -73,9 +58,8 @@ def test_cli_launch_tool_custom_output(monkeypatch):
         "--custom-output",
         'output_dir_name="{bids_dir}-hippunfold"',
     ]
-    monkeypatch.setattr(sys, "argv", argv)
     with pytest.raises(SystemExit):
-        cli_mod.main()
+        cli_mod.main(argv[1:])
 
     assert launch_calls
     assert launch_calls[0]["custom_output_templates"] == {
@@ -83,8 +67,8 @@ def test_cli_launch_tool_custom_output(monkeypatch):
     }
 
 
-def test_cli_download_group_name(monkeypatch, tmp_path):
-    cli_mod = _setup_common(monkeypatch)
+def test_cli_download_group_name(monkeypatch, tmp_path, cli_mod):
+    _setup_common(monkeypatch, cli_mod)
 
     monkeypatch.setattr(
         cli_mod,
@@ -105,52 +89,40 @@ def test_cli_download_group_name(monkeypatch, tmp_path):
         "--config",
         str(tmp_path / "cfg.yaml"),
     ]
-    monkeypatch.setattr(sys, "argv", argv)
     with pytest.raises(SystemExit):
-        cli_mod.main()
+        cli_mod.main(argv[1:])
 
     assert dl_calls and dl_calls[0]["group_id"] == 13
     assert dl_calls[0]["output_dir_name"] is None
 
 
-def test_launch_tool_spinner(monkeypatch):
-    cli_mod = _setup_common(monkeypatch)
+def test_launch_tool_spinner(monkeypatch, cli_mod, spinner_recorder):
+    _setup_common(monkeypatch, cli_mod)
 
     monkeypatch.setattr(cli_mod, "resolve_group_id", lambda *a, **k: 11)
 
-    spinner = []
-    monkeypatch.setattr(
-        cli_mod,
-        "run_with_spinner",
-        lambda func, msg, show=True: spinner.append(show) or func(),
-    )
+    monkeypatch.setattr(cli_mod, "run_with_spinner", spinner_recorder)
 
     launch_calls = []
     monkeypatch.setattr(cli_mod, "launch_tool", lambda **kw: launch_calls.append(kw))
 
     argv = ["prog", "--launch-tool", "hippunfold", "--group-id", "Proj"]
-    monkeypatch.setattr(sys, "argv", argv)
 
     with pytest.raises(SystemExit):
-        cli_mod.main()
+        cli_mod.main(argv[1:])
 
     # The CLI no longer wraps ``launch_tool`` with ``run_with_spinner`` to
     # avoid console artefacts.  Ensure the helper was not invoked.
-    assert spinner == []
+    assert spinner_recorder.calls == []
     assert launch_calls and launch_calls[0]["show_spinner"] is True
 
 
-def test_launch_tool_spinner_debug(monkeypatch):
-    cli_mod = _setup_common(monkeypatch)
+def test_launch_tool_spinner_debug(monkeypatch, cli_mod, spinner_recorder):
+    _setup_common(monkeypatch, cli_mod)
 
     monkeypatch.setattr(cli_mod, "resolve_group_id", lambda *a, **k: 11)
 
-    spinner = []
-    monkeypatch.setattr(
-        cli_mod,
-        "run_with_spinner",
-        lambda func, msg, show=True: spinner.append(show) or func(),
-    )
+    monkeypatch.setattr(cli_mod, "run_with_spinner", spinner_recorder)
 
     launch_calls = []
     monkeypatch.setattr(cli_mod, "launch_tool", lambda **kw: launch_calls.append(kw))
@@ -163,40 +135,36 @@ def test_launch_tool_spinner_debug(monkeypatch):
         "Proj",
         "--debug-logs",
     ]
-    monkeypatch.setattr(sys, "argv", argv)
 
     with pytest.raises(SystemExit):
-        cli_mod.main()
+        cli_mod.main(argv[1:])
 
     # Debug mode suppresses the spinner for other commands, but ``launch_tool``
     # is now executed directly without the helper.
-    assert spinner == []
+    assert spinner_recorder.calls == []
     assert launch_calls and launch_calls[0]["show_spinner"] is False
 
 
-def test_batch_launch_wrapper(monkeypatch):
-    from bids_cbrain_runner.commands import tool_launcher as tl_mod
-
+@pytest.mark.parametrize(
+    "show, userfiles, expected_spinner, expected_launches",
+    [
+        (True, [{"id": 1}, {"id": 2}], [True, True, True], 2),
+        (False, [{"id": 1}], [False, False], 1),
+    ],
+)
+def test_batch_launch_wrapper(
+    monkeypatch, spinner_recorder, show, userfiles, expected_spinner, expected_launches
+):
     monkeypatch.setattr(tl_mod, "CbrainClient", lambda *a, **k: object())
-    monkeypatch.setattr(
-        tl_mod,
-        "list_userfiles_by_group",
-        lambda *a, **k: [{"id": 1}, {"id": 2}],
-    )
+    monkeypatch.setattr(tl_mod, "list_userfiles_by_group", lambda *a, **k: userfiles)
 
     launch_calls = []
-    spinner = []
-
-    def fake_run_with_spinner(func, msg, show=True):
-        spinner.append(show)
-        return func()
-
-    monkeypatch.setattr(tl_mod, "run_with_spinner", fake_run_with_spinner)
+    monkeypatch.setattr(tl_mod, "run_with_spinner", spinner_recorder)
 
     def fake_launch_tool(**kw):
         launch_calls.append(kw)
         # Simulate spinner usage inside launch_tool
-        fake_run_with_spinner(lambda: None, "dummy", show=kw.get("show_spinner", True))
+        spinner_recorder(lambda: None, "dummy", show=kw.get("show_spinner", True))
 
     monkeypatch.setattr(tl_mod, "launch_tool", fake_launch_tool)
 
@@ -206,55 +174,15 @@ def test_batch_launch_wrapper(monkeypatch):
         tools_cfg={},
         tool_name="demo",
         group_id=99,
-        show_spinner=True,
+        show_spinner=show,
     )
 
-    assert spinner == [True, True, True]
-    assert len(launch_calls) == 2
-    assert all(call["show_spinner"] is True for call in launch_calls)
+    assert spinner_recorder.calls == expected_spinner
+    assert len(launch_calls) == expected_launches
+    assert all(call["show_spinner"] is show for call in launch_calls)
 
 
-def test_batch_launch_wrapper_no_spinner(monkeypatch):
-    from bids_cbrain_runner.commands import tool_launcher as tl_mod
-
-    monkeypatch.setattr(tl_mod, "CbrainClient", lambda *a, **k: object())
-    monkeypatch.setattr(
-        tl_mod,
-        "list_userfiles_by_group",
-        lambda *a, **k: [{"id": 1}],
-    )
-
-    launch_calls = []
-    spinner = []
-
-    def fake_run_with_spinner(func, msg, show=True):
-        spinner.append(show)
-        return func()
-
-    monkeypatch.setattr(tl_mod, "run_with_spinner", fake_run_with_spinner)
-
-    def fake_launch_tool(**kw):
-        launch_calls.append(kw)
-        fake_run_with_spinner(lambda: None, "dummy", show=kw.get("show_spinner", True))
-
-    monkeypatch.setattr(tl_mod, "launch_tool", fake_launch_tool)
-
-    tl_mod.launch_tool_batch_for_group(
-        base_url="https://x",
-        token="tok",
-        tools_cfg={},
-        tool_name="demo",
-        group_id=99,
-        show_spinner=False,
-    )
-
-    assert spinner == [False, False]
-    assert len(launch_calls) == 1
-    assert launch_calls[0]["show_spinner"] is False
-
 def test_batch_launch_injects_bids_dir(monkeypatch):
-    from bids_cbrain_runner.commands import tool_launcher as tl_mod
-
     monkeypatch.setattr(tl_mod, "CbrainClient", lambda *a, **k: object())
     monkeypatch.setattr(
         tl_mod,
@@ -283,8 +211,6 @@ def test_batch_launch_injects_bids_dir(monkeypatch):
 
 def test_batch_launch_injects_subject_dir_when_required(monkeypatch):
     """subject_dir parameter should be added when tools.yaml requests it."""
-    from bids_cbrain_runner.commands import tool_launcher as tl_mod
-
     monkeypatch.setattr(tl_mod, "CbrainClient", lambda *a, **k: object())
     monkeypatch.setattr(
         tl_mod,
@@ -314,8 +240,6 @@ def test_batch_launch_injects_subject_dir_when_required(monkeypatch):
 
 def test_batch_launch_merges_interface_ids(monkeypatch):
     """Extra interface_userfile_ids should be combined with the subject."""
-    from bids_cbrain_runner.commands import tool_launcher as tl_mod
-
     monkeypatch.setattr(tl_mod, "CbrainClient", lambda *a, **k: object())
     monkeypatch.setattr(
         tl_mod,
@@ -343,8 +267,6 @@ def test_batch_launch_merges_interface_ids(monkeypatch):
 
 
 def test_batch_launch_subset_ids(monkeypatch):
-    from bids_cbrain_runner.commands import tool_launcher as tl_mod
-
     monkeypatch.setattr(tl_mod, "CbrainClient", lambda *a, **k: object())
     monkeypatch.setattr(
         tl_mod, "list_userfiles_by_group", lambda *a, **k: [{"id": 1}, {"id": 2}]
@@ -367,8 +289,8 @@ def test_batch_launch_subset_ids(monkeypatch):
     assert launch_calls and launch_calls[0]["extra_params"]["interface_userfile_ids"] == [2]
 
 
-def test_cli_batch_userfile_ids(monkeypatch):
-    cli_mod = _setup_common(monkeypatch)
+def test_cli_batch_userfile_ids(monkeypatch, cli_mod):
+    _setup_common(monkeypatch, cli_mod)
 
     monkeypatch.setattr(
         cli_mod,
@@ -392,8 +314,7 @@ def test_cli_batch_userfile_ids(monkeypatch):
         "--launch-tool-userfile-ids",
         "1,2",
     ]
-    monkeypatch.setattr(sys, "argv", argv)
     with pytest.raises(SystemExit):
-        cli_mod.main()
+        cli_mod.main(argv[1:])
 
     assert batch_calls and batch_calls[0]["userfile_ids"] == [1, 2]
@@ -1,29 +1,6 @@
-import sys
-import types
-
-import sys
-import types
-import importlib
 import pytest
 
 
-def _import_cli_with_stubs():
-    stub = types.ModuleType('bids_cbrain_runner.api.client_openapi')
-    stub.ApiException = Exception
-    class CbrainClient:
-        def __init__(self, *a, **k):
-            pass
-    stub.CbrainClient = CbrainClient
-    stub.CbrainTaskError = Exception
-    sys.modules['bids_cbrain_runner.api.client_openapi'] = stub
-
-    # Force a fresh import so the stubbed module is used even if the CLI was
-    # previously imported by another test.
-    sys.modules.pop('bids_cbrain_runner.cli', None)
-    cli_mod = importlib.import_module('bids_cbrain_runner.cli')
-    return cli_mod
-
-
 def _common_patches(monkeypatch, cli_mod):
     monkeypatch.setattr(cli_mod, "get_sftp_provider_config", lambda provider_name=None: {})
     monkeypatch.setattr(cli_mod, "load_cbrain_config", lambda: {})
@@ -31,8 +8,7 @@ def _common_patches(monkeypatch, cli_mod):
     monkeypatch.setattr(cli_mod, "ensure_token", lambda **kw: {"cbrain_api_token": "tok", "cbrain_base_url": "https://x"})
 
 
-def test_list_userfiles_group_name(monkeypatch):
-    cli_mod = _import_cli_with_stubs()
+def test_list_userfiles_group_name(monkeypatch, cli_mod, spinner_recorder):
     _common_patches(monkeypatch, cli_mod)
 
     resolved = {}
@@ -52,25 +28,18 @@ def test_list_userfiles_group_name(monkeypatch):
         lambda client, gid, per_page=25, timeout=None: calls.append(gid) or [],
     )
 
-    spinner_calls = []
-    monkeypatch.setattr(
-        cli_mod,
-        "run_with_spinner",
-        lambda func, msg, show=True: spinner_calls.append(show) or func(),
-    )
+    monkeypatch.setattr(cli_mod, "run_with_spinner", spinner_recorder)
 
     argv = ["prog", "--list-userfiles-group", "Trial"]
-    monkeypatch.setattr(sys, "argv", argv)
 
-    cli_mod.main()
+    cli_mod.main(argv[1:])
 
     assert resolved["value"] == "Trial"
     assert calls and calls[0] == 7
-    assert spinner_calls == [True]
+    assert spinner_recorder.calls == [True]
 
 
-def test_group_and_provider_name(monkeypatch):
-    cli_mod = _import_cli_with_stubs()
+def test_group_and_provider_name(monkeypatch, cli_mod, spinner_recorder):
     _common_patches(monkeypatch, cli_mod)
 
     monkeypatch.setattr(cli_mod, "resolve_group_id", lambda *a, **k: 7)
@@ -82,18 +51,12 @@ def test_group_and_provider_name(monkeypatch):
         lambda client, gid, pid, per_page=25, timeout=None: calls.append((gid, pid)) or [],
     )
 
-    spinner_calls = []
-    monkeypatch.setattr(
-        cli_mod,
-        "run_with_spinner",
-        lambda func, msg, show=True: spinner_calls.append(show) or func(),
-    )
+    monkeypatch.setattr(cli_mod, "run_with_spinner", spinner_recorder)
 
     argv = ["prog", "--group-and-provider", "Trial", "4", "--debug-logs"]
-    monkeypatch.setattr(sys, "argv", argv)
 
-    cli_mod.main()
+    cli_mod.main(argv[1:])
 
     assert calls and calls[0] == (7, 4)
-    assert spinner_calls == [False]
+    assert spinner_recorder.calls == [False]
 
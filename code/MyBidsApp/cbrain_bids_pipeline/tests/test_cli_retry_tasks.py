@@ -1,20 +1,3 @@
-import sys
-import types
-
-
-def _import_cli_with_stubs():
-    stub = types.ModuleType('bids_cbrain_runner.api.client_openapi')
-    stub.ApiException = Exception
-    class CbrainClient:
-        pass
-    stub.CbrainClient = CbrainClient
-    stub.CbrainTaskError = Exception
-    sys.modules['bids_cbrain_runner.api.client_openapi'] = stub
-
-    from bids_cbrain_runner import cli as cli_mod
-    return cli_mod
-
-
 def _common(monkeypatch, cli_mod):
     monkeypatch.setattr(cli_mod, 'get_sftp_provider_config', lambda provider_name=None: {})
     monkeypatch.setattr(cli_mod, 'load_cbrain_config', lambda: {})
@@ -22,8 +5,7 @@ def _common(monkeypatch, cli_mod):
     monkeypatch.setattr(cli_mod, 'ensure_token', lambda **kw: {'cbrain_api_token': 'tok', 'cbrain_base_url': 'https://x'})
 
 
-def test_retry_task_single(monkeypatch):
-    cli_mod = _import_cli_with_stubs()
+def test_retry_task_single(monkeypatch, cli_mod):
     _common(monkeypatch, cli_mod)
 
     calls = []
@@ -34,15 +16,13 @@ def test_retry_task_single(monkeypatch):
     )
 
     argv = ['prog', '--retry-task', '42']
-    monkeypatch.setattr(sys, 'argv', argv)
 
-    cli_mod.main()
+    cli_mod.main(argv[1:])
 
     assert calls == [42]
 
 
-def test_retry_failed_group(monkeypatch):
-    cli_mod = _import_cli_with_stubs()
+def test_retry_failed_group(monkeypatch, cli_mod):
     _common(monkeypatch, cli_mod)
 
     monkeypatch.setattr(cli_mod, 'resolve_group_id', lambda *a, **k: 99)
@@ -55,8 +35,7 @@ def test_retry_failed_group(monkeypatch):
     )
 
     argv = ['prog', '--retry-failed', 'MyProj', '--task-type', 'DeepPrep']
-    monkeypatch.setattr(sys, 'argv', argv)
 
-    cli_mod.main()
+    cli_mod.main(argv[1:])
 
     assert calls == [(99, 'DeepPrep')]
@@ -1,18 +1,4 @@
-import sys
-import types
-
-
-def _import_cli_with_stubs():
-    stub = types.ModuleType('bids_cbrain_runner.api.client_openapi')
-    stub.ApiException = Exception
-    class CbrainClient:
-        pass
-    stub.CbrainClient = CbrainClient
-    stub.CbrainTaskError = Exception
-    sys.modules['bids_cbrain_runner.api.client_openapi'] = stub
-
-    from bids_cbrain_runner import cli as cli_mod
-    return cli_mod
+import pytest
 
 
 def _common(monkeypatch, cli_mod):
@@ -22,85 +8,35 @@ def _common(monkeypatch, cli_mod):
     monkeypatch.setattr(cli_mod, 'ensure_token', lambda **kw: {'cbrain_api_token': 'tok', 'cbrain_base_url': 'https://x'})
 
 
-def test_task_status_group(monkeypatch):
-    cli_mod = _import_cli_with_stubs()
+@pytest.mark.parametrize(
+    "resolved, argv, expected_fn, expected_arg",
+    [
+        # Group name resolves; the task type is forwarded.
+        (99, ['prog', '--task-status', 'MyProj', '--task-type', 'hippunfold'], 'show_group_tasks_status', (99, 'hippunfold')),
+        # Unknown identifier falls back to a single task ID.
+        (None, ['prog', '--task-status', '123'], 'show_task_status', 123),
+        (None, ['prog', '--task-status', '77'], 'show_task_status', 77),
+        # Numeric identifier that matches a group ID.
+        (77, ['prog', '--task-status', '77'], 'show_group_tasks_status', (77, None)),
+    ],
+)
+def test_task_status(monkeypatch, cli_mod, resolved, argv, expected_fn, expected_arg):
     _common(monkeypatch, cli_mod)
 
-    monkeypatch.setattr(cli_mod, 'resolve_group_id', lambda *a, **k: 99)
+    monkeypatch.setattr(cli_mod, 'resolve_group_id', lambda *a, **k: resolved)
 
     calls = []
     monkeypatch.setattr(
         cli_mod,
         'show_group_tasks_status',
-        lambda base_url, token, gid, *, task_type=None, per_page=100, timeout=None: calls.append((gid, task_type)),
+        lambda base_url, token, gid, *, task_type=None, per_page=100, timeout=None: calls.append(('show_group_tasks_status', (gid, task_type))),
     )
-
-    argv = ['prog', '--task-status', 'MyProj', '--task-type', 'hippunfold']
-    monkeypatch.setattr(sys, 'argv', argv)
-
-    cli_mod.main()
-
-    assert calls == [(99, 'hippunfold')]
-
-
-def test_task_status_single(monkeypatch):
-    cli_mod = _import_cli_with_stubs()
-    _common(monkeypatch, cli_mod)
-
-    monkeypatch.setattr(cli_mod, 'resolve_group_id', lambda *a, **k: None)
-
-    calls = []
     monkeypatch.setattr(
         cli_mod,
         'show_task_status',
-        lambda base_url, token, tid: calls.append(tid),
+        lambda base_url, token, tid: calls.append(('show_task_status', tid)),
     )
 
-    argv = ['prog', '--task-status', '123']
-    monkeypatch.setattr(sys, 'argv', argv)
-
-    cli_mod.main()
-
-    assert calls == [123]
-
-
-def test_task_status_group_numeric_missing(monkeypatch):
-    cli_mod = _import_cli_with_stubs()
-    _common(monkeypatch, cli_mod)
-
-    monkeypatch.setattr(cli_mod, 'resolve_group_id', lambda *a, **k: None)
-
-    calls = []
-    monkeypatch.setattr(
-        cli_mod,
-        'show_task_status',
-        lambda base_url, token, tid: calls.append(tid),
-    )
-
-    argv = ['prog', '--task-status', '77']
-    monkeypatch.setattr(sys, 'argv', argv)
-
-    cli_mod.main()
-
-    assert calls == [77]
-
-
-def test_task_status_group_numeric(monkeypatch):
-    cli_mod = _import_cli_with_stubs()
-    _common(monkeypatch, cli_mod)
-
-    monkeypatch.setattr(cli_mod, 'resolve_group_id', lambda *a, **k: 77)
-
-    calls = []
-    monkeypatch.setattr(
-        cli_mod,
-        'show_group_tasks_status',
-        lambda base_url, token, gid, *, task_type=None, per_page=100, timeout=None: calls.append(gid),
-    )
-
-    argv = ['prog', '--task-status', '77']
-    monkeypatch.setattr(sys, 'argv', argv)
-
-    cli_mod.main()
+    cli_mod.main(argv[1:])
 
-    assert calls == [77]
+    assert calls == [(expected_fn, expected_arg)]
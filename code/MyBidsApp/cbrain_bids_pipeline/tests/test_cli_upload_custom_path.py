@@ -1,22 +1,3 @@
-import sys
-import types
-
-
-def _import_cli_with_stubs():
-    stub = types.ModuleType("bids_cbrain_runner.api.client_openapi")
-    stub.ApiException = Exception
-
-    class CbrainClient: ...
-
-    stub.CbrainClient = CbrainClient
-    stub.CbrainTaskError = Exception
-    sys.modules["bids_cbrain_runner.api.client_openapi"] = stub
-
-    from bids_cbrain_runner import cli as cli_mod
-
-    return cli_mod
-
-
 def _common_patches(monkeypatch, cli_mod):
     monkeypatch.setattr(
         cli_mod, "get_sftp_provider_config", lambda provider_name=None: {}
@@ -30,8 +11,7 @@ def _common_patches(monkeypatch, cli_mod):
     )
 
 
-def test_cli_upload_remote_root_and_map(monkeypatch):
-    cli_mod = _import_cli_with_stubs()
+def test_cli_upload_remote_root_and_map(monkeypatch, cli_mod):
     _common_patches(monkeypatch, cli_mod)
 
     kwargs_list = []
@@ -52,8 +32,7 @@ def test_cli_upload_remote_root_and_map(monkeypatch):
         "--upload-path-map",
         "anat=ses-01/anat",
     ]
-    monkeypatch.setattr(sys, "argv", argv)
-    cli_mod.main()
+    cli_mod.main(argv[1:])
 
     assert kwargs_list
     assert kwargs_list[0]["remote_root"] == "fmriprep/BOLD"
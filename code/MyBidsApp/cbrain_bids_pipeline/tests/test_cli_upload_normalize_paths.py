@@ -1,4 +1,3 @@
-import sys
 from pathlib import Path
 
 import pytest
@@ -93,10 +92,9 @@ def test_cli_upload_sets_normalize_flag(monkeypatch):
         "--upload-normalize-paths",
         "--upload-dry-run",
     ]
-    monkeypatch.setattr(sys, "argv", argv)
 
     # Run the CLI; should call fake_upload_bids_and_sftp_files exactly once.
-    cli_mod.main()
+    cli_mod.main(argv[1:])
 
     assert captured, "upload_bids_and_sftp_files was not called"
 
@@ -115,11 +113,17 @@ def test_cli_upload_sets_normalize_flag(monkeypatch):
 # ---------------------------------------------------------------------------
 
 
-def test_normalize_paths_derivatives_dataset_root(tmp_path):
+@pytest.fixture(scope="module")
+def normalization_tmp(tmp_path_factory):
+    """Shared scratch directory reused by repeated runs of the test below."""
+    return tmp_path_factory.mktemp("normalize_paths", numbered=False)
+
+
+def test_normalize_paths_derivatives_dataset_root(normalization_tmp):
     """
     End‑to‑end-ish unit test for the normalization helpers:
 
-    * Create a fake BIDS dataset under tmp_path.
+    * Create a fake BIDS dataset under a shared scratch directory.
     * A .fsf file in derivatives/fsl/feat/fsf contains an *absolute* path
       to a BOLD NIfTI file under the dataset root.
     * Call _compute_normalization_root() to determine how this subtree will
@@ -130,7 +134,7 @@ def test_normalize_paths_derivatives_dataset_root(tmp_path):
           sub-002/ses-01/func/...
     """
     # Fake dataset layout
-    ds_root = tmp_path / "bids_ds"
+    ds_root = normalization_tmp / "bids_ds"
     func_dir = ds_root / "sub-002" / "ses-01" / "func"
     func_dir.mkdir(parents=True, exist_ok=True)
 
@@ -175,7 +179,7 @@ def test_normalize_paths_derivatives_dataset_root(tmp_path):
         }
     }
 
-    temp_root = tmp_path / "normalized"
+    temp_root = normalization_tmp / "normalized"
     temp_root.mkdir(parents=True, exist_ok=True)
 
     # Run the generic text normaliser
@@ -199,3 +203,24 @@ def test_normalize_paths_derivatives_dataset_root(tmp_path):
     assert expected_fragment in text, f"Expected '{expected_fragment}' in:\n{text}"
     # And the original absolute path should be gone.
     assert abs_bold not in text
+
+
+def test_normalize_json_intendedfor(tmp_path):
+    ds = tmp_path / "ds"
+    fmap = ds / "sub-01" / "fmap"
+    fmap.mkdir(parents=True)
+    bold = ds / "sub-01" / "func" / "sub-01_bold.nii.gz"
+    sidecar = fmap / "sub-01_epi.json"
+    sidecar.write_text(
+        '{"IntendedFor": ["%s"], "EchoTime": NaN}' % bold.resolve().as_posix(),
+        encoding="utf-8",
+    )
+    plain = fmap / "sub-01_magnitude.json"
+    plain.write_text('{"EchoTime": 0.03}', encoding="utf-8")
+    staging = tmp_path / "staging"
+
+    out = normalize_file_for_upload(sidecar, ds, staging)
+    assert out == staging / "sub-01" / "fmap" / "sub-01_epi.json"
+    assert '"func/sub-01_bold.nii.gz"' in out.read_text(encoding="utf-8")
+
+    assert normalize_file_for_upload(plain, ds, staging) == plain
@@ -1,22 +1,3 @@
-import sys
-import types
-
-
-def _import_cli_with_stubs():
-    stub = types.ModuleType("bids_cbrain_runner.api.client_openapi")
-    stub.ApiException = Exception
-
-    class CbrainClient: ...
-
-    stub.CbrainClient = CbrainClient
-    stub.CbrainTaskError = Exception
-    sys.modules["bids_cbrain_runner.api.client_openapi"] = stub
-
-    from bids_cbrain_runner import cli as cli_mod
-
-    return cli_mod
-
-
 def _common_patches(monkeypatch, cli_mod):
     monkeypatch.setattr(cli_mod, "get_sftp_provider_config", lambda provider_name=None: {})
     monkeypatch.setattr(cli_mod, "load_cbrain_config", lambda: {})
@@ -28,8 +9,7 @@ def _common_patches(monkeypatch, cli_mod):
     )
 
 
-def test_cli_upload_steps_stripped(monkeypatch):
-    cli_mod = _import_cli_with_stubs()
+def test_cli_upload_steps_stripped(monkeypatch, cli_mod):
     _common_patches(monkeypatch, cli_mod)
 
     up_steps = []
@@ -45,7 +25,6 @@ def test_cli_upload_steps_stripped(monkeypatch):
         "derivatives",
         "  license.txt",
     ]
-    monkeypatch.setattr(sys, "argv", argv)
-    cli_mod.main()
+    cli_mod.main(argv[1:])
 
     assert up_steps and up_steps[0] == ["derivatives", "license.txt"]
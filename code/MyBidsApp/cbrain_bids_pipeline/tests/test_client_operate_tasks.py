@@ -14,10 +14,8 @@ class DummyTasksApi:
 
 def test_operate_tasks_builds_request():
     captured: dict = {}
-    client = object.__new__(CbrainClient)
+    client = CbrainClient.from_token("https://x", "tok")
     client.tasks_api = DummyTasksApi(captured)
-    client.base_url = "https://x"
-    client.token = "tok"
 
     client.operate_tasks("delete", [1, 2], timeout=7)
 
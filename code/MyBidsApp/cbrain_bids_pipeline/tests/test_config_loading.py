@@ -3,8 +3,11 @@
 import json
 import logging
 import os
+import pickle
+import textwrap
+from pathlib import Path
 
-import yaml
+import pytest
 
 from bids_cbrain_runner import __version__
 from bids_cbrain_runner.api.config_loaders import load_pipeline_config
@@ -16,10 +19,13 @@ from bids_cbrain_runner.utils.download_utils import (
 LOG = logging.getLogger(__name__)
 
 
-def write_minimal_defaults(tmpdir):
-    """Create a minimal defaults.yaml inside a fake package install."""
-    cfg = {
-        "roots": {"derivatives_root": "derivatives"},
+# Static fixture documents, written verbatim by the helpers below.
+_DEFAULTS_JSON = textwrap.dedent(
+    """\
+    {
+        "roots": {
+            "derivatives_root": "derivatives"
+        },
         "cbrain": {
             "hippunfold": {
                 "hippunfold_output_dir": "derivatives/custom_hippunfold"
@@ -73,15 +79,12 @@ def write_minimal_defaults(tmpdir):
             }
         }
     }
-    pkg_cfg_dir = os.path.join(tmpdir, "bids_cbrain_runner", "api", "config")
-    os.makedirs(pkg_cfg_dir, exist_ok=True)
-    with open(os.path.join(pkg_cfg_dir, "defaults.yaml"), "w", encoding="utf-8") as f:
-        yaml.safe_dump(cfg, f)
-
+    """
+)
 
-def write_external_override(tmproot):
-    """Under <BIDS_ROOT>/code/config, write a config.yaml that overrides defaults."""
-    override = {
+_OVERRIDE_JSON = textwrap.dedent(
+    """\
+    {
         "cbrain": {
             "hippunfold": {
                 "hippunfold_output_dir": "derivatives/custom_hippunfold"
@@ -103,20 +106,39 @@ def write_external_override(tmproot):
             }
         }
     }
+    """
+)
+
+
+def write_minimal_defaults(tmpdir):
+    """Create a minimal defaults.json inside a fake package install."""
+    pkg_cfg_dir = Path(tmpdir) / "bids_cbrain_runner" / "api" / "config"
+    pkg_cfg_dir.mkdir(parents=True, exist_ok=True)
+    (pkg_cfg_dir / "defaults.json").write_text(_DEFAULTS_JSON, encoding="utf-8")
+
+
+def write_external_override(tmproot):
+    """Under <BIDS_ROOT>/code/config, write a config.json that overrides defaults."""
+    config_path = Path(tmproot) / "code" / "config" / "config.json"
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+    config_path.write_text(_OVERRIDE_JSON, encoding="utf-8")
+    return str(config_path)
 
-    config_dir = os.path.join(tmproot, "code", "config")
-    os.makedirs(config_dir, exist_ok=True)
-    with open(os.path.join(config_dir, "config.yaml"), "w", encoding="utf-8") as f:
-        yaml.safe_dump(override, f)
-    return os.path.join(config_dir, "config.yaml")
 
+@pytest.fixture(scope="module")
+def fake_install(tmp_path_factory):
+    """Fake package install layout holding ``defaults.json``, built once per module."""
+    root = tmp_path_factory.mktemp("fake_install")
+    write_minimal_defaults(root)
+    return root
 
-def test_pipeline_config_and_description(tmp_path, monkeypatch, caplog):
+
+def test_pipeline_config_and_description(tmp_path, fake_install, monkeypatch, caplog):
     """
     1) Create a fake install-layout under tmp_path:
-       - <tmp_path>/bids_cbrain_runner/api/config/defaults.yaml
+       - <tmp_path>/bids_cbrain_runner/api/config/defaults.json
     2) Create a fake BIDS root with dataset_description.json in a temp folder.
-    3) Put an override at <BIDS_ROOT>/code/config/config.yaml
+    3) Put an override at <BIDS_ROOT>/code/config/config.json
     4) cd into BIDS_ROOT, call load_pipeline_config(), then verify
        resolve_output_dir() and maybe_write_dataset_description().
     """
@@ -124,9 +146,8 @@ def test_pipeline_config_and_description(tmp_path, monkeypatch, caplog):
     # Capture INFO-level logs
     caplog.set_level(logging.INFO)
 
-    # 1) Fake the “installed” package by copying in a minimal defaults.yaml
-    pkg_root = tmp_path / "fake_install"
-    write_minimal_defaults(str(pkg_root))
+    # 1) Fake the “installed” package (minimal defaults.json) – see fake_install
+    pkg_root = fake_install
 
     # Monkey-patch PYTHONPATH so that imports find the fake install first
     monkeypatch.setenv("PYTHONPATH", str(pkg_root) + os.pathsep + os.environ.get("PYTHONPATH", ""))
@@ -136,11 +157,11 @@ def test_pipeline_config_and_description(tmp_path, monkeypatch, caplog):
     bids_test = tmp_path / "BIDS_test"
     bids_test.mkdir()
     ds_desc = {"Name": "MyFakeBIDS", "BIDSVersion": "1.6.0"}
-    with open(str(bids_test / "dataset_description.json"), "w", encoding="utf-8") as f:
+    with open(bids_test / "dataset_description.json", "w", encoding="utf-8") as f:
         json.dump(ds_desc, f)
 
-    # 3) Write the override config under <BIDS_ROOT>/code/config/config.yaml
-    write_external_override(str(bids_test))
+    # 3) Write the override config under <BIDS_ROOT>/code/config/config.json
+    write_external_override(bids_test)
 
     # 4) cd into BIDS_ROOT and call load_pipeline_config()
     monkeypatch.chdir(str(bids_test))
@@ -164,8 +185,8 @@ def test_pipeline_config_and_description(tmp_path, monkeypatch, caplog):
     maybe_write_dataset_description(outdir, "hippunfold", cfg, dry_run=False)
     maybe_write_dataset_description(outdir_fmriprep, "FMRIprepBidsSubject", cfg, dry_run=False)
 
-    desc_file = os.path.join(outdir, "dataset_description.json")
-    assert os.path.exists(desc_file)
+    desc_file = Path(outdir) / "dataset_description.json"
+    assert desc_file.exists()
     with open(desc_file, "r", encoding="utf-8") as f:
         dd = json.load(f)
     assert dd["Name"] == "Overridden Hippunfold Name"
@@ -173,8 +194,8 @@ def test_pipeline_config_and_description(tmp_path, monkeypatch, caplog):
         g.get("Name") == "cbrain_bids_pipeline" and g.get("Version") == __version__
         for g in dd.get("GeneratedBy", [])
     )
-    desc_file2 = os.path.join(outdir_fmriprep, "dataset_description.json")
-    assert os.path.exists(desc_file2)
+    desc_file2 = Path(outdir_fmriprep) / "dataset_description.json"
+    assert desc_file2.exists()
     with open(desc_file2, "r", encoding="utf-8") as f:
         dd2 = json.load(f)
     assert dd2["Name"] == "Overridden fMRIPrep Name"
@@ -219,3 +240,98 @@ def test_maybe_write_dataset_description_deepprep(tmp_path, monkeypatch):
     maybe_write_dataset_description(str(outdir), "deepprep", cfg, dry_run=False)
 
     assert (outdir / "dataset_description.json").exists()
+
+
+def test_load_config_cached_invalidates_on_change(tmp_path):
+    """Parsed YAML is reused until the file's stat signature changes."""
+    from bids_cbrain_runner.api import config_loaders
+
+    path = tmp_path / "cfg.yaml"
+    path.write_text('{"a": 1}\n', encoding="utf-8")
+
+    first = config_loaders._load_config_cached(str(path))
+    first["a"] = 99  # callers get a private copy
+    assert config_loaders._load_config_cached(str(path)) == {"a": 1}
+
+    path.write_text('{"a": 1, "b": {"c": [1, 2]}}\n', encoding="utf-8")
+    nested = config_loaders._load_config_cached(str(path))
+    nested["b"]["c"].append(3)
+    assert config_loaders._load_config_cached(str(path))["b"] == {"c": [1, 2]}
+
+    path.write_text('{"a": 22}\n', encoding="utf-8")
+    assert config_loaders._load_config_cached(str(path)) == {"a": 22}
+
+
+def test_load_pipeline_config_snapshot(tmp_path, monkeypatch):
+    """use_cache=True reuses the pickled snapshot until the override changes."""
+    from bids_cbrain_runner.api import config_loaders
+
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+
+    bids_root = tmp_path / "BIDS_test"
+    bids_root.mkdir()
+    (bids_root / "dataset_description.json").write_text("{}", encoding="utf-8")
+    override = write_external_override(bids_root)
+    monkeypatch.chdir(str(bids_root))
+
+    uncached = load_pipeline_config()
+    assert not cache_home.exists()
+
+    first = load_pipeline_config(use_cache=True)
+    snapshots = list((cache_home / "bids_cbrain_runner").iterdir())
+    assert len(snapshots) == 1
+    assert snapshots[0].stat().st_mode & 0o777 == 0o600
+    assert first == uncached
+
+    calls = []
+    monkeypatch.setattr(
+        config_loaders,
+        "_build_pipeline_config",
+        lambda *a: calls.append(a) or {},
+    )
+    assert load_pipeline_config(use_cache=True) == first
+    assert calls == []
+
+    with open(override, "w", encoding="utf-8") as fh:
+        json.dump({"derivatives_root": "elsewhere-but-longer"}, fh)
+    load_pipeline_config(use_cache=True)
+    assert len(calls) == 1
+
+
+def test_load_pipeline_config_ignores_corrupt_snapshot(tmp_path, monkeypatch):
+    """A truncated or foreign snapshot file is rebuilt instead of raising."""
+    from bids_cbrain_runner.api import config_loaders
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.chdir(str(tmp_path))
+
+    expected = load_pipeline_config()
+    snapshot = config_loaders._config_snapshot_path(
+        config_loaders._prefer_json_sibling(config_loaders._DEFAULTS_PATH), None
+    )
+    os.makedirs(os.path.dirname(snapshot))
+    for junk in (b"", b"not a pickle", pickle.dumps("no stamp")):
+        with open(snapshot, "wb") as fh:
+            fh.write(junk)
+        assert load_pipeline_config(use_cache=True) == expected
+
+
+def test_dataset_desc_encodes_once():
+    """DatasetDesc is hashable and its cached bytes match to_dict()."""
+    from bids_cbrain_runner.utils.download_utils import DatasetDesc
+
+    meta = json.loads(_DEFAULTS_JSON)["dataset_descriptions"]["cbrain"]["hippunfold"]
+    desc = DatasetDesc.from_config(meta, "hippunfold")
+
+    assert desc == DatasetDesc.from_config(meta, "hippunfold")
+    assert hash(desc) == hash(DatasetDesc.from_config(meta, "hippunfold"))
+    assert desc.as_bytes is desc.as_bytes
+    dd = json.loads(desc.as_bytes)
+    assert dd == desc.to_dict()
+    assert dd["Name"] == "Default Hippunfold Name"
+    assert [g["Name"] for g in dd["GeneratedBy"]] == [
+        "cbrain_bids_pipeline",
+        "Hippunfold",
+        "CBRAIN",
+    ]
@@ -13,6 +13,15 @@ class DummyClient:
         self.page_calls.append(page)
         return self.list_impl(page=page, per_page=per_page, timeout=timeout)
 
+    def list_groups_iter(self, *, per_page=25, timeout=None):
+        page = 1
+        while True:
+            groups = self.list_groups(page=page, per_page=per_page, timeout=timeout)
+            yield from groups
+            if len(groups) < per_page:
+                return
+            page += 1
+
     def create_group(self, name, description=None, *, timeout=None):
         self.created = {"name": name, "description": description, "timeout": timeout}
         return types.SimpleNamespace(id=42, name=name, description=description)
@@ -59,6 +68,8 @@ def test_create_group_paginated_existing(monkeypatch):
     res = groups_mod.create_group("https://x", "tok", "Proj-1", per_page=2)
     assert res is None
     assert client.created is None
+    # The match on page 2 stops pagination before page 3 is requested
+    assert client.page_calls == [1, 2]
 
 
 def test_resolve_group_id_by_name(monkeypatch):
@@ -3,6 +3,12 @@ import types
 
 import pytest
 
+try:
+    from orjson import dumps as _dumps
+except ImportError:  # pragma: no cover - orjson is optional
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
 import bids_cbrain_runner.api.client_openapi as client_mod
 from bids_cbrain_runner.api.client_openapi import CbrainClient, CbrainTaskError
 
@@ -24,7 +30,7 @@ def test_create_task_offline_server_error(monkeypatch):
     class DummyTasksApi:
         def tasks_post_without_preload_content(self, cbrain_task):
             payload = {"tool_config_id": ["is on an Execution Server that is currently offline"]}
-            return types.SimpleNamespace(data=json.dumps(payload).encode(), status=422)
+            return types.SimpleNamespace(data=_dumps(payload), status=422)
 
     client.tasks_api = DummyTasksApi()
 
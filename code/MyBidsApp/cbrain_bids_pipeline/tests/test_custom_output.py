@@ -0,0 +1,35 @@
+import pytest
+
+from bids_cbrain_runner.utils.custom_output import CustomOutputRenderer, _LiteralFallbackFormatter
+
+
+class DummyClient:
+    def get_userfile(self, userfile_id):
+        return {"id": userfile_id, "name": f"sub-{userfile_id:03d}"}
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "{bids_dir}-{bold_task_type}-{deepprep}",
+        "plain",
+        "{{literal}}-{bids_dir}",
+        "{run:02d}_{bids_dir!r}",
+        "{missing}",
+        "{none_value}",
+    ],
+)
+def test_render_matches_formatter(template):
+    params = {"bids_dir": 7, "bold_task_type": "rest", "run": 3, "none_value": None}
+    renderer = CustomOutputRenderer(DummyClient())
+    context = renderer._build_context(params, tool_name="deepprep")
+
+    rendered = renderer.render({"out": template}, params, tool_name="deepprep")
+
+    assert rendered["out"] == _LiteralFallbackFormatter().vformat(template, (), context)
+
+
+def test_render_resolves_userfile_names():
+    renderer = CustomOutputRenderer(DummyClient())
+    rendered = renderer.render({"out": "{bids_dir}-{tool}"}, {"bids_dir": 7}, tool_name="deepprep")
+    assert rendered == {"out": "sub-007-deepprep"}
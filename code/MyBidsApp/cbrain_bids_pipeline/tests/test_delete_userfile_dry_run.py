@@ -19,4 +19,8 @@ def test_delete_userfile_dry_run_logs_once(caplog):
     caplog.set_level(logging.INFO)
     delete_userfile(client, 42, dry_run=True)
     assert not client.deleted
-    assert caplog.text.count("[DRY] Would delete demo (ID=42)") == 1
+    matches = [
+        r for r in caplog.records
+        if r.getMessage() == "[DRY] Would delete demo (ID=42)"
+    ]
+    assert len(matches) == 1
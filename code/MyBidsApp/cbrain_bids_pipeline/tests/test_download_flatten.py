@@ -1,5 +1,12 @@
-from pathlib import Path
+import os
+import sys
+import threading
+from collections import deque
+from types import MappingProxyType
 
+import pytest
+
+from bids_cbrain_runner.commands import sftp as sftp_mod
 from bids_cbrain_runner.utils import download_utils
 
 
@@ -7,15 +14,47 @@ class DummySFTP:
     """Minimal stub mimicking Paramiko's SFTPClient."""
 
     def __init__(self):
-        self.get_calls = []
+        self.get_calls = deque()
+        self._lock = threading.Lock()
+        self._made_dirs = set()
 
     def get(self, src, dst):
-        self.get_calls.append((src, dst))
-        Path(dst).parent.mkdir(parents=True, exist_ok=True)
-        Path(dst).write_text("placeholder")
+        # Downloads may be issued from a thread pool
+        with self._lock:
+            self.get_calls.append((src, dst))
+        parent = os.path.dirname(dst)
+        if parent not in self._made_dirs:
+            os.makedirs(parent, exist_ok=True)
+            self._made_dirs.add(parent)
+        # Tests only check for existence, so an empty file suffices
+        os.close(os.open(dst, os.O_CREAT | os.O_WRONLY, 0o644))
+
+
+@pytest.fixture
+def remote_tree(monkeypatch):
+    """Serve a read-only remote tree to ``list_subdirs_and_files``.
+
+    Returns an installer taking ``{path: (subdirs, files)}``; it returns the
+    list of paths listed during the test.
+    """
+
+    def install(tree):
+        frozen = MappingProxyType(
+            {path: (tuple(dirs), tuple(files)) for path, (dirs, files) in tree.items()}
+        )
+        listed = []
+
+        def fake_listdirs(_, path):
+            listed.append(path)
+            return frozen.get(path, ((), ()))
 
+        monkeypatch.setattr(download_utils, "list_subdirs_and_files", fake_listdirs)
+        return listed
 
-def test_flattened_download(monkeypatch, tmp_path):
+    return install
+
+
+def test_flattened_download(remote_tree, tmp_path):
     # Remote tree for one HippUnfold userfile
     tree = {
         "/uf/sub-001_ses-01_hippunfold": (["hippunfold", "logs", "work"], []),
@@ -25,10 +64,7 @@ def test_flattened_download(monkeypatch, tmp_path):
         "/uf/sub-001_ses-01_hippunfold/work": ([], ["work.txt"]),
     }
 
-    def fake_listdirs(_, path):
-        return tree.get(path, ([], []))
-
-    monkeypatch.setattr(download_utils, "list_subdirs_and_files", fake_listdirs)
+    remote_tree(tree)
 
     sftp = DummySFTP()
     download_utils.flattened_download(
@@ -46,7 +82,7 @@ def test_flattened_download(monkeypatch, tmp_path):
     assert not (tmp_path / "hippunfold").exists()
 
 
-def test_flattened_download_keepdir_files(monkeypatch, tmp_path):
+def test_flattened_download_keepdir_files(remote_tree, tmp_path):
     """Files at the root of a keep-dir are copied even when subfolders exist."""
 
     tree = {
@@ -58,10 +94,7 @@ def test_flattened_download_keepdir_files(monkeypatch, tmp_path):
         "/uf/sub-001_ses-01_hippunfold/work/sub-001/ses-01": ([], ["work.txt"]),
     }
 
-    def fake_listdirs(_, path):
-        return tree.get(path, ([], []))
-
-    monkeypatch.setattr(download_utils, "list_subdirs_and_files", fake_listdirs)
+    remote_tree(tree)
 
     sftp = DummySFTP()
     download_utils.flattened_download(
@@ -77,7 +110,7 @@ def test_flattened_download_keepdir_files(monkeypatch, tmp_path):
     assert (tmp_path / "work" / "sub-001" / "ses-01" / "root.txt").exists()
 
 
-def test_flattened_download_skip_overlaps(monkeypatch, tmp_path):
+def test_flattened_download_skip_overlaps(remote_tree, tmp_path):
     """Keep-dirs also listed in skip-dirs should be ignored."""
 
     tree = {
@@ -88,10 +121,7 @@ def test_flattened_download_skip_overlaps(monkeypatch, tmp_path):
         "/uf/sub-001_ses-01_hippunfold/logs": ([], ["run.log"]),
     }
 
-    def fake_listdirs(_, path):
-        return tree.get(path, ([], []))
-
-    monkeypatch.setattr(download_utils, "list_subdirs_and_files", fake_listdirs)
+    remote_tree(tree)
 
     sftp = DummySFTP()
     download_utils.flattened_download(
@@ -108,7 +138,7 @@ def test_flattened_download_skip_overlaps(monkeypatch, tmp_path):
     assert not (tmp_path / "config").exists()
 
 
-def test_flattened_download_no_wrapper(monkeypatch, tmp_path):
+def test_flattened_download_no_wrapper(remote_tree, tmp_path):
     """Flatten outputs when the remote userfile lacks an explicit wrapper."""
 
     tree = {
@@ -120,10 +150,7 @@ def test_flattened_download_no_wrapper(monkeypatch, tmp_path):
         "/uf/sub-002-2908862/logs/20250803": ([], ["log.txt"]),
     }
 
-    def fake_listdirs(_, path):
-        return tree.get(path, ([], []))
-
-    monkeypatch.setattr(download_utils, "list_subdirs_and_files", fake_listdirs)
+    remote_tree(tree)
 
     sftp = DummySFTP()
     download_utils.flattened_download(
@@ -142,7 +169,7 @@ def test_flattened_download_no_wrapper(monkeypatch, tmp_path):
     assert (tmp_path / "CITATION.bib").exists()
 
 
-def test_flattened_download_keepdir_sourcedata(monkeypatch, tmp_path):
+def test_flattened_download_keepdir_sourcedata(remote_tree, tmp_path):
     """Keep-dirs like sourcedata are preserved when flattening."""
 
     tree = {
@@ -158,10 +185,7 @@ def test_flattened_download_keepdir_sourcedata(monkeypatch, tmp_path):
         "/uf/sub-001-3051586/sourcedata/freesurfer/sub-001/mri": ([], ["brain.mgz"]),
     }
 
-    def fake_listdirs(_, path):
-        return tree.get(path, ([], []))
-
-    monkeypatch.setattr(download_utils, "list_subdirs_and_files", fake_listdirs)
+    remote_tree(tree)
 
     sftp = DummySFTP()
     download_utils.flattened_download(
@@ -178,7 +202,7 @@ def test_flattened_download_keepdir_sourcedata(monkeypatch, tmp_path):
     assert (tmp_path / "sourcedata" / "freesurfer" / "sub-001" / "mri" / "brain.mgz").exists()
 
 
-def test_flattened_download_subject_dirs(monkeypatch, tmp_path):
+def test_flattened_download_subject_dirs(remote_tree, tmp_path):
     """Keep-dirs can be relocated under the subject hierarchy."""
 
     tree = {
@@ -191,10 +215,7 @@ def test_flattened_download_subject_dirs(monkeypatch, tmp_path):
         "/uf/sub-002-2912033/Recon/sub-002/mri": ([], ["brain.mgz"]),
     }
 
-    def fake_listdirs(_, path):
-        return tree.get(path, ([], []))
-
-    monkeypatch.setattr(download_utils, "list_subdirs_and_files", fake_listdirs)
+    remote_tree(tree)
 
     sftp = DummySFTP()
     download_utils.flattened_download(
@@ -215,7 +236,43 @@ def test_flattened_download_subject_dirs(monkeypatch, tmp_path):
     assert not (tmp_path / "Recon" / "sub-002" / "sub-002").exists()
 
 
-def test_flattened_download_subject_dirs_dataset_description(monkeypatch, tmp_path):
+@pytest.mark.parametrize(
+    "force, winner",
+    [
+        (False, "/uf/sub-002-2912033/QC/report.html"),
+        (True, "/uf/sub-002-2912033/QC/sub-002/report.html"),
+    ],
+)
+def test_flattened_download_colliding_destination_fetched_once(remote_tree, tmp_path, force, winner):
+    """Two sources mapping to one local file are fetched once, as in a serial run."""
+
+    remote_tree(
+        {
+            "/uf/sub-002-2912033": (["QC"], []),
+            "/uf/sub-002-2912033/QC": (["sub-002"], ["report.html"]),
+            "/uf/sub-002-2912033/QC/sub-002": ([], ["report.html", "sub-002.html"]),
+        }
+    )
+
+    sftp = DummySFTP()
+    download_utils.flattened_download(
+        sftp=sftp,
+        remote_dir="/uf/sub-002-2912033",
+        local_root=str(tmp_path),
+        tool_name="deepprep",
+        keep_dirs=["QC"],
+        subject_dirs=["QC"],
+        wrapper="deepprep",
+        force=force,
+        parallel_downloads=4,
+    )
+
+    report = str(tmp_path / "QC" / "sub-002" / "report.html")
+    assert [src for src, dst in sftp.get_calls if dst == report] == [winner]
+    assert len(sftp.get_calls) == 2
+
+
+def test_flattened_download_subject_dirs_dataset_description(remote_tree, tmp_path):
     """dataset_description.json in subject-dirs stays at the top level."""
 
     tree = {
@@ -224,10 +281,7 @@ def test_flattened_download_subject_dirs_dataset_description(monkeypatch, tmp_pa
         "/uf/sub-002-2912033/QC/sub-002": ([], ["sub-002.html"]),
     }
 
-    def fake_listdirs(_, path):
-        return tree.get(path, ([], []))
-
-    monkeypatch.setattr(download_utils, "list_subdirs_and_files", fake_listdirs)
+    remote_tree(tree)
 
     sftp = DummySFTP()
     download_utils.flattened_download(
@@ -245,7 +299,7 @@ def test_flattened_download_subject_dirs_dataset_description(monkeypatch, tmp_pa
     assert (tmp_path / "QC" / "sub-002" / "sub-002.html").exists()
 
 
-def test_flattened_download_path_map(monkeypatch, tmp_path):
+def test_flattened_download_path_map(remote_tree, tmp_path):
     tree = {
         "/uf/sub-002-2912033": (["BOLD"], []),
         "/uf/sub-002-2912033/BOLD": (["sub-002"], []),
@@ -253,10 +307,7 @@ def test_flattened_download_path_map(monkeypatch, tmp_path):
         "/uf/sub-002-2912033/BOLD/sub-002/anat": ([], ["sub-002_dseg.nii.gz"]),
     }
 
-    def fake_listdirs(_, path):
-        return tree.get(path, ([], []))
-
-    monkeypatch.setattr(download_utils, "list_subdirs_and_files", fake_listdirs)
+    listed = remote_tree(tree)
 
     sftp = DummySFTP()
     download_utils.flattened_download(
@@ -270,9 +321,11 @@ def test_flattened_download_path_map(monkeypatch, tmp_path):
 
     assert (tmp_path / "BOLD" / "sub-002" / "ses-01" / "anat" / "sub-002_dseg.nii.gz").exists()
     assert (tmp_path / "BOLD" / "sub-002" / "ses-02" / "anat" / "sub-002_dseg.nii.gz").exists()
+    # Fanning "anat" out to two destinations reuses its cached listing
+    assert sorted(listed) == sorted(set(listed))
 
 
-def test_flattened_download_path_map_normalize_session(monkeypatch, tmp_path):
+def test_flattened_download_path_map_normalize_session(remote_tree, tmp_path):
     tree = {
         "/uf/sub-002-2912033": (["BOLD"], []),
         "/uf/sub-002-2912033/BOLD": (["sub-002"], []),
@@ -280,10 +333,7 @@ def test_flattened_download_path_map_normalize_session(monkeypatch, tmp_path):
         "/uf/sub-002-2912033/BOLD/sub-002/anat": ([], ["sub-002_dseg.nii.gz"]),
     }
 
-    def fake_listdirs(_, path):
-        return tree.get(path, ([], []))
-
-    monkeypatch.setattr(download_utils, "list_subdirs_and_files", fake_listdirs)
+    remote_tree(tree)
 
     sftp = DummySFTP()
     download_utils.flattened_download(
@@ -314,17 +364,14 @@ def test_flattened_download_path_map_normalize_session(monkeypatch, tmp_path):
     ).exists()
 
 
-def test_flattened_download_normalize_subject(monkeypatch, tmp_path):
+def test_flattened_download_normalize_subject(remote_tree, tmp_path):
     tree = {
         "/uf/sub-001_tool": (["tool"], []),
         "/uf/sub-001_tool/tool": (["anat"], []),
         "/uf/sub-001_tool/tool/anat": ([], ["seg.nii.gz"]),
     }
 
-    def fake_listdirs(_, path):
-        return tree.get(path, ([], []))
-
-    monkeypatch.setattr(download_utils, "list_subdirs_and_files", fake_listdirs)
+    remote_tree(tree)
 
     sftp = DummySFTP()
     download_utils.flattened_download(
@@ -339,17 +386,14 @@ def test_flattened_download_normalize_subject(monkeypatch, tmp_path):
     assert (tmp_path / "sub-001" / "anat" / "sub-001_seg.nii.gz").exists()
 
 
-def test_flattened_download_normalize_session_and_subject(monkeypatch, tmp_path):
+def test_flattened_download_normalize_session_and_subject(remote_tree, tmp_path):
     tree = {
         "/uf/sub-001_ses-01_tool": (["tool"], []),
         "/uf/sub-001_ses-01_tool/tool": (["anat"], []),
         "/uf/sub-001_ses-01_tool/tool/anat": ([], ["file.gii"]),
     }
 
-    def fake_listdirs(_, path):
-        return tree.get(path, ([], []))
-
-    monkeypatch.setattr(download_utils, "list_subdirs_and_files", fake_listdirs)
+    remote_tree(tree)
 
     sftp = DummySFTP()
     download_utils.flattened_download(
@@ -369,3 +413,218 @@ def test_flattened_download_normalize_session_and_subject(monkeypatch, tmp_path)
         / "anat"
         / "sub-001_ses-01_file.gii"
     ).exists()
+
+
+def test_list_subdirs_and_files_uses_listdir_attr():
+    """Entries are classified from one listdir_attr call; only links are stat'ed."""
+    import stat
+    import types
+
+    from bids_cbrain_runner.commands.sftp import list_subdirs_and_files
+
+    def attr(name, mode):
+        return types.SimpleNamespace(filename=name, st_mode=mode)
+
+    class AttrSFTP:
+        def __init__(self):
+            self.stat_calls = []
+
+        def listdir_attr(self, path):
+            return [
+                attr("b.txt", stat.S_IFREG | 0o644),
+                attr("anat", stat.S_IFDIR | 0o755),
+                attr("link", stat.S_IFLNK | 0o777),
+            ]
+
+        def stat(self, path):
+            self.stat_calls.append(path)
+            return types.SimpleNamespace(st_mode=stat.S_IFDIR | 0o755)
+
+    sftp = AttrSFTP()
+    assert list_subdirs_and_files(sftp, "/uf") == (["anat", "link"], ["b.txt"])
+    assert sftp.stat_calls == ["/uf/link"]
+
+
+def test_list_subdirs_and_files_prefers_pipelined_listdir_iter():
+    """READDIR requests are pipelined through listdir_iter when available."""
+    import stat
+    import types
+
+    from bids_cbrain_runner.commands.sftp import list_subdirs_and_files
+
+    class IterSFTP:
+        def __init__(self):
+            self.read_aheads = None
+
+        def listdir_iter(self, path, read_aheads=50):
+            self.read_aheads = read_aheads
+            for i in range(300):
+                mode = stat.S_IFDIR if i % 100 == 0 else stat.S_IFREG
+                yield types.SimpleNamespace(filename=f"e{i:03d}", st_mode=mode | 0o755)
+
+        def listdir_attr(self, path):  # pragma: no cover - must not be used
+            raise AssertionError("listdir_attr should not be called")
+
+    sftp = IterSFTP()
+    subdirs, files = list_subdirs_and_files(sftp, "/uf")
+    assert subdirs == ["e000", "e100", "e200"]
+    assert len(files) == 297
+    assert sftp.read_aheads > 1
+
+
+def test_flattened_download_parallel_matches_serial(remote_tree, tmp_path):
+    """Concurrent fetching transfers the same (src, dst) pairs as serial."""
+
+    tree = {
+        "/uf/sub-001_ses-01_hippunfold": (["hippunfold", "logs"], []),
+        "/uf/sub-001_ses-01_hippunfold/hippunfold": (["anat"], []),
+        "/uf/sub-001_ses-01_hippunfold/hippunfold/anat": (
+            [],
+            [f"f{i}.nii.gz" for i in range(12)],
+        ),
+        "/uf/sub-001_ses-01_hippunfold/logs": ([], ["run.log"]),
+    }
+    remote_tree(tree)
+
+    calls = {}
+    for workers in (1, 4):
+        sftp = DummySFTP()
+        download_utils.flattened_download(
+            sftp=sftp,
+            remote_dir="/uf/sub-001_ses-01_hippunfold",
+            local_root=str(tmp_path / str(workers)),
+            tool_name="hippunfold",
+            keep_dirs=["logs"],
+            parallel_downloads=workers,
+        )
+        calls[workers] = {
+            (src, os.path.relpath(dst, tmp_path / str(workers)))
+            for src, dst in sftp.get_calls
+        }
+
+    assert len(calls[1]) == 13
+    assert calls[4] == calls[1]
+
+
+def test_fetch_pending_opens_one_channel_per_worker(monkeypatch, tmp_path):
+    """Workers use separate SFTP sessions from the shared transport."""
+
+    class Transport:
+        def __init__(self):
+            self.opened = []
+
+        def open_sftp_client(self):
+            client = DummySFTP()
+            client.closed = False
+            client.close = lambda: setattr(client, "closed", True)
+            self.opened.append(client)
+            return client
+
+    transport = Transport()
+    monkeypatch.setattr(sftp_mod, "open_sftp_session", lambda t: t.open_sftp_client())
+    sftp = DummySFTP()
+    sftp.get_channel = lambda: type("Chan", (), {"get_transport": lambda self: transport})()
+
+    pending = [(f"/r/{i}", str(tmp_path / f"{i}.txt")) for i in range(8)]
+    download_utils._fetch_pending(sftp, pending, workers=3)
+
+    assert len(transport.opened) == 2
+    assert all(c.closed for c in transport.opened)
+    fetched = list(sftp.get_calls) + [p for c in transport.opened for p in c.get_calls]
+    assert sorted(fetched) == sorted(pending)
+
+
+def test_dir_tokens_and_normalized_names():
+    sub, ses = download_utils._dir_tokens("/out/sub-001/ses-02/anat")
+    assert (sub, ses) == ("sub-001", "ses-02")
+    assert download_utils._dir_tokens("/out/logs") == (None, None)
+
+    name = download_utils._normalize_subject_name(sub, "T1w.nii.gz")
+    name = download_utils._normalize_session_name(ses, name)
+    assert name == "sub-001_ses-02_T1w.nii.gz"
+    assert download_utils._normalize_session_name(ses, "sub-9_ses-01_bold.nii") == "sub-9_ses-02_bold.nii"
+
+
+def test_flattened_download_creates_destination_dirs_once(monkeypatch, remote_tree, tmp_path):
+    """Destination folders are made by the download, once per directory."""
+    tree = {
+        "/uf/sub-001_ses-01_tool": (["tool"], ["report.html", "summary.json"]),
+        "/uf/sub-001_ses-01_tool/tool": (["anat"], []),
+        "/uf/sub-001_ses-01_tool/tool/anat": ([], ["a.nii.gz", "b.nii.gz", "c.nii.gz"]),
+    }
+    remote_tree(tree)
+
+    made = []
+    depth = [0]
+    real_makedirs = os.makedirs
+
+    def counting_makedirs(path, exist_ok=False):
+        # os.makedirs recurses through the patched name for missing parents;
+        # only count the outermost calls.
+        if not depth[0]:
+            made.append(path)
+        depth[0] += 1
+        try:
+            real_makedirs(path, exist_ok=exist_ok)
+        finally:
+            depth[0] -= 1
+
+    monkeypatch.setattr(download_utils.os, "makedirs", counting_makedirs)
+
+    class BareSFTP:
+        """SFTP stub that, like Paramiko, never creates local directories."""
+
+        def get(self, src, dst):
+            with open(dst, "w"):
+                pass
+
+    out = tmp_path / "out"
+    download_utils.flattened_download(
+        sftp=BareSFTP(),
+        remote_dir="/uf/sub-001_ses-01_tool",
+        local_root=str(out),
+        tool_name="tool",
+        parallel_downloads=1,
+    )
+
+    assert (out / "report.html").exists()
+    assert len(list((out / "sub-001" / "ses-01" / "anat").iterdir())) == 3
+    assert len(made) == len(set(made))
+
+
+def test_list_cached_interns_entry_names(monkeypatch):
+    # Built at runtime so the names are not already interned constants
+    fresh_dir = "".join(["sub-", "001"])
+    fresh_file = "".join(["a", ".nii"])
+    monkeypatch.setattr(
+        download_utils, "list_subdirs_and_files", lambda _, path: ([fresh_dir], [fresh_file])
+    )
+
+    cache = {}
+    subdirs, files = download_utils._list_cached(None, "/uf", cache)
+    assert subdirs[0] is sys.intern("sub-001")
+    assert files[0] is sys.intern("a.nii")
+    assert download_utils._list_cached(None, "/uf", cache) is cache["/uf"]
+
+
+def test_client_pool_never_shares_caller_client_between_slots(tmp_path):
+    """Without extra sessions the caller's client is used serially."""
+    sftp = DummySFTP()
+    pool = sftp_mod.SFTPClientPool(sftp, 3)
+    assert pool.sessions == 1
+    with pool.acquire() as first:
+        assert first is sftp
+    pool.close()
+
+    threads = set()
+    real_get = sftp.get
+
+    def recording_get(src, dst):
+        threads.add(threading.get_ident())
+        real_get(src, dst)
+
+    sftp.get = recording_get
+    pending = [(f"/r/{i}", str(tmp_path / f"{i}.txt")) for i in range(5)]
+    download_utils._fetch_pending(sftp, pending, workers=3)
+    assert list(sftp.get_calls) == pending
+    assert threads == {threading.get_ident()}
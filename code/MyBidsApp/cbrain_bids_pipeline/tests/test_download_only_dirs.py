@@ -70,3 +70,53 @@ def test_flattened_download_include_dirs(monkeypatch, tmp_path):
 
     assert (tmp_path / "sub-001" / "ses-01" / "anat" / "file.nii.gz").exists()
     assert not (tmp_path / "logs").exists()
+
+
+def test_naive_download_include_dirs_prunes_listing(monkeypatch, tmp_path):
+    """Branches outside every include pattern are never listed remotely."""
+    tree = {
+        "/remote/data": (["sub-01", "sub-02"], []),
+        "/remote/data/sub-01": (["anat", "func"], []),
+        "/remote/data/sub-01/anat": ([], ["T1w.nii.gz"]),
+        "/remote/data/sub-01/func": ([], ["bold.nii.gz"]),
+        "/remote/data/sub-02": (["anat"], []),
+        "/remote/data/sub-02/anat": ([], ["T1w.nii.gz"]),
+    }
+    listed = []
+
+    def fake_listdirs(_, path):
+        listed.append(path)
+        return tree.get(path, ([], []))
+
+    monkeypatch.setattr(download_utils, "list_subdirs_and_files", fake_listdirs)
+
+    download_utils.naive_download(
+        sftp=DummySFTP(),
+        remote_dir="/remote/data",
+        local_root=str(tmp_path),
+        include_dirs=["sub-*/anat"],
+    )
+
+    assert (tmp_path / "data" / "sub-02" / "anat" / "T1w.nii.gz").exists()
+    assert "/remote/data/sub-01/func" not in listed
+    assert not (tmp_path / "data" / "sub-01" / "func").exists()
+
+
+def test_should_include_matches_prefix_match():
+    patterns = ["sub-*/figures", "sub-*/ses-*/anat"]
+    prefixes = download_utils._include_prefixes(patterns)
+    for rel in ["sub-01", "sub-01/figures", "sub-01/ses-1/anat/x.nii", "logs", "sub-01/func"]:
+        assert download_utils.should_include(rel, patterns) == download_utils._prefix_match(
+            tuple(rel.split("/")), prefixes
+        )
+
+
+def test_glob_match_agrees_with_fnmatch_and_caches():
+    from fnmatch import fnmatchcase
+
+    names = ["sub-01", "ses-1", "anat", "sub-01_T1w.nii.gz", "[x]"]
+    patterns = ["sub-*", "ses-?", "*.nii.gz", "an[a-z]t", "[!s]*"]
+    for pat in patterns:
+        for name in names:
+            assert download_utils._glob_match(name, pat) == fnmatchcase(name, pat)
+    assert download_utils._get_pat("sub-*") is download_utils._get_pat("sub-*")
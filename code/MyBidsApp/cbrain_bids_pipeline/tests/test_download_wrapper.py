@@ -9,7 +9,7 @@ def test_download_tool_outputs_wrapper(tmp_path, monkeypatch):
     (tmp_path / "dataset_description.json").write_text("{}")
     monkeypatch.chdir(tmp_path)
 
-    monkeypatch.setattr(download_mod, "load_pipeline_config", lambda: {})
+    monkeypatch.setattr(download_mod, "load_pipeline_config", lambda **_: {})
     monkeypatch.setattr(download_mod, "load_tools_config", lambda: {"deepprep": {}})
 
     class Dummy:
@@ -44,3 +44,45 @@ def test_download_tool_outputs_wrapper(tmp_path, monkeypatch):
 
     assert calls["wrapper"] == "FileCollection"
     assert calls["local_root"].endswith(os.path.join("derivatives", "FileCollection"))
+
+
+def test_dataset_description_written_once_per_download(tmp_path, monkeypatch):
+    (tmp_path / "dataset_description.json").write_text("{}")
+    monkeypatch.chdir(tmp_path)
+
+    monkeypatch.setattr(download_mod, "load_pipeline_config", lambda **_: {})
+    monkeypatch.setattr(download_mod, "load_tools_config", lambda: {"deepprep": {}})
+
+    class Dummy:
+        def close(self):
+            pass
+
+    monkeypatch.setattr(download_mod, "sftp_connect_from_config", lambda cfg: (Dummy(), Dummy()))
+    monkeypatch.setattr(download_mod, "CbrainClient", lambda base_url, token: object())
+    monkeypatch.setattr(
+        download_mod,
+        "list_userfiles_by_group",
+        lambda client, group_id, per_page=500, timeout=None: [
+            {"id": i, "name": f"sub-{i:03d}", "type": "FileCollection"} for i in range(1, 6)
+        ],
+    )
+    monkeypatch.setattr(download_mod, "run_with_spinner", lambda func, msg, show=True: func())
+
+    desc_calls = []
+    monkeypatch.setattr(
+        download_mod, "maybe_write_dataset_description", lambda **kw: desc_calls.append(kw)
+    )
+    downloads = []
+    monkeypatch.setattr(download_mod, "flattened_download", lambda **kw: downloads.append(kw))
+
+    download_mod.download_tool_outputs(
+        base_url="x",
+        token="t",
+        cfg={},
+        tool_name="deepprep",
+        output_type="FileCollection",
+        group_id=1,
+    )
+
+    assert len(downloads) == 5
+    assert len(desc_calls) == 1
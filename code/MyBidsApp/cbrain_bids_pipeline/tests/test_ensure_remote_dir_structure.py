@@ -1,3 +1,4 @@
+import errno
 import os
 import json
 from bids_cbrain_runner.commands.upload import ensure_remote_dir_structure
@@ -16,8 +17,10 @@ class DummySFTP:
         if path not in self.existing:
             raise FileNotFoundError()
     def mkdir(self, path):
-        self.existing.add(path)
         self.mkdir_calls.append(path)
+        if path in self.existing:
+            raise OSError(errno.EEXIST, "exists", path)
+        self.existing.add(path)
 
 def test_no_derivatives_dir_for_single_file(monkeypatch, tmp_path):
     ds = tmp_path / "dataset"
@@ -163,3 +166,76 @@ def test_nested_derivatives_root_dir(monkeypatch, tmp_path):
     assert created
     assert sftp.mkdir_calls == ["/task"]
 
+
+def test_shared_known_dirs_skip_repeat_probes(monkeypatch, tmp_path):
+    ds = tmp_path / "dataset"
+    ds.mkdir()
+    (ds / "dataset_description.json").write_text("{}")
+    for ses in ("ses-01", "ses-02"):
+        (ds / "sub-01" / ses / "anat").mkdir(parents=True)
+
+    monkeypatch.chdir(ds)
+    monkeypatch.setattr(paths_mod, "load_pipeline_config", lambda: {"derivatives_root": "derivatives"})
+
+    sftp = DummySFTP()
+    stat_calls = []
+    orig_stat = sftp.stat
+
+    def counting_stat(path):
+        stat_calls.append(path)
+        return orig_stat(path)
+
+    sftp.stat = counting_stat
+    known = {"/"}
+    assert ensure_remote_dir_structure(sftp, ("sub-01", "ses-01", "anat"), known_dirs=known)
+    assert ensure_remote_dir_structure(sftp, ("sub-01", "ses-02", "anat"), known_dirs=known)
+    assert not ensure_remote_dir_structure(sftp, ("sub-01", "ses-01", "anat"), known_dirs=known)
+
+    assert len(sftp.mkdir_calls) == len(set(sftp.mkdir_calls)) == 5
+    assert stat_calls == []
+    assert sftp.getcwd() == "/sub-01/ses-01/anat"
+
+
+def test_existing_dirs_detected_without_stat(monkeypatch, tmp_path):
+    ds = tmp_path / "dataset"
+    ds.mkdir()
+    (ds / "dataset_description.json").write_text("{}")
+    (ds / "sub-01" / "anat").mkdir(parents=True)
+
+    monkeypatch.chdir(ds)
+    monkeypatch.setattr(paths_mod, "load_pipeline_config", lambda: {"derivatives_root": "derivatives"})
+
+    sftp = DummySFTP()
+    sftp.existing.add("/sub-01")
+    sftp.stat = None  # an EEXIST from mkdir must not trigger a stat
+
+    created = ensure_remote_dir_structure(sftp, ("sub-01", "anat"))
+
+    assert created
+    assert sftp.mkdir_calls == ["/sub-01", "/sub-01/anat"]
+
+
+def test_generic_mkdir_failure_falls_back_to_stat(monkeypatch, tmp_path):
+    ds = tmp_path / "dataset"
+    ds.mkdir()
+    (ds / "dataset_description.json").write_text("{}")
+    (ds / "sub-01" / "anat").mkdir(parents=True)
+
+    monkeypatch.chdir(ds)
+    monkeypatch.setattr(paths_mod, "load_pipeline_config", lambda: {"derivatives_root": "derivatives"})
+
+    sftp = DummySFTP()
+    sftp.existing.add("/sub-01")
+    orig_mkdir = sftp.mkdir
+
+    def paramiko_like_mkdir(path):
+        # Paramiko surfaces SSH_FX_FAILURE as a bare IOError without errno
+        if path in sftp.existing:
+            sftp.mkdir_calls.append(path)
+            raise IOError("Failure")
+        orig_mkdir(path)
+
+    sftp.mkdir = paramiko_like_mkdir
+
+    assert ensure_remote_dir_structure(sftp, ("sub-01", "anat"))
+    assert sftp.getcwd() == "/sub-01/anat"
@@ -16,10 +16,54 @@ def test_error_recover_failed_tasks_filters(monkeypatch):
     calls = []
     monkeypatch.setattr(
         tools_mod,
-        'error_recover_task',
-        lambda base_url, token, tid, *, timeout=None, current_status=None: calls.append((tid, current_status)),
+        'error_recover_tasks',
+        lambda base_url, token, tids, *, timeout=None, client=None: calls.append(list(tids)),
     )
 
     tools_mod.error_recover_failed_tasks('https://x', 'tok', 7)
 
-    assert calls == [(2, 'Error Recoverable'), (3, 'Failed On Cluster')]
+    assert calls == [[2, 3]]
+
+
+def test_error_recover_failed_tasks_keeps_all_failure_statuses(monkeypatch):
+    monkeypatch.setattr(tools_mod, 'CbrainClient', lambda base_url, token: object())
+    monkeypatch.setattr(
+        tools_mod,
+        'list_tasks_by_group',
+        lambda *a, **k: [
+            {'id': '4', 'status': 'Failed To Setup'},
+            {'status': 'Failed On Cluster'},
+            {'id': 5, 'status': 'Queued'},
+            {'id': 6},
+        ],
+    )
+
+    calls = []
+    monkeypatch.setattr(
+        tools_mod,
+        'error_recover_tasks',
+        lambda base_url, token, tids, *, timeout=None, client=None: calls.append(list(tids)),
+    )
+
+    tools_mod.error_recover_failed_tasks('https://x', 'tok', 7)
+
+    assert calls == [[4]]
+
+
+def test_error_recover_tasks_single_request(monkeypatch):
+    ops = []
+
+    class DummyClient:
+        def operate_tasks(self, operation, task_ids, *, timeout=None):
+            ops.append((operation, task_ids, timeout))
+
+    monkeypatch.setattr(tools_mod, 'CbrainClient', lambda base_url, token: DummyClient())
+    monkeypatch.setattr(
+        tools_mod,
+        'list_tasks_by_group',
+        lambda *a, **k: [{'id': i, 'status': 'Failed On Cluster'} for i in range(1, 101)],
+    )
+
+    tools_mod.error_recover_failed_tasks('https://x', 'tok', 7, timeout=3)
+
+    assert ops == [('recover', list(range(1, 101)), 3)]
@@ -12,3 +12,71 @@ def test_guess_filetype_fsl_design():
     }
 
     assert guess_filetype("design.fsf", cfg) == "FslDesignFile"
+
+
+def test_guess_filetype_first_pattern_wins():
+    cfg = {
+        "filetype_inference": {
+            "patterns": {
+                "sub-*_T1w.nii.gz": "NiftiFile",
+                "sub-*": "BidsSubject",
+                "*.fsf": "FslDesignFile",
+            },
+            "fallback": "SingleFile",
+        }
+    }
+    assert guess_filetype("sub-01_T1w.nii.gz", cfg) == "NiftiFile"
+    assert guess_filetype("sub-01", cfg) == "BidsSubject"
+    assert guess_filetype("design.fsf", cfg) == "FslDesignFile"
+    assert guess_filetype("README", cfg) == "SingleFile"
+
+
+def test_guess_filetypes_loads_config_once(monkeypatch):
+    from bids_cbrain_runner.utils import filetypes as filetypes_mod
+
+    loads = []
+
+    def fake_load():
+        loads.append(1)
+        return {"filetype_inference": {"fallback": "BidsSubject", "patterns": {"*.fsf": "FslDesignFile"}}}
+
+    monkeypatch.setattr(filetypes_mod, "load_pipeline_config", fake_load)
+
+    names = ["design.fsf", "sub-01", "other.fsf"]
+    assert filetypes_mod.guess_filetypes(names, {}) == ["FslDesignFile", "BidsSubject", "FslDesignFile"]
+    assert loads == [1]
+
+
+def test_guess_filetype_multi_star_glob_after_first_rule(monkeypatch):
+    import fnmatch
+    import itertools
+
+    from bids_cbrain_runner.utils import filetypes as filetypes_mod
+
+    # Python 3.9/3.10 name fnmatch's lookahead groups g0, g1, ... from a
+    # process-wide counter; emulate that so the clash shows on any version.
+    counter = itertools.count()
+    real_translate = fnmatch.translate
+
+    def translate_with_groups(pat):
+        res = real_translate(pat)
+        if pat.count("*") > 1:
+            n = next(counter)
+            res = "(?=(?P<g%d>.*?))(?P=g%d)%s" % (n, n, res)
+        return res
+
+    monkeypatch.setattr(filetypes_mod.fnmatch, "translate", translate_with_groups)
+    filetypes_mod._compile_patterns.cache_clear()
+
+    cfg = {
+        "filetype_inference": {
+            "patterns": {"*.json": "JsonFile", "sub-*_T1w*.nii*": "NiftiFile"},
+            "fallback": "SingleFile",
+        }
+    }
+    try:
+        assert guess_filetype("sub-01_T1w.nii.gz", cfg) == "NiftiFile"
+        assert guess_filetype("sub-01_T1w.json", cfg) == "JsonFile"
+        assert guess_filetype("README", cfg) == "SingleFile"
+    finally:
+        filetypes_mod._compile_patterns.cache_clear()
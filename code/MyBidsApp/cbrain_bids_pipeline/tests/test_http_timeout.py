@@ -18,7 +18,7 @@ def test_cbrain_get_env_timeout(monkeypatch):
     def fake_get(url, headers=None, params=None, timeout=None):
         called['timeout'] = timeout
         return DummyResp()
-    monkeypatch.setattr(client_mod.requests, 'get', fake_get)
+    monkeypatch.setattr(client_mod, '_SESSION', types.SimpleNamespace(get=fake_get))
     monkeypatch.setenv('CBRAIN_TIMEOUT', '7')
     client_mod.cbrain_get('https://x', 'groups', 'tok')
     assert called['timeout'] == 7.0
@@ -29,12 +29,47 @@ def test_default_timeout(monkeypatch):
     def fake_get(url, headers=None, params=None, timeout=None):
         called['timeout'] = timeout
         return DummyResp()
-    monkeypatch.setattr(client_mod.requests, 'get', fake_get)
+    monkeypatch.setattr(client_mod, '_SESSION', types.SimpleNamespace(get=fake_get))
     monkeypatch.delenv('CBRAIN_TIMEOUT', raising=False)
     client_mod.cbrain_get('https://x', 'groups', 'tok')
     assert called['timeout'] == client_mod.DEFAULT_TIMEOUT
 
 
+def test_session_reused_and_closed(monkeypatch):
+    created = []
+
+    class FakeSession:
+        def __init__(self):
+            self.mounted = {}
+            self.closed = False
+            created.append(self)
+        def mount(self, prefix, adapter):
+            self.mounted[prefix] = adapter
+        def get(self, url, headers=None, params=None, timeout=None):
+            return DummyResp()
+        def close(self):
+            self.closed = True
+
+    class FakeAdapter:
+        def __init__(self, pool_connections, pool_maxsize):
+            self.sizes = (pool_connections, pool_maxsize)
+
+    adapters = types.ModuleType('requests.adapters')
+    adapters.HTTPAdapter = FakeAdapter
+    monkeypatch.setitem(sys.modules, 'requests.adapters', adapters)
+    monkeypatch.setattr(client_mod.requests, 'Session', FakeSession, raising=False)
+    monkeypatch.setattr(client_mod, '_SESSION', None)
+
+    client_mod.cbrain_get('https://x', 'groups', 'tok')
+    client_mod.cbrain_get('https://x', 'userfiles', 'tok')
+    assert len(created) == 1
+    assert created[0].mounted['https://'].sizes == (8, 16)
+
+    client_mod.close_session()
+    assert created[0].closed
+    assert client_mod._SESSION is None
+
+
 def test_list_groups_forwards_timeout(monkeypatch):
     captured = {}
 
@@ -79,6 +114,5 @@ def test_cli_timeout_option(monkeypatch):
         lambda *a, **kw: called.setdefault('timeout', kw.get('timeout')) or [],
     )
 
-    monkeypatch.setattr(sys, 'argv', ['prog', '--list-groups', '--timeout', '3'])
-    cli_mod.main()
+    cli_mod.main(['--list-groups', '--timeout', '3'])
     assert called['timeout'] == 3.0
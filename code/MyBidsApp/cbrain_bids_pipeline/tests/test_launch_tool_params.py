@@ -215,3 +215,146 @@ def test_launch_tool_promotes_scalar_to_list_for_list_inputs(monkeypatch):
 
     payload = dummy_client.payload
     assert payload["params"]["invoke"]["surface_spaces"] == ["fsnative"]
+
+
+def test_launch_tool_fetches_descriptor_once_per_client(monkeypatch):
+    from bids_cbrain_runner.api import client_openapi as co_mod
+
+    descriptor = {"inputs": [{"id": "bids_dir", "type": "File", "optional": False}]}
+    fetched = []
+
+    class Resp:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return descriptor
+
+    def fake_get(base_url, endpoint, token, params=None, **kw):
+        fetched.append(endpoint)
+        return Resp()
+
+    monkeypatch.setattr(co_mod, "cbrain_get", fake_get)
+    monkeypatch.setattr(tl_mod, "run_with_spinner", lambda func, msg, show=True: func())
+
+    payloads = []
+
+    class RecordingClient(co_mod.CbrainClient):
+        def create_task(self, payload):
+            payloads.append(payload)
+            return {**payload, "description": "ok"}
+
+    client = RecordingClient.from_token("https://x", "tok")
+
+    tools_cfg = {
+        "deepprep": {
+            "default_cluster": "cluster",
+            "clusters": {"cluster": {"tool_config_id": 1, "bourreau_id": 2}},
+        }
+    }
+    for uf_id in (10, 11):
+        tl_mod.launch_tool(
+            base_url="https://x",
+            token="tok",
+            tools_cfg=tools_cfg,
+            tool_name="deepprep",
+            extra_params={"bids_dir": uf_id},
+            group_id=3,
+            dry_run=False,
+            show_spinner=False,
+            client=client,
+        )
+
+    assert fetched == ["tool_configs/1/boutiques_descriptor"]
+    assert [p["params"]["invoke"]["bids_dir"] for p in payloads] == [10, 11]
+
+
+def test_batch_launch_resolves_template_names_from_group_listing(monkeypatch):
+    descriptor = {
+        "inputs": [
+            {"id": "bids_dir", "type": "File", "optional": False},
+            {"id": "output_dir_name", "type": "String", "optional": True},
+        ]
+    }
+    payloads = []
+
+    class DummyClient:
+        def fetch_boutiques_descriptor(self, _):
+            return descriptor
+
+        def create_task(self, payload):
+            payloads.append(payload)
+            return {**payload, "description": "ok"}
+
+        def get_userfile(self, userfile_id):  # pragma: no cover - must not be hit
+            raise AssertionError("userfile names should come from the listing")
+
+    monkeypatch.setattr(tl_mod, "run_with_spinner", lambda func, msg, show=True: func())
+    monkeypatch.setattr(
+        tl_mod,
+        "list_userfiles_by_group",
+        lambda client, group_id, per_page=500: [
+            {"id": 7, "name": "sub-007", "type": "BidsSubject"},
+            {"id": 8, "name": "sub-008", "type": "BidsSubject"},
+        ],
+    )
+
+    tools_cfg = {
+        "deepprep": {
+            "default_cluster": "cluster",
+            "clusters": {"cluster": {"tool_config_id": 1, "bourreau_id": 2}},
+        }
+    }
+    tl_mod.launch_tool_batch_for_group(
+        base_url="https://x",
+        token="tok",
+        tools_cfg=tools_cfg,
+        tool_name="deepprep",
+        group_id=3,
+        custom_output_templates={"output_dir_name": "{bids_dir}-out"},
+        show_spinner=False,
+        client=DummyClient(),
+    )
+
+    assert [p["params"]["invoke"]["output_dir_name"] for p in payloads] == [
+        "sub-007-out",
+        "sub-008-out",
+    ]
+
+
+def test_launch_tool_skips_response_dump_when_info_disabled(monkeypatch):
+    descriptor = {"inputs": [{"id": "bids_dir", "type": "File", "optional": False}]}
+
+    class DummyClient:
+        def fetch_boutiques_descriptor(self, _):
+            return descriptor
+
+        def create_task(self, payload):
+            return {**payload, "description": "ok"}
+
+    monkeypatch.setattr(tl_mod, "CbrainClient", lambda base_url, token: DummyClient())
+    monkeypatch.setattr(tl_mod, "run_with_spinner", lambda func, msg, show=True: func())
+    monkeypatch.setattr(tl_mod.logger, "isEnabledFor", lambda level: False)
+
+    dumped = []
+    monkeypatch.setattr(tl_mod.json, "dumps", lambda *a, **k: dumped.append(a) or "")
+
+    tools_cfg = {
+        "deepprep": {
+            "default_cluster": "cluster",
+            "clusters": {"cluster": {"tool_config_id": 1, "bourreau_id": 2}},
+        }
+    }
+
+    tl_mod.launch_tool(
+        base_url="https://x",
+        token="tok",
+        tools_cfg=tools_cfg,
+        tool_name="deepprep",
+        extra_params={"bids_dir": 1},
+        group_id=3,
+        dry_run=False,
+        show_spinner=False,
+    )
+
+    assert dumped == []
@@ -1,3 +1,4 @@
+from bids_cbrain_runner.commands import tools as tools_mod
 from bids_cbrain_runner.commands.tools import list_tasks_by_group
 
 
@@ -21,3 +22,29 @@ def test_list_tasks_prefix_and_id(monkeypatch):
 
     res_id = list_tasks_by_group(dummy_client, 77, task_type="606")
     assert [t["id"] for t in res_id] == [2]
+
+
+TASKS = [
+    {"id": 1, "group_id": 7, "type": "BoutiquesTask::HippUnfold", "tool_config_id": 12},
+    {"id": 2, "group_id": 7, "type": "BoutiquesTask::DeepPrep", "tool_config_id": 30},
+    {"id": 3, "group_id": 8, "type": "BoutiquesTask::HippUnfold", "tool_config_id": 12},
+    {"id": 4, "group_id": 7, "type": "CbrainTask::Diagnostics", "tool_config_id": 5},
+]
+
+
+def _ids(monkeypatch, **kw):
+    monkeypatch.setattr(tools_mod, "fetch_all_tasks", lambda client, per_page=100, timeout=None: TASKS)
+    return [t["id"] for t in list_tasks_by_group(object(), 7, **kw)]
+
+
+def test_list_tasks_by_group_filters_group(monkeypatch):
+    assert _ids(monkeypatch) == [1, 2, 4]
+
+
+def test_list_tasks_by_group_matches_type_prefix(monkeypatch):
+    assert _ids(monkeypatch, task_type="hipp") == [1]
+    assert _ids(monkeypatch, task_type="BoutiquesTask") == [1, 2]
+
+
+def test_list_tasks_by_group_matches_tool_config_id(monkeypatch):
+    assert _ids(monkeypatch, task_type="30") == [2]
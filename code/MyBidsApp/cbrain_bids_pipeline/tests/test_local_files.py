@@ -0,0 +1,71 @@
+import os
+
+from bids_cbrain_runner.utils import local_files
+
+
+def test_local_listing_drops_ignored_entries(tmp_path):
+    (tmp_path / "sub-01").mkdir()
+    for name in ("a.json", ".DS_Store", "._a.json", "notes.DS_Store"):
+        (tmp_path / name).write_text("x")
+
+    subdirs, files = local_files.local_list_subdirs_and_files(str(tmp_path))
+
+    assert subdirs == ["sub-01"]
+    assert files == ["a.json"]
+
+
+def test_local_listing_without_ignore_globs(tmp_path):
+    (tmp_path / ".DS_Store").write_text("x")
+
+    _, files = local_files.local_list_subdirs_and_files(str(tmp_path), ignore_globs=())
+
+    assert files == [".DS_Store"]
+
+
+def test_local_tree_matches_step_globs(tmp_path):
+    for sub in ("sub-01", "sub-02"):
+        (tmp_path / sub / "anat").mkdir(parents=True)
+        (tmp_path / sub / "anat" / f"{sub}_T1w.nii.gz").write_text("x")
+    (tmp_path / "derivatives").mkdir()
+    (tmp_path / ".DS_Store").write_text("x")
+
+    tree = local_files.local_build_path_tree(tmp_path, ["sub-*", "anat"])
+
+    assert sorted(tree) == ["sub-01", "sub-02"]
+    assert tree["sub-02"]["anat"]["_files"] == ["sub-02_T1w.nii.gz"]
+
+
+def test_local_tree_lists_only_matching_branches(tmp_path, monkeypatch):
+    for sub in ("sub-01", "sub-02"):
+        for sub_dir in ("ses-01/anat", "ses-01/func", "ses-02/anat"):
+            (tmp_path / sub / sub_dir).mkdir(parents=True)
+    (tmp_path / "derivatives" / "fmriprep").mkdir(parents=True)
+
+    listed = []
+    original = local_files.local_list_subdirs_and_files
+
+    def recording(directory, ignore_globs=local_files.DEFAULT_IGNORE_GLOBS):
+        listed.append(directory)
+        return original(directory, ignore_globs)
+
+    monkeypatch.setattr(local_files, "local_list_subdirs_and_files", recording)
+
+    local_files.local_build_path_tree(tmp_path, ["sub-*", "ses-*", "anat"])
+
+    rel = sorted(os.path.relpath(d, tmp_path) for d in listed)
+    assert "derivatives" not in rel
+    assert not any(r.endswith("func") for r in rel)
+    # root + 2 subjects + 4 sessions + 4 anat leaves, each listed once
+    assert len(listed) == len(set(listed)) == 11
+
+
+def test_local_listing_follows_directory_symlinks(tmp_path):
+    target = tmp_path / "store" / "anat"
+    target.mkdir(parents=True)
+    ds = tmp_path / "ds"
+    ds.mkdir()
+    (ds / "anat").symlink_to(target, target_is_directory=True)
+    (ds / "T1w.json").write_text("{}")
+
+    assert local_files.local_list_subdirs_and_files(str(ds)) == (["anat"], ["T1w.json"])
+    assert local_files.local_list_subdirs_and_files(str(tmp_path / "missing")) == ([], [])
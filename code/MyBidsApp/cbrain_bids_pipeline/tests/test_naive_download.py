@@ -72,3 +72,35 @@ def test_naive_download_skip_files(monkeypatch, tmp_path):
     assert sftp.get_calls == [
         ("/remote/data/keep.txt", str(tmp_path / "data" / "keep.txt"))
     ]
+
+
+def test_naive_download_never_lists_skipped_dirs(monkeypatch, tmp_path):
+    tree = {
+        "/remote/data": (["keep", "skip_me"], []),
+        "/remote/data/keep": (["skip_me"], ["keep1.txt"]),
+        "/remote/data/skip_me": (["deep"], ["ignored.txt"]),
+        "/remote/data/keep/skip_me": ([], ["ignored.txt"]),
+    }
+    listed = []
+
+    def fake_listdirs(_, path):
+        listed.append(path)
+        return tree.get(path, ([], []))
+
+    monkeypatch.setattr(download_utils, "list_subdirs_and_files", fake_listdirs)
+
+    download_utils.naive_download(
+        sftp=DummySFTP(),
+        remote_dir="/remote/data",
+        local_root=str(tmp_path),
+        skip_dirs=["skip_me"],
+    )
+
+    assert listed == ["/remote/data", "/remote/data/keep"]
+
+
+def test_join_local_matches_os_path_join():
+    import os
+
+    for parent in ("", "out", "out" + os.sep, os.sep):
+        assert download_utils._join_local(parent, "a.nii.gz") == os.path.join(parent, "a.nii.gz")
@@ -0,0 +1,42 @@
+import threading
+
+from bids_cbrain_runner.utils.pagination import fetch_all_pages
+
+
+class ApiError(Exception):
+    pass
+
+
+def _pager(total, per_page, fail_on=None):
+    calls = []
+    lock = threading.Lock()
+
+    def fetch_page(num):
+        with lock:
+            calls.append(num)
+        if num == fail_on:
+            raise ApiError("boom")
+        start = (num - 1) * per_page
+        return [{"id": i} for i in range(start, min(start + per_page, total))]
+
+    return fetch_page, calls
+
+
+def test_single_page_is_one_request():
+    fetch_page, calls = _pager(total=3, per_page=5)
+    assert fetch_all_pages(fetch_page, 5) == [{"id": i} for i in range(3)]
+    assert calls == [1]
+
+
+def test_pages_concatenated_in_order():
+    fetch_page, calls = _pager(total=23, per_page=5)
+    records = fetch_all_pages(fetch_page, 5, workers=3)
+    assert [r["id"] for r in records] == list(range(23))
+    # Page 1 alone, then windows of three: (2, 3, 4), (5, 6, 7)
+    assert sorted(calls) == list(range(1, 8))
+
+
+def test_error_returns_earlier_pages():
+    fetch_page, _ = _pager(total=50, per_page=5, fail_on=3)
+    records = fetch_all_pages(fetch_page, 5, errors=(ApiError,), workers=4)
+    assert [r["id"] for r in records] == list(range(10))
@@ -49,3 +49,15 @@ def test_resolve_output_dir_cli_precedence(tmp_path):
     expected = bids_root / "derivatives" / "cli_path"
     assert out == str(expected)
     assert not (bids_root / "derivatives" / "config_path").exists()
+
+
+def test_resolve_output_dir_memo_per_config(tmp_path):
+    bids_root = tmp_path / "dataset"
+    cfg_a = {"cbrain": {"hippunfold": {"hippunfold_output_dir": "derivatives/a"}}}
+    cfg_b = {"cbrain": {"hippunfold": {"hippunfold_output_dir": "derivatives/b"}}}
+
+    for _ in range(2):
+        out_a = resolve_output_dir(str(bids_root), "hippunfold", cfg_a, dry_run=True)
+        out_b = resolve_output_dir(str(bids_root), "hippunfold", cfg_b, dry_run=True)
+        assert out_a == str(bids_root / "derivatives" / "a")
+        assert out_b == str(bids_root / "derivatives" / "b")
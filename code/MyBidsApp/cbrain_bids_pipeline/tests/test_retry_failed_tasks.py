@@ -16,7 +16,7 @@ def test_retry_failed_tasks_filters(monkeypatch):
     monkeypatch.setattr(
         tools_mod,
         'retry_task',
-        lambda base_url, token, tid, *, timeout=None, current_status=None: calls.append((tid, current_status)),
+        lambda base_url, token, tid, *, timeout=None, current_status=None, client=None: calls.append((tid, current_status)),
     )
 
     tools_mod.retry_failed_tasks('https://x', 'tok', 7)
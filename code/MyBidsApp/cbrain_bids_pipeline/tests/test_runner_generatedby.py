@@ -28,3 +28,27 @@ def test_runner_generatedby_entry(tmp_path):
         g.get("Name") == "cbrain_bids_pipeline" and g.get("Version") == __version__
         for g in dd.get("GeneratedBy", [])
     )
+
+
+def test_dataset_description_built_once_per_config(tmp_path, monkeypatch):
+    from bids_cbrain_runner.utils import download_utils
+
+    built = []
+    original = download_utils.DatasetDesc.from_config.__func__
+
+    def counting(cls, tool_meta, tool_name):
+        built.append(tool_name)
+        return original(cls, tool_meta, tool_name)
+
+    monkeypatch.setattr(download_utils.DatasetDesc, "from_config", classmethod(counting))
+
+    cfg = {"dataset_descriptions": {"cbrain": {"demo": {"name": "Demo"}}}}
+    outputs = []
+    for i in range(3):
+        outdir = tmp_path / f"out{i}"
+        outdir.mkdir()
+        maybe_write_dataset_description(outdir, "demo", cfg)
+        outputs.append((outdir / "dataset_description.json").read_bytes())
+
+    assert built == ["demo"]
+    assert outputs[0] == outputs[1] == outputs[2]
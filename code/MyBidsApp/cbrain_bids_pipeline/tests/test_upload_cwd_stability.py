@@ -75,12 +75,12 @@ def test_remote_root_unchanged_by_cwd(monkeypatch, tmp_path):
 
     # Patch configuration and network helpers.
     monkeypatch.setattr(paths_mod, "load_pipeline_config", lambda: {"derivatives_root": "derivatives"})
-    monkeypatch.setattr(upload_mod, "load_pipeline_config", lambda: {"derivatives_root": "derivatives"})
+    monkeypatch.setattr(upload_mod, "load_pipeline_config", lambda **_: {"derivatives_root": "derivatives"})
     monkeypatch.setattr(upload_mod, "bids_validator_cli", lambda steps: True)
     monkeypatch.setattr(upload_mod, "sftp_connect_from_config", lambda cfg: (dummy_ssh, dummy_sftp))
 
     # Simulate directory creation changing the SFTP CWD.
-    def fake_ensure(sftp_client, path_tuple, cfg=None, base_dir=None):
+    def fake_ensure(sftp_client, path_tuple, cfg=None, base_dir=None, known_dirs=None):
         remote_dir = upload_mod.build_remote_path(path_tuple, False, base_dir or "/", cfg=cfg)
         sftp_client.chdir(remote_dir)
         return True
@@ -95,3 +95,74 @@ def test_remote_root_unchanged_by_cwd(monkeypatch, tmp_path):
         (str(fmap_file), "/sub-01/ses-01/fmap/sub-01_ses-01_epi.nii.gz"),
     ]
 
+
+
+def test_remote_root_resolved_once(monkeypatch, tmp_path):
+    """The SFTP working directory is queried once, never per leaf."""
+
+    bids_root = tmp_path / "ds"
+    for sub in ("sub-01", "sub-02", "sub-03"):
+        anat = bids_root / sub / "anat"
+        anat.mkdir(parents=True)
+        (anat / f"{sub}_T1w.nii.gz").write_text("anat")
+    (bids_root / "dataset_description.json").write_text(json.dumps({"Name": "X"}))
+    monkeypatch.chdir(bids_root)
+
+    class CountingSFTP(DummySFTPClient):
+        def __init__(self) -> None:
+            super().__init__()
+            self.getcwd_calls = 0
+
+        def getcwd(self) -> str:
+            self.getcwd_calls += 1
+            return super().getcwd()
+
+    dummy_sftp = CountingSFTP()
+    monkeypatch.setattr(paths_mod, "load_pipeline_config", lambda: {"derivatives_root": "derivatives"})
+    monkeypatch.setattr(upload_mod, "load_pipeline_config", lambda **_: {"derivatives_root": "derivatives"})
+    monkeypatch.setattr(upload_mod, "bids_validator_cli", lambda steps: True)
+    monkeypatch.setattr(upload_mod, "sftp_connect_from_config", lambda cfg: (DummySSHClient(), dummy_sftp))
+    monkeypatch.setattr(upload_mod, "list_subdirs_and_files", lambda c, p: ([], []))
+
+    upload_mod.upload_bids_and_sftp_files({}, "", "", ["sub-*", "anat"])
+
+    assert len(dummy_sftp.put_calls) == 3
+    assert dummy_sftp.getcwd_calls <= 1
+
+
+def test_upload_reuses_caller_session(monkeypatch, tmp_path):
+    """A caller-owned session serves several uploads and stays open."""
+
+    bids_root = tmp_path / "ds"
+    for sub in ("sub-01", "sub-02"):
+        anat = bids_root / sub / "anat"
+        anat.mkdir(parents=True)
+        (anat / f"{sub}_T1w.nii.gz").write_text("anat")
+    (bids_root / "dataset_description.json").write_text(json.dumps({"Name": "X"}))
+    monkeypatch.chdir(bids_root)
+
+    class TrackingSFTP(DummySFTPClient):
+        closed = False
+
+        def close(self) -> None:
+            self.closed = True
+
+    def no_connect(cfg):  # pragma: no cover - must not be reached
+        raise AssertionError("upload should reuse the caller's session")
+
+    dummy_sftp = TrackingSFTP()
+    monkeypatch.setattr(paths_mod, "load_pipeline_config", lambda: {"derivatives_root": "derivatives"})
+    monkeypatch.setattr(upload_mod, "load_pipeline_config", lambda **_: {"derivatives_root": "derivatives"})
+    monkeypatch.setattr(upload_mod, "bids_validator_cli", lambda steps: True)
+    monkeypatch.setattr(upload_mod, "sftp_connect_from_config", no_connect)
+    monkeypatch.setattr(upload_mod, "list_subdirs_and_files", lambda c, p: ([], []))
+
+    session = (DummySSHClient(), dummy_sftp)
+    for sub in ("sub-01", "sub-02"):
+        upload_mod.upload_bids_and_sftp_files({}, "", "", [sub], session=session)
+
+    assert [r for _, r in dummy_sftp.put_calls] == [
+        "/sub-01/anat/sub-01_T1w.nii.gz",
+        "/sub-02/anat/sub-02_T1w.nii.gz",
+    ]
+    assert not dummy_sftp.closed
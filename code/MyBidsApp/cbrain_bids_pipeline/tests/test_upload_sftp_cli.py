@@ -1,4 +1,3 @@
-import sys
 import pytest
 
 from bids_cbrain_runner.commands import upload as upload_mod
@@ -52,12 +51,15 @@ def test_upload_bids_and_sftp_files(monkeypatch, tmp_path):
     monkeypatch.setattr(
         upload_mod,
         "ensure_remote_dir_structure",
-        lambda c, p, cfg=None, base_dir=None: False,
+        lambda c, p, cfg=None, base_dir=None, known_dirs=None: False,
     )
 
     reg_calls = []
     monkeypatch.setattr(upload_mod, "register_files_on_provider", lambda **kw: reg_calls.append(kw))
-    monkeypatch.setattr(upload_mod, "find_userfile_id_by_name_and_provider", lambda *a, **k: 42)
+    monkeypatch.setattr(upload_mod, "CbrainClient", lambda base_url, token: object())
+    monkeypatch.setattr(
+        upload_mod, "userfile_ids_by_name", lambda client, provider_id, timeout=None: {"sub-01": 42}
+    )
     move_calls = []
     monkeypatch.setattr(upload_mod, "update_userfile_group_and_move", lambda **kw: move_calls.append(kw))
 
@@ -109,7 +111,7 @@ def test_upload_derivative_root_with_subjects(monkeypatch, tmp_path):
     monkeypatch.setattr(
         upload_mod,
         "ensure_remote_dir_structure",
-        lambda c, p, cfg=None, base_dir=None: False,
+        lambda c, p, cfg=None, base_dir=None, known_dirs=None: False,
     )
 
     monkeypatch.chdir(str(ds))
@@ -165,7 +167,7 @@ def test_auto_filetype_dataset_description(monkeypatch, tmp_path):
     monkeypatch.setattr(
         upload_mod,
         "ensure_remote_dir_structure",
-        lambda c, p, cfg=None, base_dir=None: False,
+        lambda c, p, cfg=None, base_dir=None, known_dirs=None: False,
     )
 
     reg_calls = []
@@ -210,7 +212,7 @@ def test_auto_filetype_subject(monkeypatch, tmp_path):
     monkeypatch.setattr(
         upload_mod,
         "ensure_remote_dir_structure",
-        lambda c, p, cfg=None, base_dir=None: False,
+        lambda c, p, cfg=None, base_dir=None, known_dirs=None: False,
     )
 
     reg_calls = []
@@ -246,7 +248,7 @@ def test_register_existing_files(monkeypatch, tmp_path):
     monkeypatch.setattr(
         upload_mod,
         "ensure_remote_dir_structure",
-        lambda c, p, cfg=None, base_dir=None: False,
+        lambda c, p, cfg=None, base_dir=None, known_dirs=None: False,
     )
 
     reg_calls = []
@@ -289,18 +291,7 @@ def test_sftp_cd_steps_and_tree(monkeypatch):
     assert tree["sub-01"]["ses-01"]["anat"]["_files"] == ["file.nii.gz"]
 
 
-def test_cli_upload_and_download(monkeypatch, tmp_path):
-    import types
-    stub = types.ModuleType('bids_cbrain_runner.api.client_openapi')
-    stub.ApiException = Exception
-    class DummyClient: ...
-    class CbrainClient: ...
-    stub.CbrainClient = CbrainClient
-    stub.CbrainTaskError = Exception
-    sys.modules['bids_cbrain_runner.api.client_openapi'] = stub
-
-    from bids_cbrain_runner import cli as cli_mod
-
+def test_cli_upload_and_download(monkeypatch, tmp_path, cli_mod):
     monkeypatch.setattr(cli_mod, "get_sftp_provider_config", lambda provider_name=None: {})
     monkeypatch.setattr(cli_mod, "get_sftp_provider_config_by_id", lambda pid: {})
     monkeypatch.setattr(cli_mod, "load_cbrain_config", lambda: {})
@@ -325,8 +316,7 @@ def test_cli_upload_and_download(monkeypatch, tmp_path):
         "--upload-dp-id",
         "5",
     ]
-    monkeypatch.setattr(sys, "argv", argv)
-    cli_mod.main()
+    cli_mod.main(argv[1:])
     assert up_calls
     assert up_calls[0][0][3] == ["sub-*", "ses-*", "anat"]
 
@@ -341,27 +331,15 @@ def test_cli_upload_and_download(monkeypatch, tmp_path):
         str(tmp_path / "cfg.yaml"),
         "--force",
     ]
-    monkeypatch.setattr(sys, "argv", argv)
     with pytest.raises(SystemExit):
-        cli_mod.main()
+        cli_mod.main(argv[1:])
     assert dl_calls
     assert dl_calls[0]["group_id"] == 7
     assert dl_calls[0]["cfg"]["local_config_path"] == str(tmp_path / "cfg.yaml")
     assert dl_calls[0]["output_dir_name"] is None
 
 
-def test_cli_group_name(monkeypatch, tmp_path):
-    import types
-    stub = types.ModuleType('bids_cbrain_runner.api.client_openapi')
-    stub.ApiException = Exception
-    class DummyClient: ...
-    class CbrainClient: ...
-    stub.CbrainClient = CbrainClient
-    stub.CbrainTaskError = Exception
-    sys.modules['bids_cbrain_runner.api.client_openapi'] = stub
-
-    from bids_cbrain_runner import cli as cli_mod
-
+def test_cli_group_name(monkeypatch, tmp_path, cli_mod):
     monkeypatch.setattr(cli_mod, "get_sftp_provider_config", lambda provider_name=None: {})
     monkeypatch.setattr(cli_mod, "load_cbrain_config", lambda: {})
     monkeypatch.setattr(cli_mod, "load_tools_config", lambda: {})
@@ -383,23 +361,11 @@ def test_cli_group_name(monkeypatch, tmp_path):
         "--upload-group-id",
         "MyTrial",
     ]
-    monkeypatch.setattr(sys, "argv", argv)
-    cli_mod.main()
+    cli_mod.main(argv[1:])
     assert up_calls and up_calls[0]["group_id"] == 7
 
 
-def test_cli_upload_dp_id_switch(monkeypatch):
-    import types
-    stub = types.ModuleType('bids_cbrain_runner.api.client_openapi')
-    stub.ApiException = Exception
-    class DummyClient: ...
-    class CbrainClient: ...
-    stub.CbrainClient = CbrainClient
-    stub.CbrainTaskError = Exception
-    sys.modules['bids_cbrain_runner.api.client_openapi'] = stub
-
-    from bids_cbrain_runner import cli as cli_mod
-
+def test_cli_upload_dp_id_switch(monkeypatch, cli_mod):
     monkeypatch.setattr(cli_mod, "get_sftp_provider_config", lambda provider_name=None: {"cbrain_id": 51})
     monkeypatch.setattr(cli_mod, "get_sftp_provider_config_by_id", lambda pid: {"cbrain_id": pid})
     monkeypatch.setattr(cli_mod, "load_cbrain_config", lambda: {})
@@ -410,10 +376,131 @@ def test_cli_upload_dp_id_switch(monkeypatch):
     monkeypatch.setattr(cli_mod, "upload_bids_and_sftp_files", lambda cfg, *a, **kw: up_calls.append(cfg))
 
     argv = ["prog", "--upload-bids-and-sftp-files", "sub-*", "--upload-dp-id", "32"]
-    monkeypatch.setattr(sys, "argv", argv)
 
-    cli_mod.main()
+    cli_mod.main(argv[1:])
 
     assert up_calls and up_calls[0].get("cbrain_id") == 32
 
 
+def test_open_sftp_session_enlarges_window(monkeypatch):
+    seen = {}
+
+    def from_transport(transport, window_size=None):
+        seen.update(transport=transport, window_size=window_size)
+        return "client"
+
+    monkeypatch.setattr(sftp_mod.paramiko.SFTPClient, "from_transport", from_transport, raising=False)
+    assert sftp_mod.open_sftp_session("t") == "client"
+    assert seen == {"transport": "t", "window_size": sftp_mod._SFTP_WINDOW_SIZE}
+
+
+def test_build_sftp_path_tree_drops_unmatched_branches(monkeypatch):
+    tree_map = {
+        "/": (["sub-01", "sub-02"], ["README"]),
+        "/sub-01": (["ses-01"], []),
+        "/sub-01/ses-01": (["anat"], []),
+        "/sub-01/ses-01/anat": ([], ["T1w.nii.gz"]),
+        "/sub-02": (["figures"], []),
+    }
+    monkeypatch.setattr(sftp_mod, "list_subdirs_and_files", _fake_listdir_factory(tree_map))
+
+    tree = sftp_mod.build_sftp_path_tree(DummySFTP(), "/", ["sub-*", "ses-*"])
+
+    assert tree == {
+        "sub-01": {
+            "ses-01": {
+                "_files": [],
+                "_subdirs": ["anat"],
+                "anat": {"_files": ["T1w.nii.gz"], "_subdirs": []},
+            }
+        }
+    }
+
+
+def test_userfile_ids_by_name_lists_provider_once(monkeypatch):
+    from bids_cbrain_runner.commands import userfiles as uf_mod
+
+    calls = []
+
+    def fake_fetch(client, per_page=100, timeout=None):
+        calls.append(per_page)
+        return [
+            {"id": 1, "name": "sub-01", "data_provider_id": 5},
+            {"id": 2, "name": "sub-01", "data_provider_id": 5},
+            {"id": 3, "name": "sub-02", "data_provider_id": 6},
+            {"id": 4, "name": "sub-03", "data_provider_id": 5},
+        ]
+
+    monkeypatch.setattr(uf_mod, "fetch_all_userfiles", fake_fetch)
+
+    assert uf_mod.userfile_ids_by_name(object(), 5) == {"sub-01": 1, "sub-03": 4}
+    assert len(calls) == 1
+
+
+class ClosingClient:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_sftp_session_closes_clients_on_exit(monkeypatch):
+    ssh, sftp = ClosingClient(), ClosingClient()
+    monkeypatch.setattr(sftp_mod, "sftp_connect_from_config", lambda cfg: (ssh, sftp))
+
+    with sftp_mod.sftp_session({}) as session:
+        assert session == (ssh, sftp)
+        assert not ssh.closed and not sftp.closed
+
+    assert ssh.closed and sftp.closed
+
+
+def test_sftp_session_closes_clients_on_exception(monkeypatch):
+    ssh, sftp = ClosingClient(), ClosingClient()
+    monkeypatch.setattr(sftp_mod, "sftp_connect_from_config", lambda cfg: (ssh, sftp))
+
+    with pytest.raises(RuntimeError):
+        with sftp_mod.sftp_session({}):
+            raise RuntimeError("boom")
+
+    assert ssh.closed and sftp.closed
+
+
+def test_cli_repeated_upload_shares_one_session(monkeypatch, cli_mod):
+    monkeypatch.setattr(cli_mod, "get_sftp_provider_config", lambda provider_name=None: {})
+    monkeypatch.setattr(cli_mod, "load_cbrain_config", lambda: {})
+    monkeypatch.setattr(cli_mod, "load_tools_config", lambda: {})
+    monkeypatch.setattr(cli_mod, "ensure_token", lambda **kw: {"cbrain_api_token": "tok", "cbrain_base_url": "https://x"})
+
+    ssh, sftp = ClosingClient(), ClosingClient()
+    connects = []
+
+    def connect(cfg):
+        connects.append(cfg)
+        return ssh, sftp
+
+    monkeypatch.setattr(sftp_mod, "sftp_connect_from_config", connect)
+
+    up_calls = []
+
+    def fake_upload(cfg, base_url, token, steps, **kw):
+        assert not sftp.closed
+        up_calls.append((steps, kw["session"]))
+
+    monkeypatch.setattr(cli_mod, "upload_bids_and_sftp_files", fake_upload)
+
+    argv = [
+        "prog",
+        "--upload-bids-and-sftp-files",
+        "sub-01",
+        "anat",
+        "--upload-bids-and-sftp-files",
+        "sub-02",
+        "anat",
+    ]
+    cli_mod.main(argv[1:])
+
+    assert len(connects) == 1
+    assert up_calls == [(["sub-01", "anat"], (ssh, sftp)), (["sub-02", "anat"], (ssh, sftp))]
+    assert ssh.closed and sftp.closed
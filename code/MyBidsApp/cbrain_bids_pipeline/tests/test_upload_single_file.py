@@ -1,6 +1,5 @@
 import os
 import json
-import yaml
 
 import pytest
 
@@ -48,10 +47,10 @@ def test_upload_single_file(monkeypatch, tmp_path):
 
     monkeypatch.chdir(bids_root)
 
-    monkeypatch.setattr(upload_mod, "load_pipeline_config", lambda: {"derivatives_root": "derivatives"})
+    monkeypatch.setattr(upload_mod, "load_pipeline_config", lambda **_: {"derivatives_root": "derivatives"})
     monkeypatch.setattr(paths_mod, "load_pipeline_config", lambda: {"derivatives_root": "derivatives"})
 
-    monkeypatch.setattr(upload_mod, "load_pipeline_config", lambda: {"derivatives_root": "derivatives"})
+    monkeypatch.setattr(upload_mod, "load_pipeline_config", lambda **_: {"derivatives_root": "derivatives"})
     monkeypatch.setattr(paths_mod, "load_pipeline_config", lambda: {"derivatives_root": "derivatives"})
 
     monkeypatch.setattr(upload_mod, "bids_validator_cli", lambda steps: True)
@@ -98,7 +97,7 @@ def test_upload_file_in_subdir(monkeypatch, tmp_path):
     lic_path.write_text("MIT")
 
     monkeypatch.chdir(bids_root)
-    monkeypatch.setattr(upload_mod, "load_pipeline_config", lambda: {"derivatives_root": "derivatives"})
+    monkeypatch.setattr(upload_mod, "load_pipeline_config", lambda **_: {"derivatives_root": "derivatives"})
     monkeypatch.setattr(paths_mod, "load_pipeline_config", lambda: {"derivatives_root": "derivatives"})
     monkeypatch.setattr(upload_mod, "bids_validator_cli", lambda steps: True)
 
@@ -131,7 +130,7 @@ def test_upload_summary_file_in_subdir(monkeypatch, tmp_path):
     lic_path.write_text("MIT")
 
     monkeypatch.chdir(bids_root)
-    monkeypatch.setattr(upload_mod, "load_pipeline_config", lambda: {"derivatives_root": "derivatives"})
+    monkeypatch.setattr(upload_mod, "load_pipeline_config", lambda **_: {"derivatives_root": "derivatives"})
     monkeypatch.setattr(paths_mod, "load_pipeline_config", lambda: {"derivatives_root": "derivatives"})
     monkeypatch.setattr(upload_mod, "bids_validator_cli", lambda steps: True)
 
@@ -142,7 +141,7 @@ def test_upload_summary_file_in_subdir(monkeypatch, tmp_path):
     monkeypatch.setattr(
         upload_mod,
         "ensure_remote_dir_structure",
-        lambda c, p, cfg=None, base_dir=None: False,
+        lambda c, p, cfg=None, base_dir=None, known_dirs=None: False,
     )
 
     captured = []
@@ -155,6 +154,8 @@ def test_upload_summary_file_in_subdir(monkeypatch, tmp_path):
 
 def test_custom_derivatives_root(monkeypatch, tmp_path):
     """Changing derivatives_root should alter upload destination."""
+    import yaml  # only this test writes YAML; keep it out of collection
+
     bids_root = tmp_path / "dataset"
     bids_root.mkdir()
     (bids_root / "dataset_description.json").write_text("{}")
@@ -169,7 +170,7 @@ def test_custom_derivatives_root(monkeypatch, tmp_path):
     with open(custom_yaml, "w", encoding="utf-8") as f:
         yaml.safe_dump({"derivatives_root": "outputs"}, f)
 
-    def _load() -> dict:
+    def _load(**_) -> dict:
         with open(custom_yaml, "r", encoding="utf-8") as fh:
             return yaml.safe_load(fh) or {}
 
@@ -227,7 +228,7 @@ def test_recursive_fallback(monkeypatch, tmp_path):
     monkeypatch.setattr(
         upload_mod,
         "ensure_remote_dir_structure",
-        lambda c, p, cfg=None, base_dir=None: False,
+        lambda c, p, cfg=None, base_dir=None, known_dirs=None: False,
     )
 
     upload_mod.upload_bids_and_sftp_files({}, "", "", ["sub-*", "ses-*", "func"])
@@ -257,3 +258,68 @@ def test_missing_pattern_skips_connection(monkeypatch, tmp_path):
 
     assert not conn_called
 
+
+
+def test_upload_register_reuses_pipeline_config(monkeypatch, tmp_path):
+    from bids_cbrain_runner.utils import filetypes as filetypes_mod
+
+    bids_root = tmp_path / "dataset"
+    bids_root.mkdir()
+    (bids_root / "dataset_description.json").write_text("{}")
+    (bids_root / "sub-001").mkdir()
+    (bids_root / "sub-001" / "a.txt").write_text("x")
+
+    pipeline_cfg = {
+        "derivatives_root": "derivatives",
+        "filetype_inference": {"patterns": {"sub-*": "BidsSubject"}, "fallback": "FileCollection"},
+    }
+    loads = []
+    monkeypatch.chdir(bids_root)
+    monkeypatch.setattr(upload_mod, "load_pipeline_config", lambda **_: loads.append("upload") or pipeline_cfg)
+    monkeypatch.setattr(paths_mod, "load_pipeline_config", lambda: loads.append("paths") or pipeline_cfg)
+    monkeypatch.setattr(filetypes_mod, "load_pipeline_config", lambda: loads.append("filetypes") or pipeline_cfg)
+    monkeypatch.setattr(upload_mod, "bids_validator_cli", lambda steps: True)
+
+    dummy_sftp = DummySFTPClient()
+    monkeypatch.setattr(upload_mod, "sftp_connect_from_config", lambda cfg: (DummySSHClient(), dummy_sftp))
+
+    reg_calls = []
+    monkeypatch.setattr(upload_mod, "register_files_on_provider", lambda **kw: reg_calls.append(kw))
+
+    upload_mod.upload_bids_and_sftp_files({}, "https://x", "tok", ["sub-*"], do_register=True, dp_id=1)
+
+    assert loads == ["upload"]
+    assert reg_calls and reg_calls[0]["types"] == ["BidsSubject"]
+
+
+def test_put_pending_spreads_files_over_extra_sessions(monkeypatch):
+    from bids_cbrain_runner.commands import sftp as sftp_mod
+
+    class FlakySFTP(DummySFTPClient):
+        closed = False
+
+        def put(self, lpath, rpath):
+            if lpath == "/l/3":
+                raise OSError("boom")
+            super().put(lpath, rpath)
+
+        def close(self):
+            self.closed = True
+
+    opened = []
+
+    def open_session(transport):
+        opened.append(FlakySFTP())
+        return opened[-1]
+
+    monkeypatch.setattr(sftp_mod, "open_sftp_session", open_session)
+    main = FlakySFTP()
+    main.get_channel = lambda: type("Chan", (), {"get_transport": lambda self: object()})()
+
+    pending = [(str(i), f"/l/{i}", f"/r/{i}") for i in range(6)]
+    upload_mod._put_pending(main, pending, workers=3)
+
+    assert len(opened) == 2 and all(c.closed for c in opened)
+    assert not main.closed
+    done = main.put_calls + [c for s in opened for c in s.put_calls]
+    assert sorted(done) == [(f"/l/{i}", f"/r/{i}") for i in range(6) if i != 3]
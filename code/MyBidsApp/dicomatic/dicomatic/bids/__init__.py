@@ -5,8 +5,8 @@ The public API intentionally exposes only one helper:
 
 * :func:`dicomatic.bids.download_bids`
 
-The function lives in *dicomatic.bids.planner* but is imported on first
-access to avoid a circular-dependency chain with
+The function lives in *dicomatic.bids.planner* but is imported (and bound
+onto this package) on first access to avoid a circular-dependency chain with
 ``dicomatic.utils.bids_helpers`` during interpreter start-up.
 """
 
@@ -37,5 +37,8 @@ def __getattr__(name: str) -> Any:  # PEP 562 dynamic attribute access
     """
     if name == "download_bids":
         mod: ModuleType = import_module("dicomatic.bids.planner")
-        return getattr(mod, "download_bids")
+        value = getattr(mod, "download_bids")
+        # Bind it so later lookups hit the module dict, not this hook.
+        globals()[name] = value
+        return value
     raise AttributeError(f"module {__name__!r} has no attribute {name}")
@@ -18,9 +18,13 @@ never modified in place.
 
 from __future__ import annotations
 
-import copy
 import re
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+
+# Compiled once: these run for every subject/session token the filters see.
+_DIGITS_RE = re.compile(r"\d+")
+_SUB_CANON_RE = re.compile(r"(?:sub-)?0*(\d+)")
 
 # ------------------------------------------------------------------------- #
 # _subject_number / _session_number                                          #
@@ -33,16 +37,40 @@ from typing import Dict, List, Optional, Tuple
 
 def _subject_number(sub_label: str) -> int:
     """Return the integer part of ``sub-XXX`` for sorting purposes."""
-    m = re.search(r"\d+", sub_label)
+    m = _DIGITS_RE.search(sub_label)
     return int(m.group()) if m else 999_999
 
 
 def _session_number(ses_label: str) -> int:
     """Return the integer part of ``ses-XX`` for sorting purposes."""
-    m = re.search(r"\d+", ses_label)
+    m = _DIGITS_RE.search(ses_label)
     return int(m.group()) if m else 999_999
 
 
+# ------------------------------------------------------------------------- #
+# _canonical_sub / _canonical_ses                                            #
+# ------------------------------------------------------------------------- #
+# Normalise user-supplied subject/session tokens to their BIDS keys.  The    #
+# same few tokens recur across every --exclude-*/--filter-* flag, so the     #
+# results are memoised.                                                      #
+# ------------------------------------------------------------------------- #
+
+
+@lru_cache(maxsize=4096)
+def _canonical_sub(tok: str) -> Optional[str]:
+    """Return ``sub-XXX`` for a numeric subject token, else ``None``."""
+    m = _SUB_CANON_RE.fullmatch(tok)
+    return f"sub-{int(m.group(1)):03d}" if m else None
+
+
+@lru_cache(maxsize=4096)
+def _canonical_ses(tok: str) -> str:
+    """Return a canonical ``ses-XX`` label for *tok*."""
+    if tok.isdigit():
+        return f"ses-{int(tok):02d}"
+    return tok if tok.startswith("ses-") else f"ses-{tok}"
+
+
 # ------------------------------------------------------------------------- #
 # Public helpers                                                             #
 # ------------------------------------------------------------------------- #
@@ -60,9 +88,14 @@ def numeric_session_grouping(
     -------
     dict
         New mapping with sessions renamed in date order for every subject.
+        Subjects whose sessions are already ``ses-01``, ``ses-02`` … in
+        order keep their original session dictionary.
     """
     out: Dict[str, Dict[str, List[dict]]] = {}
     for sub, sessions in grouped.items():
+        if all(old == f"ses-{idx:02d}" for idx, old in enumerate(sessions, 1)):
+            out[sub] = sessions
+            continue
         order = sorted(sessions.keys(), key=_session_number)
         out[sub] = {f"ses-{idx:02d}": sessions[old] for idx, old in enumerate(order, 1)}
     return out
@@ -87,53 +120,44 @@ def prune_grouped_studies(
     Returns
     -------
     dict
-        Deep-copied mapping with the requested entries removed.
+        New mapping with the requested entries removed.  Only the
+        subject and session containers are copied; study dictionaries are
+        shared with *grouped*.
     """
-    out = copy.deepcopy(grouped)
+    out = {sub: {ses: list(lst) for ses, lst in sess.items()} for sub, sess in grouped.items()}
 
     # -- 1. Drop entire subjects -------------------------------------
-    for s in exclude_subjects:
-        if m := re.fullmatch(r"(?:sub-)?0*(\d+)", s):
-            out.pop(f"sub-{int(m.group(1)):03d}", None)
+    drop_subs = {_canonical_sub(s) for s in exclude_subjects}
+    for sub_key in drop_subs & out.keys():
+        del out[sub_key]
 
     # -- 2. Drop specific subject/session pairs ----------------------
     for sub, ses in exclude_sessions:
-        if not (m := re.fullmatch(r"(?:sub-)?0*(\d+)", sub)):
+        if not (sub_key := _canonical_sub(sub)):
             continue
-        sub_key = f"sub-{int(m.group(1)):03d}"
-        ses_key = (
-            f"ses-{int(ses):02d}"
-            if ses.isdigit()
-            else (ses if ses.startswith("ses-") else f"ses-{ses}")
-        )
-        out.get(sub_key, {}).pop(ses_key, None)
+        out.get(sub_key, {}).pop(_canonical_ses(ses), None)
         if not out.get(sub_key):
             out.pop(sub_key, None)
 
-    # -- 3. Drop studies by patient name -----------------------------
-    if exclude_patients:
-        for sub_key, sessions in list(out.items()):
-            for ses_key, lst in list(sessions.items()):
-                kept = [st for st in lst if st.get("patient_name") not in exclude_patients]
-                if kept:
-                    sessions[ses_key] = kept
-                else:
-                    sessions.pop(ses_key)
-            if not sessions:
-                out.pop(sub_key)
-
-    # -- 4. Drop studies by UID --------------------------------------
-    drop_uids = set(exclude_uids or [])
-    if drop_uids:
-        for sub_key, sessions in list(out.items()):
-            for ses_key, lst in list(sessions.items()):
-                kept = [st for st in lst if st.get("study_uid") not in drop_uids]
+    # -- 3. Drop studies by patient name or UID (one pass) -----------
+    drop_patients = set(exclude_patients or ())
+    drop_uids = set(exclude_uids or ())
+    if drop_patients or drop_uids:
+        for sub_key in list(out):
+            sessions = out[sub_key]
+            for ses_key in list(sessions):
+                kept = [
+                    st
+                    for st in sessions[ses_key]
+                    if st.get("patient_name") not in drop_patients
+                    and st.get("study_uid") not in drop_uids
+                ]
                 if kept:
                     sessions[ses_key] = kept
                 else:
-                    sessions.pop(ses_key)
+                    del sessions[ses_key]
             if not sessions:
-                out.pop(sub_key)
+                del out[sub_key]
 
     return out
 
@@ -163,31 +187,31 @@ def filter_grouped_studies(
         dict: Deep-copied mapping containing only studies that satisfy every
         filter.
     """
-    # Canonicalise subject filters to BIDS form.
-    wanted_subs = {
-        f"sub-{int(m.group(1)):03d}"
-        for s in include_subjects
-        if (m := re.fullmatch(r"(?:sub-)?0*(\d+)", s))
-    }
+    # No filters: keep every non-empty session without building lookups.
+    if not (include_subjects or include_sessions or include_patients):
+        return {
+            sub_key: kept
+            for sub_key, sessions in grouped.items()
+            if (kept := {ses_key: lst for ses_key, lst in sessions.items() if lst})
+        }
 
-    def _norm_ses(tok: str) -> str:
-        """Return a canonical ``ses-XX`` label for *tok*."""
-        return (
-            f"ses-{int(tok):02d}"
-            if tok.isdigit()
-            else tok if tok.startswith("ses-")
-            else f"ses-{tok}"
-        )
-
-    # Pre-compute normalised session filters.
-    include_sess: List[Tuple[Optional[str], str]] = []
+    # Canonicalise subject filters to BIDS form.
+    wanted_subs = {_canonical_sub(s) for s in include_subjects}
+    wanted_subs.discard(None)
+
+    # Pre-compute normalised session filters as lookup tables: sessions
+    # allowed for any subject, and sessions pinned to a specific subject.
+    # Subjects that do not canonicalise act as wildcards.
+    wildcard_ses: Set[str] = set()
+    pinned_ses: Dict[str, Set[str]] = {}
     for sub, ses in include_sessions:
-        if sub is None:
-            sub_key = None  # wildcard
+        sub_key = None if sub is None else _canonical_sub(sub)
+        if sub_key is None:
+            wildcard_ses.add(_canonical_ses(ses))
         else:
-            m = re.fullmatch(r"(?:sub-)?0*(\d+)", sub)
-            sub_key = f"sub-{int(m.group(1)):03d}" if m else None
-        include_sess.append((sub_key, _norm_ses(ses)))
+            pinned_ses.setdefault(sub_key, set()).add(_canonical_ses(ses))
+
+    wanted_patients = set(include_patients)
 
     out: Dict[str, Dict[str, List[dict]]] = {}
     for sub_key, sessions in grouped.items():
@@ -198,17 +222,16 @@ def filter_grouped_studies(
         kept: Dict[str, List[dict]] = {}
         for ses_key, lst in sessions.items():
             # Session-level filtering.
-            if include_sess:
-                allowed = any(
-                    (inc_sub is None or inc_sub == sub_key) and inc_ses == ses_key
-                    for inc_sub, inc_ses in include_sess
-                )
-                if not allowed:
-                    continue
+            if (
+                include_sessions
+                and ses_key not in wildcard_ses
+                and ses_key not in pinned_ses.get(sub_key, ())
+            ):
+                continue
 
             # Patient-level filtering.
-            if include_patients:
-                lst = [st for st in lst if st.get("patient_name") in include_patients]
+            if wanted_patients:
+                lst = [st for st in lst if st.get("patient_name") in wanted_patients]
 
             if lst:
                 kept[ses_key] = lst
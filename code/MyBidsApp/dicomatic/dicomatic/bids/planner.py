@@ -17,13 +17,16 @@ Key design notes
 from __future__ import annotations
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import click
 from click import Context
 
-from dicomatic.models import DownloadPlan as MetaPlan
+from dicomatic.models import DownloadPlan
 from dicomatic.utils.bids_helpers import group_studies_by_bids
 from dicomatic.utils.display import (
     display_grouped_studies,
@@ -46,6 +49,65 @@ from dicomatic.bids.filters import (
     prune_grouped_studies,
 )
 
+# --------------------------------------------------------------------------- #
+# Internal helpers                                                            #
+# --------------------------------------------------------------------------- #
+def _download_plans(plans: List[DownloadPlan], cfg: Any, workers: int = 1) -> None:
+    """Run :func:`download_study` for every plan, *workers* at a time.
+
+    Plans that share a destination directory always run on the same worker
+    in their original order, so the "already downloaded" check in
+    :func:`download_study` sees the same directory state as a serial run.
+
+    With several workers each plan's header and status lines are buffered
+    and printed as one block once that plan finishes, so output from
+    concurrent downloads does not interleave.  In verbose mode cfmm2tar's
+    own stdout/stderr is still streamed live and may interleave.
+
+    Args:
+        plans: Download plans in display order.
+        cfg: Configuration namespace handed to :func:`download_study`.
+        workers: Number of concurrent cfmm2tar containers.
+    """
+    total = len(plans)
+    verbose = getattr(cfg, "verbose", False)
+    echo_lock = threading.Lock()
+
+    def _run(batch: List[Tuple[int, DownloadPlan]], buffered: bool) -> None:
+        for i, plan in batch:
+            header = f"\n-- [{i}/{total}] {plan.sub_label} | {plan.ses_label}"
+            lines: List[str] = [header]
+            echo = lines.append if buffered else click.echo
+            if not buffered:
+                click.echo(header)
+            try:
+                download_study(
+                    study=plan.study,
+                    cfg=cfg,
+                    target_dir=plan.path.parent,
+                    dry_run=False,
+                    verbose=verbose,
+                    echo=echo,
+                )
+            finally:
+                if buffered:
+                    with echo_lock:
+                        click.echo("\n".join(lines))
+
+    numbered = list(enumerate(plans, 1))
+    if workers <= 1:
+        _run(numbered, buffered=False)
+        return
+
+    by_dir: Dict[Path, List[Tuple[int, DownloadPlan]]] = {}
+    for i, plan in numbered:
+        by_dir.setdefault(plan.path.parent, []).append((i, plan))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for fut in [pool.submit(_run, batch, True) for batch in by_dir.values()]:
+            fut.result()
+
+
 # --------------------------------------------------------------------------- #
 # Public API                                                                  #
 # --------------------------------------------------------------------------- #
@@ -69,6 +131,7 @@ def download_bids(  # noqa: C901 – function is inherently busy as an orchestra
     no_session_dirs: bool,
     download: bool,
     create_metadata: Optional[bool],
+    parallel_downloads: Optional[int] = None,
 ):
     """End-to-end workflow for the ``bids`` sub-command.
 
@@ -106,6 +169,9 @@ def download_bids(  # noqa: C901 – function is inherently busy as an orchestra
         as a display-only command.
     create_metadata:
         Override YAML ``create_dicom_metadata`` when not *None*.
+    parallel_downloads:
+        Number of studies to download concurrently.  Falls back to YAML
+        ``dicom.parallel_downloads`` and then to serial downloads.
 
     Returns
     -------
@@ -118,9 +184,11 @@ def download_bids(  # noqa: C901 – function is inherently busy as an orchestra
     # ------------------------------------------------------------------ #
     desc, studies = fetch_studies_interactive(ctx, desc)
 
-    # Early UID exclusion speeds up subsequent grouping operations
-    if exclude_uids:
-        studies = [s for s in studies if s.get("study_uid") not in exclude_uids]
+    # Early UID exclusion speeds up subsequent grouping operations.  It is
+    # the only UID pass: nothing below re-introduces the dropped studies.
+    drop_uids = set(exclude_uids or ())
+    if drop_uids:
+        studies = [s for s in studies if s.get("study_uid") not in drop_uids]
 
     # ------------------------------------------------------------------ #
     # 2. Build session map and group studies by subject/session          #
@@ -149,15 +217,16 @@ def download_bids(  # noqa: C901 – function is inherently busy as an orchestra
     # ------------------------------------------------------------------ #
     # 4. Apply negative filters (exclude-*)                              #
     # ------------------------------------------------------------------ #
-    parsed_excl: List[Tuple[str, str]] = [
-        tuple(spec.split(":", 1)) for spec in exclude_sessions if ":" in spec
-    ]
+    parsed_excl: List[Tuple[str, str]] = []
+    for spec in exclude_sessions:
+        sub, sep, ses = spec.partition(":")
+        if sep:
+            parsed_excl.append((sub, ses))
     grouped = prune_grouped_studies(
         grouped,
         exclude_subjects=list(exclude_subjects),
         exclude_sessions=parsed_excl,
         exclude_patients=list(exclude_patients),
-        exclude_uids=list(exclude_uids),
     )
 
     # ------------------------------------------------------------------ #
@@ -181,9 +250,9 @@ def download_bids(  # noqa: C901 – function is inherently busy as an orchestra
     # ------------------------------------------------------------------ #
     for sub_key, sessions in grouped.items():
         for ses_key, lst in sessions.items():
+            stamp = {"sub_label": sub_key, "ses_label": ses_key}
             for st in lst:
-                st["sub_label"] = sub_key
-                st["ses_label"] = ses_key
+                st.update(stamp)
 
     # ------------------------------------------------------------------ #
     # 8. Determine BIDS and data roots                                   #
@@ -211,20 +280,20 @@ def download_bids(  # noqa: C901 – function is inherently busy as an orchestra
     # 10. Download studies and optionally write metadata                 #
     # ------------------------------------------------------------------ #
     if download:
-        all_studies = [s for subs in grouped.values() for sess in subs.values() for s in sess]
+        # build_plans walks the studies more than once, so materialise them.
+        all_studies = list(
+            chain.from_iterable(sess for subs in grouped.values() for sess in subs.values())
+        )
         plans = build_plans(studies=all_studies, bids_root=data_root, flatten=not use_session_dirs)
 
         summarize_downloads(plans, include_session=use_session_dirs)
 
-        for i, plan in enumerate(plans, 1):
-            click.echo(f"\n-- [{i}/{len(plans)}] {plan.sub_label} | {plan.ses_label}")
-            download_study(
-                study=plan.study,
-                cfg=ctx.obj,
-                target_dir=plan.path.parent,
-                dry_run=False,
-                verbose=getattr(ctx.obj, "verbose", False),
-            )
+        workers = (
+            parallel_downloads
+            or getattr(getattr(ctx.obj, "dicom", None), "parallel_downloads", None)
+            or 1
+        )
+        _download_plans(plans, ctx.obj, workers=int(workers))
 
         # Metadata manifest update (conditional)
         write_meta = (
@@ -236,8 +305,8 @@ def download_bids(  # noqa: C901 – function is inherently busy as an orchestra
             cfmm2tar_ver = os.getenv("DICOMATIC_CFMM2TAR_VERSION", "")
             meta_path = data_root / "metadata.json"
 
-            meta_plans: List[MetaPlan] = [
-                MetaPlan(study=p.study, path=p.path, sub_label=p.sub_label, ses_label=p.ses_label)
+            meta_plans: List[DownloadPlan] = [
+                DownloadPlan(study=p.study, path=p.path, sub_label=p.sub_label, ses_label=p.ses_label)
                 for p in plans
             ]
             write_metadata(meta_plans, str(meta_path), cfmm2tar_ver)
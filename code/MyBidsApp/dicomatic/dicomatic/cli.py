@@ -4,10 +4,12 @@ Command-line interface entry point for *dicomatic*.
 The module configures global options, loads the YAML configuration, and
 registers sub-commands that implement distinct workflows (query, bids
 grouping, patient lookup, direct downloads, and metadata generation).
+Sub-command modules are imported only when the command is resolved.
 """
 
 from __future__ import annotations
 
+import importlib
 import logging
 import os
 from types import SimpleNamespace
@@ -16,16 +18,45 @@ from dicomatic import __version__
 
 import click
 
-from dicomatic.commands.bids import bids as bids_cmd
-from dicomatic.commands.download import download as download_cmd
-from dicomatic.commands.metadata import metadata as metadata_cmd
-from dicomatic.commands.patients import patients as patients_cmd
-from dicomatic.commands.query import query as query_cmd
 from dicomatic.config_loader import load_config
 from dicomatic.utils.auth import ensure_authenticated
 from dicomatic.utils.prompts import _interactive_menu
 
 
+class LazyGroup(click.Group):
+    """Click group that imports sub-commands on first use.
+
+    ``--help`` and ``--version`` therefore do not pay for importing the
+    planner, download and metadata machinery behind every sub-command.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialise the base class and prepare the lazy registry."""
+        self._lazy: dict[str, str] = {}
+        super().__init__(*args, **kwargs)
+
+    def set_lazy_command(self, name: str, target: str) -> None:
+        """Register *name* to be imported from ``module:attr`` *target*."""
+        self._lazy[name] = target
+
+    def list_commands(self, ctx):  # noqa: D401 - Click signature
+        """Return eager and lazy command names in sorted order."""
+        return sorted(set(super().list_commands(ctx)) | self._lazy.keys())
+
+    def get_command(self, ctx, cmd_name):  # noqa: D401 - Click signature
+        """Resolve *cmd_name* from the eager map or import table."""
+        cmd = super().get_command(ctx, cmd_name)
+        if cmd is not None:
+            return cmd
+        target = self._lazy.get(cmd_name)
+        if not target:
+            return None
+        module_name, attr = target.split(":", 1)
+        cmd = getattr(importlib.import_module(module_name), attr)
+        self.add_command(cmd, name=cmd_name)
+        return cmd
+
+
 def _common_options(func):
     """Attach global CLI flags shared by every sub-command.
 
@@ -70,7 +101,7 @@ def _common_options(func):
     return func
 
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, invoke_without_command=True)
 @click.version_option(__version__)
 @_common_options
 @click.pass_context
@@ -151,14 +182,14 @@ def cli(  # noqa: D401 – imperative form is acceptable for CLI description
 
 
 # --------------------------------------------------------------------- #
-# Sub-command registration.  Defining them here avoids circular imports #
-# caused by Click’s lazy loading.                                       #
+# Sub-command registration.  Modules are imported only when a command   #
+# is resolved, keeping ``--help`` and ``--version`` cheap.              #
 # --------------------------------------------------------------------- #
-cli.add_command(query_cmd)
-cli.add_command(patients_cmd)
-cli.add_command(bids_cmd)
-cli.add_command(download_cmd)
-cli.add_command(metadata_cmd)  # metadata sub-command
+cli.set_lazy_command("query", "dicomatic.commands.query:query")
+cli.set_lazy_command("patients", "dicomatic.commands.patients:patients")
+cli.set_lazy_command("bids", "dicomatic.commands.bids:bids")
+cli.set_lazy_command("download", "dicomatic.commands.download:download")
+cli.set_lazy_command("metadata", "dicomatic.commands.metadata:metadata")
 
 if __name__ == "__main__":
     cli()
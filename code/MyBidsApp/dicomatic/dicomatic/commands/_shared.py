@@ -11,6 +11,8 @@ from __future__ import annotations
 
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 
 import click
@@ -24,6 +26,15 @@ from dicomatic.utils.prompts import prompt_yes_no
 
 log = logging.getLogger(__name__)
 
+# Upper bound on concurrent per-UID ``findscu`` calls unless overridden via
+# ``dicom.max_parallel``.
+_MAX_PARALLEL_QUERIES = 8
+
+# ``fetch_studies`` results keyed by (server, port, description), stored as
+# (monotonic timestamp, studies).  Entries expire after ``_STUDY_CACHE_TTL``.
+_STUDY_CACHE: Dict[Tuple[Any, Any, str], Tuple[float, List[Dict[str, str]]]] = {}
+_STUDY_CACHE_TTL = 60.0
+
 
 def _normalise_description(value: Any) -> Optional[str]:
     """Return a clean ``StudyDescription`` string or ``None`` when missing.
@@ -69,9 +80,29 @@ def _normalise_description(value: Any) -> Optional[str]:
 # --------------------------------------------------------------------------- #
 # Core study-fetching helpers                                                 #
 # --------------------------------------------------------------------------- #
+def _findscu_cmd(cfg: Any, filters: Dict[str, str]) -> List[str]:
+    """Return the ``findscu`` command for *filters* using ``cfg.dicom``."""
+    dic = cfg.dicom
+    return build_findscu(
+        container=dic.container,
+        bind=dic.bind,
+        server=dic.server,
+        port=dic.port,
+        tls=dic.tls,
+        username=dic.username,
+        password=dic.password,
+        query_tags=cfg.dicom_query_tags,
+        filters=filters,
+    )
+
+
 def fetch_studies(ctx: Context, description: str) -> List[Dict[str, str]]:
     """Return studies matching ``StudyDescription``.
 
+    Non-empty results are reused for ``_STUDY_CACHE_TTL`` seconds, so
+    repeating a description (e.g. in the interactive menu) skips the PACS
+    round-trip.  Callers receive fresh copies of the cached dictionaries.
+
     Args:
         ctx: Click context; ``ctx.obj`` holds the merged configuration.
         description: PACS ``StudyDescription`` value to query for.
@@ -81,23 +112,15 @@ def fetch_studies(ctx: Context, description: str) -> List[Dict[str, str]]:
         :func:`dicomatic.query.parser.parse_studies_with_demographics`.
     """
     cfg = ctx.obj
-    dic = cfg.dicom
-    tags = cfg.dicom_query_tags
-    tag_map = cfg.dicom_tag_map
+    key = (cfg.dicom.server, cfg.dicom.port, description)
+    now = time.monotonic()
 
-    filters = {"StudyDescription": description}
+    hit = _STUDY_CACHE.get(key)
+    if hit and now - hit[0] < _STUDY_CACHE_TTL:
+        log.debug("Using cached findscu result for %r", description)
+        return [dict(st) for st in hit[1]]
 
-    cmd = build_findscu(
-        container=dic.container,
-        bind=dic.bind,
-        server=dic.server,
-        port=dic.port,
-        tls=dic.tls,
-        username=dic.username,
-        password=dic.password,
-        query_tags=tags,
-        filters=filters,
-    )
+    cmd = _findscu_cmd(cfg, {"StudyDescription": description})
 
     log.debug("Running findscu: %s", " ".join(cmd))
     raw = run_findscu(cmd)
@@ -105,11 +128,21 @@ def fetch_studies(ctx: Context, description: str) -> List[Dict[str, str]]:
         log.error("No response from findscu")
         return []
 
-    return parse_studies_with_demographics(raw, tag_map)
+    studies = parse_studies_with_demographics(raw, cfg.dicom_tag_map)
+    if studies:
+        _STUDY_CACHE[key] = (now, [dict(st) for st in studies])
+    return studies
 
 
 def fetch_studies_by_uids(ctx: Context, uids: List[str]) -> List[Dict[str, str]]:
-    """Fetch studies individually by ``StudyInstanceUID``.
+    """Fetch studies by ``StudyInstanceUID``.
+
+    All UIDs are sent in a single C-FIND using DICOM *List of UID Matching*
+    (backslash-separated values), so the PACS association is set up once
+    rather than once per UID.  When that query yields nothing, e.g. because
+    the SCP does not support list matching, each UID is queried on its own;
+    those queries run concurrently, up to ``dicom.max_parallel`` at a time
+    (default 8).  Results keep the order of *uids*.
 
     The dcm4che C-FIND transaction typically emits two responses per UID
     (status ``ff00H`` followed by ``0H``). The duplicate guard collapses
@@ -123,39 +156,47 @@ def fetch_studies_by_uids(ctx: Context, uids: List[str]) -> List[Dict[str, str]]
         list[dict[str, str]]: Study dictionaries with duplicate UIDs removed.
     """
     cfg = ctx.obj
-    dic = cfg.dicom
-    tags = cfg.dicom_query_tags
     tag_map = cfg.dicom_tag_map
 
     studies: List[Dict[str, str]] = []
 
-    for uid in uids:
-        filters = {"StudyInstanceUID": uid}
-
-        cmd = build_findscu(
-            container=dic.container,
-            bind=dic.bind,
-            server=dic.server,
-            port=dic.port,
-            tls=dic.tls,
-            username=dic.username,
-            password=dic.password,
-            query_tags=tags,
-            filters=filters,
-        )
-
-        log.debug("Running findscu for UID %s: %s", uid, " ".join(cmd))
+    if len(uids) > 1:
+        cmd = _findscu_cmd(cfg, {"StudyInstanceUID": "\\".join(uids)})
+        log.debug("Running findscu for %d UIDs: %s", len(uids), " ".join(cmd))
         raw = run_findscu(cmd)
         if raw:
-            studies.extend(parse_studies_with_demographics(raw, tag_map))
-        else:
-            log.warning("No response for UID %s", uid)
+            studies = parse_studies_with_demographics(raw, tag_map)
+        if not studies:
+            log.debug("Batched UID query returned nothing; querying UIDs one by one")
+    batched = bool(studies)
+
+    if not batched and uids:
+        cmds = []
+        for uid in uids:
+            cmd = _findscu_cmd(cfg, {"StudyInstanceUID": uid})
+            log.debug("Running findscu for UID %s: %s", uid, " ".join(cmd))
+            cmds.append(cmd)
+
+        limit = getattr(cfg.dicom, "max_parallel", None) or _MAX_PARALLEL_QUERIES
+        with ThreadPoolExecutor(max_workers=min(int(limit), len(uids))) as ex:
+            results = list(ex.map(run_findscu, cmds))
+
+        for uid, raw in zip(uids, results):
+            if raw:
+                studies.extend(parse_studies_with_demographics(raw, tag_map))
+            else:
+                log.warning("No response for UID %s", uid)
 
     # Collapse duplicate UID entries (later entries overwrite earlier)
     dedup: Dict[str, Dict[str, str]] = {}
     for st in studies:
         dedup[st.get("study_uid")] = st
 
+    if batched:
+        for uid in uids:
+            if uid not in dedup:
+                log.warning("No response for UID %s", uid)
+
     return list(dedup.values())
 
 
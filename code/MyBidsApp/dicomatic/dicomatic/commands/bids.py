@@ -117,6 +117,13 @@ from dicomatic.utils.cli_parse import parse_session_flags
     default=None,
     help="Override YAML 'create_dicom_metadata' flag for this invocation.",
 )
+@click.option(
+    "--parallel-downloads",
+    "parallel_downloads",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Download up to N studies concurrently (overrides YAML 'dicom.parallel_downloads').",
+)
 def bids(  # noqa: D401, C901 – complexity handled in planner
     ctx: click.Context,
     desc: Optional[str],
@@ -136,6 +143,7 @@ def bids(  # noqa: D401, C901 – complexity handled in planner
     no_session_dirs: bool,
     download: bool,
     create_metadata: Optional[bool],
+    parallel_downloads: Optional[int],
 ) -> None:
     """Dispatch the ``bids`` workflow.
 
@@ -158,6 +166,7 @@ def bids(  # noqa: D401, C901 – complexity handled in planner
         no_session_dirs: Flatten archives when a subject has one session.
         download: Execute ``cfmm2tar`` downloads.
         create_metadata: Override the YAML ``create_dicom_metadata`` flag.
+        parallel_downloads: Number of studies to download concurrently.
 
     Returns:
         None
@@ -185,4 +194,5 @@ def bids(  # noqa: D401, C901 – complexity handled in planner
         no_session_dirs=no_session_dirs,
         download=download,
         create_metadata=create_metadata,
+        parallel_downloads=parallel_downloads,
     )
@@ -63,6 +63,13 @@ from dicomatic.utils.planning import build_plans
     default=None,
     help="Override YAML create_dicom_metadata flag for this invocation.",
 )
+@click.option(
+    "--max-parallel",
+    "max_parallel",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Run up to N per-UID PACS queries concurrently (overrides YAML 'dicom.max_parallel').",
+)
 def download(  # noqa: C901 – orchestration requires multiple branches
     ctx: click.Context,
     desc: Optional[str],
@@ -73,6 +80,7 @@ def download(  # noqa: C901 – orchestration requires multiple branches
     no_session_dirs: bool,
     dry_run: bool,
     create_metadata: Optional[bool],
+    max_parallel: Optional[int],
 ):
     """Download studies via ``cfmm2tar`` and optionally update metadata.
 
@@ -97,11 +105,15 @@ def download(  # noqa: C901 – orchestration requires multiple branches
             ``True``.
         dry_run: Skip Docker execution and print intended paths instead.
         create_metadata: Override the YAML ``create_dicom_metadata`` flag.
+        max_parallel: Concurrent per-UID queries; overrides
+            ``dicom.max_parallel``.
 
     Returns:
         None
     """
     cfg = ctx.obj
+    if max_parallel:
+        cfg.dicom.max_parallel = max_parallel
 
     # ------------------------------------------------------------------ #
     # 1. Resolve base output directory                                   #
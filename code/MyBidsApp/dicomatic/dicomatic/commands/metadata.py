@@ -58,6 +58,13 @@ from dicomatic.utils.project_root import find_bids_root
     envvar="DICOMATIC_CFMM2TAR_VERSION",
     help="Version string recorded under 'cfmm2tar_version'.",
 )
+@click.option(
+    "--max-parallel",
+    "max_parallel",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Run up to N per-UID PACS queries concurrently (overrides YAML 'dicom.max_parallel').",
+)
 @pass_context
 def metadata(
     ctx: click.Context,
@@ -69,6 +76,7 @@ def metadata(
     no_session_dirs: bool,
     metadata_file: str | None,
     cfmm2tar_version: str | None,
+    max_parallel: int | None,
 ):
     """Create or merge a DICOM metadata manifest.
 
@@ -89,11 +97,15 @@ def metadata(
         no_session_dirs: Set when archives were flattened.
         metadata_file: Custom path to the metadata JSON file.
         cfmm2tar_version: Version string stored under ``cfmm2tar_version``.
+        max_parallel: Concurrent per-UID queries; overrides
+            ``dicom.max_parallel``.
 
     Returns:
         None
     """
     cfg = ctx.obj
+    if max_parallel:
+        cfg.dicom.max_parallel = max_parallel
 
     # ------------------------------------------------------------------ #
     # 1. Build DownloadPlan objects                                      #
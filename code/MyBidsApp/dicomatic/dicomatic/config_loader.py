@@ -20,12 +20,20 @@ followed by interactive prompts later in the workflow.
 The module keeps the original public function ``load_config`` unchanged in
 signature and return type. Only comment style and credential discovery logic
 are updated.
+
+Parsed YAML is cached as a pickle under ``$XDG_CACHE_HOME/dicomatic/`` (by
+default ``~/.cache/dicomatic/``), keyed by the config file's path, mtime and
+size, so repeated CLI invocations skip parsing. Only the YAML document is
+cached; credentials from the secrets file are overlaid afterwards and never
+written to disk.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
+import pickle
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, Optional, Iterable
@@ -129,6 +137,55 @@ def _load_credentials() -> tuple[str | None, str | None]:
     return None, None
 
 
+def _cache_file(cfg_file: Path) -> Path:
+    """Return the pickle path caching the parsed contents of *cfg_file*."""
+    cache_root = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    digest = hashlib.sha1(str(cfg_file.resolve()).encode("utf-8")).hexdigest()
+    return Path(cache_root) / "dicomatic" / f"{digest}.pkl"
+
+
+def _read_yaml(cfg_file: Path) -> dict[str, Any]:
+    """Parse *cfg_file*, reusing the on-disk cache when it is still current.
+
+    Cache problems (unreadable, stale or unwritable files) are never fatal;
+    the YAML file is simply parsed again.
+
+    Args:
+        cfg_file: Existing YAML configuration file.
+
+    Returns:
+        Raw mapping as produced by the YAML parser.
+    """
+    st = cfg_file.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cache = _cache_file(cfg_file)
+
+    try:
+        with cache.open("rb") as fh:
+            cached_stamp, raw_cfg = pickle.load(fh)
+        if cached_stamp == stamp:
+            log.debug("Loaded cached configuration for %s", cfg_file)
+            return raw_cfg
+    except Exception:  # noqa: BLE001 – missing or corrupt cache → reparse
+        pass
+
+    # The safe loader yields plain containers and uses libyaml when available
+    yaml = YAML(typ="safe")
+    with cfg_file.open("r", encoding="utf-8") as stream:
+        raw_cfg = yaml.load(stream)
+
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache.with_suffix(f".{os.getpid()}.tmp")
+        with open(os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as fh:
+            pickle.dump((stamp, raw_cfg), fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache)
+    except OSError as exc:
+        log.debug("Could not cache configuration at %s: %s", cache, exc)
+
+    return raw_cfg
+
+
 # -----------------------------------------------------------------------------
 # Public API
 # -----------------------------------------------------------------------------
@@ -154,10 +211,8 @@ def load_config(config_path: Optional[str] = None) -> SimpleNamespace:
     if not cfg_file.is_file():
         raise FileNotFoundError(f"Configuration file not found at {cfg_file}")
 
-    # Parse YAML into a raw Python structure
-    yaml = YAML()
-    with cfg_file.open("r", encoding="utf-8") as stream:
-        raw_cfg: dict[str, Any] = yaml.load(stream)
+    # Parse YAML (or reuse the cached parse) into a raw Python structure
+    raw_cfg = _read_yaml(cfg_file)
 
     # Attempt to overlay credentials from secrets
     username, password = _load_credentials()
@@ -17,7 +17,7 @@ import subprocess
 import tempfile
 import warnings
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
 import click
 
@@ -121,6 +121,7 @@ def download_study(
     target_dir: Path,
     dry_run: bool = False,
     verbose: bool = False,
+    echo: Callable[[str], Any] = click.echo,
 ) -> bool:
     """Run a cfmm2tar Docker container to pull one study archive.
 
@@ -130,6 +131,8 @@ def download_study(
         target_dir: Directory that will receive the ``.tar`` archive.
         dry_run:    Skip execution; print the command only.
         verbose:    When ``True`` stream cfmm2tar stdout/stderr to console.
+        echo:       Sink for status lines; callers running several downloads
+                    at once pass a buffer to keep each study's lines together.
 
     Returns:
         ``True`` on success (or when skipping because the file exists);
@@ -146,7 +149,7 @@ def download_study(
         p.suffix == ".tar" and not p.name.endswith(".attached.tar")
         for p in target_dir.iterdir()
     ):
-        click.echo(f"[SKIP] {target_dir.name} (already downloaded)")
+        echo(f"[SKIP] {target_dir.name} (already downloaded)")
         return True
 
     # ------------------------------------------------------------------#
@@ -190,8 +193,8 @@ def download_study(
         "/data",
     ]
 
-    click.echo(f"> Running: {' '.join(cmd)}")
-    click.echo(f"> output directory → {target_dir}")
+    echo(f"> Running: {' '.join(cmd)}")
+    echo(f"> output directory → {target_dir}")
 
     # ------------------------------------------------------------------#
     # Execute (or dry-run)                                               #
@@ -203,11 +206,11 @@ def download_study(
 
     try:
         subprocess.run(cmd, check=True, capture_output=not verbose)
-        click.echo(f"[ Download Complete ] → {target_dir}")
+        echo(f"[ Download Complete ] → {target_dir}")
         ok = True
     except subprocess.CalledProcessError as exc:
         log.error("Download of %s failed: %s", uid, exc)
-        click.echo(f"[ERROR] Download failed for {uid}")
+        echo(f"[ERROR] Download failed for {uid}")
         ok = False
     finally:
         # Clean up temporary credentials file on disk
@@ -15,7 +15,7 @@ Any module that needs a list of download targets should call
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 import re
 
 from dicomatic.models import DownloadPlan
@@ -102,9 +102,11 @@ def build_plans(  # noqa: C901 – orchestration unavoidably “busy”
         and all("sub_label" in s and "ses_label" in s for s in studies)
     ):
         # Count sessions per subject to decide on directory flattening
+        sessions_by_sub: Dict[str, Set[str]] = {}
+        for st in studies:
+            sessions_by_sub.setdefault(st["sub_label"], set()).add(st["ses_label"])
         ses_count: Dict[str, int] = {
-            subj: len({st["ses_label"] for st in studies if st["sub_label"] == subj})
-            for subj in {st["sub_label"] for st in studies}
+            subj: len(sessions) for subj, sessions in sessions_by_sub.items()
         }
 
         for st in studies:
@@ -0,0 +1,84 @@
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+from dicomatic.bids import planner
+from dicomatic.models import DownloadPlan
+
+
+def _plan(tmp_path, sub, ses, uid):
+    return DownloadPlan(
+        study={"study_uid": uid},
+        path=Path(tmp_path) / sub / ses / f"{uid}.tar",
+        sub_label=sub,
+        ses_label=ses,
+    )
+
+
+def test_download_plans_keeps_shared_directories_in_order(tmp_path, monkeypatch):
+    plans = [
+        _plan(tmp_path, "sub-001", "ses-01", "a"),
+        _plan(tmp_path, "sub-002", "ses-01", "b"),
+        _plan(tmp_path, "sub-001", "ses-01", "c"),
+        _plan(tmp_path, "sub-003", "ses-01", "d"),
+    ]
+    calls = []
+    threads = {}
+
+    def fake_download(*, study, cfg, target_dir, dry_run, verbose, echo):
+        calls.append(study["study_uid"])
+        threads.setdefault(target_dir, set()).add(threading.get_ident())
+        return True
+
+    monkeypatch.setattr(planner, "download_study", fake_download)
+
+    planner._download_plans(plans, SimpleNamespace(verbose=False), workers=3)
+
+    assert sorted(calls) == ["a", "b", "c", "d"]
+    assert calls.index("a") < calls.index("c")
+    assert all(len(ids) == 1 for ids in threads.values())
+
+
+def test_download_plans_prints_each_parallel_plan_as_one_block(tmp_path, monkeypatch, capsys):
+    plans = [_plan(tmp_path, f"sub-00{i}", "ses-01", str(i)) for i in range(1, 5)]
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_download(*, study, echo, **_):
+        echo(f"> Running {study['study_uid']}")
+        barrier.wait()  # both workers are mid-download before either finishes
+        echo(f"[ Download Complete ] {study['study_uid']}")
+        return True
+
+    monkeypatch.setattr(planner, "download_study", fake_download)
+
+    planner._download_plans(plans, SimpleNamespace(), workers=2)
+
+    blocks = capsys.readouterr().out.strip().split("\n\n")
+    assert len(blocks) == 4
+    for block in blocks:
+        header, running, done = block.strip().splitlines()
+        uid = header.split("sub-00")[1][0]
+        assert running == f"> Running {uid}"
+        assert done == f"[ Download Complete ] {uid}"
+
+
+def test_download_plans_serial_by_default(tmp_path, monkeypatch):
+    plans = [_plan(tmp_path, f"sub-00{i}", "ses-01", str(i)) for i in range(1, 4)]
+    calls = []
+    monkeypatch.setattr(
+        planner,
+        "download_study",
+        lambda **kw: calls.append((kw["study"]["study_uid"], threading.get_ident())),
+    )
+
+    planner._download_plans(plans, SimpleNamespace())
+
+    assert [uid for uid, _ in calls] == ["1", "2", "3"]
+    assert {tid for _, tid in calls} == {threading.get_ident()}
+
+
+def test_package_binds_download_bids_on_first_access():
+    import dicomatic.bids as bids_pkg
+
+    assert bids_pkg.download_bids is planner.download_bids
+    assert bids_pkg.__dict__["download_bids"] is planner.download_bids
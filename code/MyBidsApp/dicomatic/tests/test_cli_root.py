@@ -55,3 +55,13 @@ def test_cli_option_merge(monkeypatch, tmp_path):
     assert cfg.dicom.tls == 'ssl'
     assert cfg.dicom.username == 'env_user'
     assert cfg.bids.root == str(tmp_path)
+
+
+def test_cli_resolves_subcommands_lazily():
+    assert cli.cli.list_commands(None) == ['bids', 'download', 'metadata', 'patients', 'query']
+
+    cmd = cli.cli.get_command(None, 'download')
+    from dicomatic.commands.download import download
+
+    assert cmd is download
+    assert cli.cli.get_command(None, 'missing') is None
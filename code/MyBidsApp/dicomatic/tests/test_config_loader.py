@@ -0,0 +1,61 @@
+from dicomatic import config_loader
+
+
+class CountingYAML:
+    loads = 0
+
+    def __init__(self, typ=None):
+        self.typ = typ
+
+    def load(self, stream):
+        CountingYAML.loads += 1
+        return {"dicom": {"server": stream.read().strip()}, "session_map": {"a": "01"}}
+
+
+def _setup(monkeypatch, tmp_path):
+    CountingYAML.loads = 0
+    monkeypatch.setattr(config_loader, "YAML", CountingYAML)
+    monkeypatch.setattr(config_loader, "_load_credentials", lambda: ("user", "secret"))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    cfg_file = tmp_path / "config.yaml"
+    cfg_file.write_text("AET@host")
+    return cfg_file
+
+
+def test_load_config_reuses_cached_parse(monkeypatch, tmp_path):
+    cfg_file = _setup(monkeypatch, tmp_path)
+
+    first = config_loader.load_config(str(cfg_file))
+    second = config_loader.load_config(str(cfg_file))
+
+    assert CountingYAML.loads == 1
+    assert second.dicom.server == first.dicom.server == "AET@host"
+    assert second.dicom.password == "secret"
+    assert second.session_map == {"a": "01"}
+
+    # Credentials are overlaid after caching and never reach the pickle
+    cache = config_loader._cache_file(cfg_file)
+    assert b"secret" not in cache.read_bytes()
+
+
+def test_load_config_reparses_modified_file(monkeypatch, tmp_path):
+    cfg_file = _setup(monkeypatch, tmp_path)
+
+    config_loader.load_config(str(cfg_file))
+    cfg_file.write_text("OTHER@host:11112")
+    cfg = config_loader.load_config(str(cfg_file))
+
+    assert CountingYAML.loads == 2
+    assert cfg.dicom.server == "OTHER@host:11112"
+
+
+def test_load_config_ignores_corrupt_cache(monkeypatch, tmp_path):
+    cfg_file = _setup(monkeypatch, tmp_path)
+    cache = config_loader._cache_file(cfg_file)
+    cache.parent.mkdir(parents=True)
+    cache.write_bytes(b"not a pickle")
+
+    cfg = config_loader.load_config(str(cfg_file))
+
+    assert cfg.dicom.server == "AET@host"
+    assert CountingYAML.loads == 1
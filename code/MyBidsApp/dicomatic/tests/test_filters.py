@@ -0,0 +1,103 @@
+from dicomatic.bids import filters
+
+
+def _grouped():
+    return {
+        "sub-001": {
+            "ses-01": [{"patient_name": "A", "study_uid": "1"}],
+            "ses-02": [{"patient_name": "A", "study_uid": "2"}],
+        },
+        "sub-002": {
+            "ses-01": [
+                {"patient_name": "B", "study_uid": "3"},
+                {"patient_name": "C", "study_uid": "4"},
+            ],
+        },
+    }
+
+
+def test_label_numbers():
+    assert filters._subject_number("sub-012") == 12
+    assert filters._session_number("ses-03") == 3
+    assert filters._session_number("ses-baseline") == 999_999
+
+
+def test_prune_subjects_sessions_patients_uids():
+    grouped = _grouped()
+    out = filters.prune_grouped_studies(
+        grouped,
+        exclude_subjects=["2"],
+        exclude_sessions=[("001", "1")],
+        exclude_patients=[],
+        exclude_uids=None,
+    )
+    assert out == {"sub-001": {"ses-02": [{"patient_name": "A", "study_uid": "2"}]}}
+    assert grouped == _grouped()
+
+    out = filters.prune_grouped_studies(
+        grouped,
+        exclude_subjects=[],
+        exclude_sessions=[],
+        exclude_patients=["B"],
+        exclude_uids=["1", "2"],
+    )
+    assert out == {"sub-002": {"ses-01": [{"patient_name": "C", "study_uid": "4"}]}}
+    assert grouped == _grouped()
+
+
+def test_filter_subjects_sessions_patients():
+    grouped = _grouped()
+    out = filters.filter_grouped_studies(
+        grouped,
+        include_subjects=["sub-1"],
+        include_sessions=[],
+        include_patients=[],
+    )
+    assert list(out) == ["sub-001"]
+
+    out = filters.filter_grouped_studies(
+        grouped,
+        include_subjects=[],
+        include_sessions=[(None, "1"), ("sub-001", "ses-02")],
+        include_patients=["A", "C"],
+    )
+    assert out == {
+        "sub-001": {
+            "ses-01": [{"patient_name": "A", "study_uid": "1"}],
+            "ses-02": [{"patient_name": "A", "study_uid": "2"}],
+        },
+        "sub-002": {"ses-01": [{"patient_name": "C", "study_uid": "4"}]},
+    }
+
+
+def test_numeric_session_grouping_relabels_in_order():
+    grouped = {"sub-001": {"ses-07": ["b"], "ses-03": ["a"]}}
+    assert filters.numeric_session_grouping(grouped) == {
+        "sub-001": {"ses-01": ["a"], "ses-02": ["b"]}
+    }
+
+
+def test_prune_copies_containers_not_studies():
+    grouped = _grouped()
+    out = filters.prune_grouped_studies(grouped, [], [], [], None)
+    assert out == grouped
+    assert out["sub-001"] is not grouped["sub-001"]
+    assert out["sub-001"]["ses-01"] is not grouped["sub-001"]["ses-01"]
+    assert out["sub-001"]["ses-01"][0] is grouped["sub-001"]["ses-01"][0]
+
+
+def test_numeric_session_grouping_reuses_well_labelled_subjects():
+    ordered = {"ses-01": ["a"], "ses-02": ["b"]}
+    shuffled = {"ses-02": ["b"], "ses-01": ["a"]}
+    out = filters.numeric_session_grouping({"sub-001": ordered, "sub-002": shuffled})
+    assert out["sub-001"] is ordered
+    assert out["sub-002"] is not shuffled
+    assert list(out["sub-002"]) == ["ses-01", "ses-02"]
+
+
+def test_filter_without_filters_keeps_non_empty_sessions():
+    grouped = _grouped()
+    grouped["sub-003"] = {"ses-01": []}
+    out = filters.filter_grouped_studies(grouped, [], [], [])
+    assert out == _grouped()
+    assert out is not grouped and out["sub-001"] is not grouped["sub-001"]
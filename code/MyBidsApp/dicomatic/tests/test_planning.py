@@ -35,3 +35,15 @@ def test_partial_subject_override(tmp_path):
     assert plan.sub_label == "sub-005"
     expected = tmp_path / "sub-005" / "ses-02" / build_bids_basename(study)
     assert plan.path == expected
+
+
+def test_stamped_labels_flatten_single_session_subjects(tmp_path):
+    one = dict(_dummy_study(), sub_label="sub-001", ses_label="ses-01")
+    two_a = dict(_dummy_study(), sub_label="sub-002", ses_label="ses-01", study_uid="2")
+    two_b = dict(_dummy_study(), sub_label="sub-002", ses_label="ses-02", study_uid="3")
+    plans = build_plans([one, two_a, two_b], bids_root=tmp_path, flatten=True)
+    assert [p.path.parent for p in plans] == [
+        tmp_path / "sub-001",
+        tmp_path / "sub-002" / "ses-01",
+        tmp_path / "sub-002" / "ses-02",
+    ]
@@ -47,3 +47,122 @@ def test_fetch_studies_interactive_ignores_click_sentinel(monkeypatch):
     assert desc == "valid"
     assert studies == [{"study_uid": "1"}]
     assert calls == ["valid"]
+
+
+def _uid_ctx():
+    ctx = click.Context(click.Command("dummy"))
+    ctx.obj = SimpleNamespace(
+        dicom=SimpleNamespace(
+            container="c", bind="b", server="s", port="1", tls="none",
+            username="u", password="p",
+        ),
+        dicom_query_tags=["StudyInstanceUID"],
+        dicom_tag_map={},
+    )
+    return ctx
+
+
+def _uid_filter(cmd):
+    return next(t for t in cmd if t.startswith("StudyInstanceUID="))
+
+
+def test_fetch_studies_by_uids_batches_into_one_query(monkeypatch):
+    calls = []
+    monkeypatch.setattr(_shared, "run_findscu", lambda cmd: calls.append(cmd) or "raw")
+    monkeypatch.setattr(
+        _shared,
+        "parse_studies_with_demographics",
+        lambda raw, tag_map: [{"study_uid": "1"}, {"study_uid": "2"}, {"study_uid": "1"}],
+    )
+
+    studies = _shared.fetch_studies_by_uids(_uid_ctx(), ["1", "2"])
+
+    assert len(calls) == 1
+    assert _uid_filter(calls[0]) == "StudyInstanceUID=1\\2"
+    assert studies == [{"study_uid": "1"}, {"study_uid": "2"}]
+
+
+def test_fetch_studies_by_uids_falls_back_to_single_queries(monkeypatch):
+    calls = []
+
+    def fake_run(cmd):
+        calls.append(_uid_filter(cmd))
+        return None if "\\" in calls[-1] else calls[-1]
+
+    monkeypatch.setattr(_shared, "run_findscu", fake_run)
+    monkeypatch.setattr(
+        _shared,
+        "parse_studies_with_demographics",
+        lambda raw, tag_map: [{"study_uid": raw.split("=", 1)[1]}],
+    )
+
+    studies = _shared.fetch_studies_by_uids(_uid_ctx(), ["1", "2"])
+
+    assert calls == ["StudyInstanceUID=1\\2", "StudyInstanceUID=1", "StudyInstanceUID=2"]
+    assert studies == [{"study_uid": "1"}, {"study_uid": "2"}]
+
+
+def test_fetch_studies_by_uids_fallback_runs_queries_concurrently(monkeypatch):
+    import threading
+
+    uids = ["1", "2", "3"]
+    barrier = threading.Barrier(len(uids), timeout=5)
+
+    def fake_run(cmd):
+        uid = _uid_filter(cmd).split("=", 1)[1]
+        if "\\" in uid:
+            return None
+        barrier.wait()  # only passes once every query is in flight
+        return uid
+
+    monkeypatch.setattr(_shared, "run_findscu", fake_run)
+    monkeypatch.setattr(
+        _shared,
+        "parse_studies_with_demographics",
+        lambda raw, tag_map: [{"study_uid": raw}],
+    )
+
+    studies = _shared.fetch_studies_by_uids(_uid_ctx(), uids)
+
+    assert [s["study_uid"] for s in studies] == uids
+
+
+def test_fetch_studies_by_uids_honours_max_parallel(monkeypatch):
+    ctx = _uid_ctx()
+    ctx.obj.dicom.max_parallel = 2
+    workers = []
+    real_pool = _shared.ThreadPoolExecutor
+
+    def recording_pool(max_workers):
+        workers.append(max_workers)
+        return real_pool(max_workers=max_workers)
+
+    monkeypatch.setattr(_shared, "ThreadPoolExecutor", recording_pool)
+    monkeypatch.setattr(_shared, "run_findscu", lambda cmd: None)
+
+    assert _shared.fetch_studies_by_uids(ctx, ["1", "2", "3"]) == []
+    assert workers == [2]
+
+
+def test_fetch_studies_reuses_recent_results(monkeypatch):
+    calls = []
+    clock = [100.0]
+    monkeypatch.setattr(_shared, "_STUDY_CACHE", {})
+    monkeypatch.setattr(_shared.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(_shared, "run_findscu", lambda cmd: calls.append(cmd) or "raw")
+    monkeypatch.setattr(
+        _shared,
+        "parse_studies_with_demographics",
+        lambda raw, tag_map: [{"study_uid": "1"}],
+    )
+
+    first = _shared.fetch_studies(_uid_ctx(), "DESC")
+    first[0]["sub"] = "mutated"
+    second = _shared.fetch_studies(_uid_ctx(), "DESC")
+
+    assert len(calls) == 1
+    assert second == [{"study_uid": "1"}]
+
+    clock[0] += _shared._STUDY_CACHE_TTL
+    _shared.fetch_studies(_uid_ctx(), "DESC")
+    assert len(calls) == 2